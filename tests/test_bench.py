@@ -0,0 +1,72 @@
+import sys
+sys.path.insert(0,'../')
+import pprint
+
+from ttr.bench import pipeline
+from ttr.bench.datasets import make_items
+
+
+def test_bench_make_items():
+    items = list(make_items(devices=3, rows=2, templates=2))
+    assert len(items) == 6
+    assert items[0]["template:a"] == "bench_0; bench_1"
+    assert items[-1]["device:b"] == "device-0"
+
+# test_bench_make_items()
+
+
+def test_bench_pipeline_all_formats():
+    reports = pipeline.run(devices=3, rows=2, templates=2)
+    # pprint.pprint(reports)
+    assert [r["format"] for r in reports] == ["xlsx", "csv", "yaml"]
+    for report in reports:
+        assert report["items_loaded"] == 6
+        assert report["items_processed"] == 24
+        assert report["results"] == 3
+        assert list(report["stages"]) == ["load_data", "process_data", "validate_data", "render", "run_returner"]
+
+# test_bench_pipeline_all_formats()
+
+
+def test_bench_processors_linear():
+    from ttr.bench import processors
+    reports = processors.run(sizes=[100, 1000], templates=2)
+    # pprint.pprint(reports)
+    assert [(r["mode"], r["rows"]) for r in reports] == [
+        ("pipeline", 100), ("lists", 100), ("pipeline", 1000), ("lists", 1000)
+    ]
+    assert [r["items"] for r in reports] == [400, 400, 4000, 4000]
+
+# test_bench_processors_linear()
+
+
+def test_bench_validation():
+    from ttr.bench import validation
+    reports = validation.run(items=200)
+    # pprint.pprint(reports)
+    assert [r["validator"] for r in reports] == ["yangson", "yangson_compiled", "jsonschema"]
+    # all validators must agree on equivalent models
+    assert [r["invalid"] for r in reports] == [2, 2, 2]
+
+# test_bench_validation()
+
+
+def test_bench_xlsx_backends():
+    from ttr.bench import xlsx
+    reports = xlsx.run(rows=300)
+    # pprint.pprint(reports)
+    assert [(r["backend"], r["rows"]) for r in reports] == [("openpyxl", 300), ("stdlib", 300)]
+    assert reports[1]["identical"] is True
+
+# test_bench_xlsx_backends()
+
+
+def test_bench_yaml_loader_modes():
+    from ttr.bench import yaml_loader
+    reports = yaml_loader.run(size=0.05)
+    # pprint.pprint(reports)
+    assert [r["mode"] for r in reports] == ["safe_load", "load", "load_iter"]
+    assert reports[0]["items"] > 0
+    assert all(r["items"] == reports[0]["items"] and r["identical"] for r in reports[1:])
+
+# test_bench_yaml_loader_modes()
@@ -1,6 +1,8 @@
 import sys
 sys.path.insert(0,'../')
 import pprint
+import os
+import pytest
 
 from ttr import ttr
 
@@ -333,4 +335,502 @@ def test_openpyxl_data_plugin_with_multitemplate_processor_empty_header_cell():
                                        'interface Eth2\n'
                                        '  ip address 10.0.1.2 '}
                                                                        
-# test_openpyxl_data_plugin_with_multitemplate_processor_empty_header_cell()
\ No newline at end of file
+# test_openpyxl_data_plugin_with_multitemplate_processor_empty_header_cell()
+
+def test_compact_rows_data_loaded():
+    import pickle
+    from ttr.utils.compact_rows import Row
+    generator = ttr("./mock_data/table_data_1.xlsx")
+    row = generator.data_loaded[0]
+    assert isinstance(row, Row)
+    assert row == {'device': 'r1', 'hostname': 'r1', 'lo0_ip': '1.1.1.1', 'template': 'foo'}
+    assert row.get("foo", "bar") == "bar"
+    assert pickle.loads(pickle.dumps(row)) == row
+    # rows of the same tab share schema
+    assert row._schema is generator.data_loaded[1]._schema
+    # modification does not affect other rows
+    row_copy = row.copy()
+    row_copy["device"] = "r11"
+    assert row_copy.pop("hostname") == "r1"
+    assert row_copy == {'device': 'r11', 'lo0_ip': '1.1.1.1', 'template': 'foo'}
+    assert row == {'device': 'r1', 'hostname': 'r1', 'lo0_ip': '1.1.1.1', 'template': 'foo'}
+
+# test_compact_rows_data_loaded()
+
+
+def test_csv_data_plugin_rows_length_mismatch():
+    data = "device,template,ip\nr1,foo\nr2,bar,1.1.1.1,extra\n\nr3,foobar,3.3.3.3\n"
+    with open("./Output/test_csv_data_plugin_rows_length_mismatch.csv", "w") as f:
+        f.write(data)
+    generator = ttr(
+        "./Output/test_csv_data_plugin_rows_length_mismatch.csv",
+        data_plugin_kwargs={"restkey": "rest", "restval": "N/A"}
+    )
+    assert generator.data_loaded == [
+        {'device': 'r1', 'template': 'foo', 'ip': 'N/A'},
+        {'device': 'r2', 'template': 'bar', 'ip': '1.1.1.1', 'rest': ['extra']},
+        {'device': 'r3', 'template': 'foobar', 'ip': '3.3.3.3'},
+    ]
+    os.remove("./Output/test_csv_data_plugin_rows_length_mismatch.csv")
+
+# test_csv_data_plugin_rows_length_mismatch()
+
+
+def test_processors_pipeline_with_list_processor():
+    from ttr.plugins.processors import processors_plugins
+
+    def add_key(data, **kwargs):
+        assert isinstance(data, list)
+        return [dict(item, extra="value") for item in data]
+
+    processors_plugins["test_add_key"] = add_key
+    try:
+        generator = ttr(
+            "./mock_data/table_multiple_templates.xlsx",
+            processors=["multitemplate", "test_add_key", "filtering"],
+            processors_kwargs={"filters": ["r1"]},
+        )
+    finally:
+        del processors_plugins["test_add_key"]
+    assert len(generator.data_loaded) == 4
+    assert all(i["device"] == "r1" and i["extra"] == "value" for i in generator.data_loaded)
+    assert generator.stats["stages"]["processor:test_add_key"]["items"] == 8
+    assert generator.stats["stages"]["processor:filtering"]["items"] == 4
+
+# test_processors_pipeline_with_list_processor()
+
+
+def test_xlsx_data_plugin_stdlib_backend():
+    import datetime
+    import glob
+    from openpyxl import Workbook
+    from ttr.plugins.data import data_plugins
+
+    # stdlib backend must produce identical output to openpyxl backend
+    files = sorted(glob.glob("./mock_data/*.xlsx"))
+    wb = Workbook()
+    sheet = wb.active
+    sheet.title = "data"
+    sheet.append(["device", "template", "date", "time", "bool", "float", "int", "formula"])
+    sheet.append(["r1", "foo", datetime.datetime(2024, 1, 2, 3, 4, 5), datetime.time(1, 2, 3), True, 1.5, 10**12, "=1+1"])
+    sheet.append([])
+    sheet.append(["r2", "foo", datetime.date(2020, 5, 1), datetime.timedelta(hours=30), False, -0.25, -3, None])
+    sheet["J7"] = "far away cell"
+    wb.save("./Output/test_xlsx_data_plugin_stdlib_backend.xlsx")
+    files.append("./Output/test_xlsx_data_plugin_stdlib_backend.xlsx")
+    # dates stored as ISO 8601 strings in t="d" cells
+    wb = Workbook()
+    wb.iso_dates = True
+    sheet = wb.active
+    sheet.title = "data"
+    sheet.append(["device", "template", "date"])
+    sheet.append(["r1", "foo", datetime.datetime(2024, 1, 2, 3, 4, 5, 123000)])
+    sheet.append(["r2", "foo", datetime.datetime(2024, 1, 2, 3, 4, 5)])
+    sheet.append(["r3", "foo", datetime.date(2020, 5, 1)])
+    sheet.append(["r4", "foo", datetime.time(1, 2, 3)])
+    wb.save("./Output/test_xlsx_data_plugin_stdlib_backend_iso.xlsx")
+    files.append("./Output/test_xlsx_data_plugin_stdlib_backend_iso.xlsx")
+    for path in files:
+        openpyxl_templates, stdlib_templates = {}, {}
+        openpyxl_data = data_plugins["xlsx"](path, openpyxl_templates, "template")
+        stdlib_data = data_plugins["xlsx"](path, stdlib_templates, "template", backend="stdlib")
+        assert [list(i.items()) for i in stdlib_data] == [list(i.items()) for i in openpyxl_data], path
+        assert [[type(v) for v in i.values()] for i in stdlib_data] == [
+            [type(v) for v in i.values()] for i in openpyxl_data
+        ], path
+        assert stdlib_templates == openpyxl_templates, path
+    os.remove("./Output/test_xlsx_data_plugin_stdlib_backend.xlsx")
+    os.remove("./Output/test_xlsx_data_plugin_stdlib_backend_iso.xlsx")
+    # backend selected using data_plugin_kwargs
+    generator = ttr(
+        "./mock_data/table_multiple_templates.xlsx",
+        processors=["multitemplate"],
+        data_plugin_kwargs={"backend": "stdlib"},
+    )
+    generator.run()
+    expected = ttr("./mock_data/table_multiple_templates.xlsx", processors=["multitemplate"])
+    expected.run()
+    assert generator.results == expected.results and len(generator.results) == 2
+    # parts that declare document type, hence can declare entities, rejected
+    import zipfile
+    from ttr.utils.xlsx_reader import load_workbook
+
+    path = "./Output/test_xlsx_data_plugin_stdlib_backend_dtd.xlsx"
+    with zipfile.ZipFile("./mock_data/table_multiple_templates.xlsx") as source:
+        with zipfile.ZipFile(path, "w") as target:
+            for name in source.namelist():
+                content = source.read(name)
+                if name == "xl/workbook.xml":
+                    content = content.replace(
+                        b"?>", b'?><!DOCTYPE lol [<!ENTITY lol "lol">]>', 1
+                    )
+                target.writestr(name, content)
+    with pytest.raises(ValueError, match="declares document type"):
+        load_workbook(path)
+    os.remove(path)
+
+# test_xlsx_data_plugin_stdlib_backend()
+
+def test_xlsx_data_plugin_snapshot_cache():
+    from openpyxl import Workbook
+    from ttr.plugins.data import data_plugins
+
+    def make_workbook(vid):
+        wb = Workbook()
+        wb.active.title = "tab1"
+        wb["tab1"].append(["device", "interface", "vid", "template"])
+        wb["tab1"].append(["r1", "Gi1", 10, "interface"])
+        wb.create_sheet("tab2").append(["device", "interface", "vid", "template"])
+        wb["tab2"].append(["r2", "Gi2", vid, "interface"])
+        wb.create_sheet("#tab3").append(["device", "template"])
+        wb.create_sheet("no_headers").append([None, None])
+        wb.create_sheet("templates").append(["template:interface"])
+        wb["templates"].append(["interface {{ interface }}"])
+        wb["templates"].append([" vlan {{ vid }}"])
+        wb.save("./Output/test_xlsx_data_plugin_snapshot_cache.xlsx")
+
+    path = "./Output/test_xlsx_data_plugin_snapshot_cache.xlsx"
+    cache_file = "./Output/test_xlsx_data_plugin_snapshot_cache.sqlite"
+    if os.path.exists(cache_file):
+        os.remove(cache_file)
+    make_workbook(20)
+    expected_templates = {}
+    expected = [dict(i) for i in data_plugins["xlsx"](path, expected_templates, "template")]
+    # first run parses all sheets, second run loads them from snapshots
+    for expected_stats in [{"hits": 0, "misses": 4}, {"hits": 4, "misses": 0}]:
+        stats, templates = {}, {}
+        data = data_plugins["xlsx"](
+            path, templates, "template", snapshot_cache=cache_file, stats=stats
+        )
+        assert stats == expected_stats
+        assert [dict(i) for i in data] == expected
+        assert templates == expected_templates
+    # modifying one tab only invalidates that tab snapshot
+    make_workbook(30)
+    stats = {}
+    data = data_plugins["xlsx"](path, {}, "template", snapshot_cache=cache_file, stats=stats)
+    assert stats == {"hits": 3, "misses": 1}
+    assert [dict(i) for i in data] == [
+        {"device": "r1", "interface": "Gi1", "vid": 10, "template": "interface"},
+        {"device": "r2", "interface": "Gi2", "vid": 30, "template": "interface"},
+    ]
+    # snapshot cache stats collected by ttr object
+    generator = ttr(path, data_plugin_kwargs={"snapshot_cache": cache_file})
+    generator.run()
+    assert generator.stats["snapshot_cache"] == {"hits": 4, "misses": 0}
+    assert generator.results["r2"] == "interface Gi2\n vlan 30"
+    # snapshots parsed with other backend or openpyxl arguments not reused
+    for kwargs in [{"backend": "stdlib"}, {"data_only": False}]:
+        for expected_stats in [{"hits": 0, "misses": 4}, {"hits": 4, "misses": 0}]:
+            stats = {}
+            data = data_plugins["xlsx"](
+                path, {}, "template", snapshot_cache=cache_file, stats=stats, **kwargs
+            )
+            assert stats == expected_stats, kwargs
+            assert len(data) == 2
+    os.remove(path)
+    os.remove(cache_file)
+
+# test_xlsx_data_plugin_snapshot_cache()
+
+def test_xlsx_data_plugin_parallel_workers(caplog):
+    import glob
+    from openpyxl import Workbook
+    from ttr.plugins.data import data_plugins
+
+    # workbook with sheets big enough to be read by workers in several chunks
+    wb = Workbook(write_only=True)
+    for tab in range(3):
+        sheet = wb.create_sheet("tab{}".format(tab))
+        sheet.append(["device", "interface", "vid", "template"])
+        for i in range(2000):
+            sheet.append(["r{}".format(i // 50), "Gi{}/{}".format(tab, i), i, "interface"])
+    wb.save("./Output/test_xlsx_data_plugin_parallel_workers.xlsx")
+    files = sorted(glob.glob("./mock_data/*.xlsx"))
+    files.append("./Output/test_xlsx_data_plugin_parallel_workers.xlsx")
+    # parallel loading must produce identical output in the same sheets order
+    for path in files:
+        for backend in ["openpyxl", "stdlib"]:
+            serial_templates, parallel_templates = {}, {}
+            serial = data_plugins["xlsx"](path, serial_templates, "template", backend=backend)
+            parallel = data_plugins["xlsx"](
+                path, parallel_templates, "template", backend=backend, workers=2
+            )
+            assert [list(i.items()) for i in parallel] == [list(i.items()) for i in serial], path
+            assert parallel_templates == serial_templates, path
+    # sheets must be parsed by workers, not one by one after workers failure
+    assert "failed to parse tabs in parallel" not in caplog.text
+    os.remove("./Output/test_xlsx_data_plugin_parallel_workers.xlsx")
+    # workers combined with snapshot cache and ttr object
+    cache_file = "./Output/test_xlsx_data_plugin_parallel_workers.sqlite"
+    if os.path.exists(cache_file):
+        os.remove(cache_file)
+    expected = ttr("./mock_data/table_multitab_inline_templates_data_3.xlsx")
+    expected.run()
+    for _ in range(2):
+        generator = ttr(
+            "./mock_data/table_multitab_inline_templates_data_3.xlsx",
+            data_plugin_kwargs={"workers": 2, "snapshot_cache": cache_file},
+        )
+        generator.run()
+        assert generator.results == expected.results and expected.results
+    assert generator.stats["snapshot_cache"]["misses"] == 0
+    os.remove(cache_file)
+
+# test_xlsx_data_plugin_parallel_workers(caplog)
+
+def test_data_plugins_filters_and_columns_pushdown():
+    import glob
+    from fnmatch import fnmatchcase
+    from ttr.plugins.data import data_plugins
+
+    filters = ["core1", "r[12]", "rt1", "sw*"]
+    processors = ["multitemplate", "filtering", "templates_split"]
+    # filtering results stay the same, while less data items loaded
+    for path in sorted(glob.glob("./mock_data/*.xlsx")) + ["./mock_data/csv_data_1.csv"]:
+        full = ttr(path, processors=processors)
+        filtered = ttr(path, processors=processors, processors_kwargs={"filters": filters})
+        expected = [
+            dict(i)
+            for i in full.data_loaded
+            if isinstance(i.get("device"), str)
+            and any(fnmatchcase(i["device"], f) for f in filters)
+        ]
+        assert [dict(i) for i in filtered.data_loaded] == expected, path
+        loaded = filtered.stats["stages"]["data_plugin:{}".format(path.split(".")[-1])]
+        assert loaded["items"] <= full.stats["stages"]["data_plugin:{}".format(path.split(".")[-1])]["items"]
+    assert loaded["items"] == 2
+    # filters not pushed down if processor before filtering can change data
+    generator = ttr(
+        "./mock_data/csv_data_1.csv",
+        processors=["multitemplate", "filtering"],
+        processors_kwargs={"filters": ["r1"]},
+    )
+    assert generator._pushdown_filters() == ["r1"]
+    generator.processors = ["unknown", "filtering"]
+    assert generator._pushdown_filters() is None
+    # columns projection
+    for path in ["./mock_data/csv_data_1.csv", "./mock_data/table_multiple_templates.xlsx"]:
+        data = data_plugins[path.split(".")[-1]](
+            path, {}, "template", result_name_key="device", columns=["ip"]
+        )
+        for item in data:
+            assert all(k.startswith(("device", "template", "ip")) for k in item), item
+        assert data and any(len(item) < 4 for item in data)
+    data = data_plugins["csv"](
+        "./mock_data/csv_data_1.csv",
+        {},
+        "template",
+        result_name_key="device",
+        filters=["r[13]"],
+        columns=["lo0_ip"],
+    )
+    assert [dict(i) for i in data] == [
+        {"device": "r1", "lo0_ip": "1.1.1.1", "template": "foo"},
+        {"device": "r3", "lo0_ip": "3.3.3.3", "template": "foobar"},
+    ]
+
+# test_data_plugins_filters_and_columns_pushdown()
+
+def test_csv_data_plugin_directory_text_and_types():
+    import shutil
+    from ttr.plugins.data import data_plugins, data_stream_plugins
+
+    # directory with several csv files loaded in files' names order
+    csv_dir = "./Output/test_csv_data_plugin_directory/"
+    shutil.rmtree(csv_dir, ignore_errors=True)
+    os.makedirs(csv_dir)
+    expected = []
+    for index, rows in enumerate([2500, 3, 1200]):
+        text = "device,template,vid\n" + "".join(
+            "r{}-{},foo,{}\n".format(index, i, i) for i in range(rows)
+        )
+        with open(os.path.join(csv_dir, "file_{}.csv".format(index)), "w") as f:
+            f.write(text)
+        # the same data loaded from text
+        expected.extend(dict(i) for i in data_plugins["csv"](text, types={"vid": "int"}))
+    with open(os.path.join(csv_dir, "not_csv.txt"), "w") as f:
+        f.write("device,template\nr9,foo\n")
+    data = data_plugins["csv"](csv_dir, types={"vid": "int"}, workers=2)
+    assert [dict(i) for i in data] == expected
+    assert len(expected) == 3703 and expected[0] == {"device": "r0-0", "template": "foo", "vid": 0}
+    # abandoning stream stops reading threads
+    items = data_stream_plugins["csv"](csv_dir, workers=2)
+    assert next(items)["device"] == "r0-0"
+    items.close()
+    # streaming rendering loads directory items one by one
+    generator = ttr(templates_dict={"foo": "vlan {{ vid }}"}, data_plugin="csv")
+    results = dict(generator.run_iter(data=csv_dir))
+    assert results["r2-1199"] == "vlan 1199" and len(results) == 3703
+    assert generator.stats["stages"]["data_plugin:csv"]["items"] == 3703
+    shutil.rmtree(csv_dir)
+    # types coercion, failed and empty values left as is
+    data = data_plugins["csv"](
+        "device,template,vid,enabled,mtu\nr1,foo,10,yes,1.5\nr2,foo,abc,false,\n",
+        types={"vid": "int", "enabled": "bool", "mtu": float, "missing": "int"},
+    )
+    assert [dict(i) for i in data] == [
+        {"device": "r1", "template": "foo", "vid": 10, "enabled": True, "mtu": 1.5},
+        {"device": "r2", "template": "foo", "vid": "abc", "enabled": False, "mtu": ""},
+    ]
+
+# test_csv_data_plugin_directory_text_and_types()
+
+def test_yaml_data_plugin_multiple_documents():
+    import yaml
+    from ttr.plugins.data import data_plugins, data_stream_plugins
+
+    data = """device: r1
+template: interface
+interface: Gi1
+---
+- device: r2
+  template: interface
+  interface: Gi2
+- device: r2
+  template: interface
+  interface: Gi3
+---
+"""
+    expected = [
+        {"device": "r1", "template": "interface", "interface": "Gi1"},
+        {"device": "r2", "template": "interface", "interface": "Gi2"},
+        {"device": "r2", "template": "interface", "interface": "Gi3"},
+    ]
+    with open("./Output/test_yaml_data_plugin_multiple_documents.yaml", "w") as f:
+        f.write(data)
+    for source in [data, "./Output/test_yaml_data_plugin_multiple_documents.yaml"]:
+        assert data_plugins["yaml"](source) == expected
+        assert list(data_stream_plugins["yaml"](source)) == expected
+        # pure Python loader produces the same results
+        assert data_plugins["yaml"](source, loader=yaml.SafeLoader) == expected
+    # streaming rendering
+    generator = ttr(templates_dict={"interface": "interface {{ interface }}"})
+    results = list(generator.run_iter(data="./Output/test_yaml_data_plugin_multiple_documents.yaml"))
+    assert results == [("r1", "interface Gi1"), ("r2", "interface Gi2\ninterface Gi3")]
+    os.remove("./Output/test_yaml_data_plugin_multiple_documents.yaml")
+    # text that starts with existing file path loaded as text
+    assert data_plugins["yaml"]("./mock_data/yaml_data_1.yaml\n") == ["./mock_data/yaml_data_1.yaml"]
+
+# test_yaml_data_plugin_multiple_documents()
+
+def test_jsonl_data_plugin():
+    import gzip
+    import json
+    from ttr.plugins.data import data_plugins
+
+    items = [
+        {"device": "r1", "template": "interface", "interface": "Gi1", "vid": 10},
+        {"device": "r2", "template": "interface", "interface": "Gi2", "vid": None},
+        {"device": "r2", "template": "interface", "interface": "Gi3", "vid": 30},
+    ]
+    text = "{}\n\n{}\n".format(json.dumps(items[0]), json.dumps(items[1:]))
+    files = {
+        "./Output/test_jsonl_data_plugin.jsonl": text.encode("utf-8"),
+        "./Output/test_jsonl_data_plugin.jsonl.gz": gzip.compress(text.encode("utf-8")),
+        "./Output/test_jsonl_data_plugin.json": json.dumps(items, indent=2).encode("utf-8"),
+    }
+    for path, content in files.items():
+        with open(path, "wb") as f:
+            f.write(content)
+        # plugin selected by file extension
+        generator = ttr(path, templates_dict={"interface": "interface {{ interface }}"})
+        assert generator.data_loaded == items, path
+        generator.run()
+        assert generator.results == {"r1": "interface Gi1", "r2": "interface Gi2\ninterface Gi3"}
+        # streaming rendering
+        generator = ttr(templates_dict={"interface": "interface {{ interface }}"})
+        assert dict(generator.run_iter(data=path)) == {"r1": "interface Gi1", "r2": "interface Gi2\ninterface Gi3"}
+        os.remove(path)
+    # load from text, invalid lines skipped
+    assert data_plugins["jsonl"](text + "{invalid\n") == items
+    # first line is a list of items
+    assert data_plugins["jsonl"]('[{"device": "a"}]\n{"device": "c"}\n') == [{"device": "a"}, {"device": "c"}]
+    # JSON file with single object or with JSON Lines content
+    files = {
+        "./Output/test_jsonl_data_plugin_object.json": json.dumps(items[0], indent=2),
+        "./Output/test_jsonl_data_plugin_lines.json": text,
+    }
+    for path, content in files.items():
+        with open(path, "w") as f:
+            f.write(content)
+        assert data_plugins["json"](path) == (items if "lines" in path else items[:1])
+        os.remove(path)
+
+# test_jsonl_data_plugin()
+
+def test_sqlite_data_plugin():
+    import sqlite3
+    from fnmatch import fnmatchcase
+    from ttr.plugins.data import data_plugins
+    from ttr.plugins.data.sqlite_loader import to_glob
+
+    path = "./Output/test_sqlite_data_plugin.sqlite"
+    if os.path.exists(path):
+        os.remove(path)
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute("CREATE TABLE interfaces (device TEXT, interface TEXT, vid INTEGER, template TEXT)")
+        connection.executemany(
+            "INSERT INTO interfaces VALUES (?, ?, ?, ?)",
+            [("r{}".format(i % 5), "Gi{}".format(i), i, "interface") for i in range(2500)],
+        )
+        connection.execute("CREATE TABLE loopbacks (device TEXT, ip TEXT, template TEXT)")
+        connection.executemany(
+            "INSERT INTO loopbacks VALUES (?, ?, ?)",
+            [("r1", "1.1.1.1", "loopback"), (None, "2.2.2.2", "loopback")],
+        )
+        connection.execute("CREATE TABLE sites (name TEXT)")
+        connection.execute("CREATE TABLE templates (name TEXT PRIMARY KEY, template TEXT)")
+        connection.executemany(
+            "INSERT INTO templates VALUES (?, ?)",
+            [("interface", "interface {{ interface }}"), ("loopback", "loopback {{ ip }}")],
+        )
+    connection.close()
+    # all tables loaded in creation order, templates loaded from templates table
+    templates = {}
+    data = data_plugins["sqlite"](path, templates, "template", batch_size=100)
+    assert len(data) == 2502
+    assert dict(data[0]) == {"device": "r0", "interface": "Gi0", "vid": 0, "template": "interface"}
+    assert dict(data[-1]) == {"device": None, "ip": "2.2.2.2", "template": "loopback"}
+    assert templates == {"interface": "interface {{ interface }}", "loopback": "loopback {{ ip }}"}
+    # table, query and columns
+    data = data_plugins["sqlite"](
+        path, {}, "template", query="SELECT * FROM interfaces WHERE vid < ?", params=[3], columns=["vid"],
+        result_name_key="device",
+    )
+    assert [dict(i) for i in data] == [
+        {"device": "r0", "vid": 0, "template": "interface"},
+        {"device": "r1", "vid": 1, "template": "interface"},
+        {"device": "r2", "vid": 2, "template": "interface"},
+    ]
+    assert len(data_plugins["sqlite"](path, {}, "template", table="loopbacks")) == 2
+    # filters translated to GLOB, rows with non text values kept for filtering processor
+    data = data_plugins["sqlite"](path, {}, "template", result_name_key="device", filters=["r[!0-2]"])
+    assert {i["device"] for i in data} == {"r3", "r4", None}
+    assert len(data) == 1001
+    for pattern in ["r*", "r?", "r[13]", "r[!1]", "*'x", "r[", "r[^1]", "[]]"]:
+        glob = to_glob(pattern)
+        if glob is None:
+            continue
+        con = sqlite3.connect(":memory:")
+        for value in ["r1", "r2", "r", "r13", "x'x", "r[", "]"]:
+            matched = con.execute("SELECT ? GLOB ?", (value, glob)).fetchone()[0]
+            assert bool(matched) == fnmatchcase(value, pattern), (pattern, value)
+        con.close()
+    # plugin selected by extension, filtering pushed down, templates from database
+    generator = ttr(path, processors=["filtering"], processors_kwargs={"filters": ["r1"]})
+    assert generator.stats["stages"]["data_plugin:sqlite"]["items"] == 502
+    generator.run()
+    assert list(generator.results) == ["r1"]
+    assert generator.results["r1"].endswith("interface Gi2496\nloopback 1.1.1.1")
+    # streaming rendering and templates argument pointing to database
+    generator = ttr(templates=path)
+    results = {}
+    for result_name, text in generator.run_iter(data=path):
+        results.setdefault(result_name, []).append(text)
+    assert "".join(results["r4"]).startswith("interface Gi4\ninterface Gi9")
+    assert "".join(results["r1"]).endswith("interface Gi2496\nloopback 1.1.1.1")
+    os.remove(path)
+
+# test_sqlite_data_plugin()
@@ -26,4 +26,70 @@ def test_yangson_loader_default_dir():
     assert "vrf" in gen.models_dict
     assert isinstance(gen.models_dict["vrf"].ascii_tree(), str)
     
-# test_yangson_loader_default_dir()
\ No newline at end of file
+# test_yangson_loader_default_dir()
+
+def test_yangson_loader_models_cache():
+    import os
+    import shutil
+    if os.path.exists("./Output/test_yangson_loader_models_cache/"):
+        shutil.rmtree("./Output/test_yangson_loader_models_cache/")
+    shutil.copytree("./Models/", "./Output/test_yangson_loader_models_cache/Models/")
+    models_dir = "./Output/test_yangson_loader_models_cache/Models/"
+    cache = "./Output/test_yangson_loader_models_cache/models.sqlite"
+    # first run populates cache
+    gen = ttr(models_dir=models_dir, models_cache=cache)
+    gen.load_models()
+    assert gen.stats["models_cache"] == {"hits": 0, "misses": 2}
+    # second run loads models from cache
+    gen = ttr(models_dir=models_dir, models_cache=cache)
+    gen.load_models()
+    assert gen.stats["models_cache"] == {"hits": 2, "misses": 0}
+    assert isinstance(gen.models_dict["interface"].ascii_tree(), str)
+    inst = gen.models_dict["interface"].from_raw({"interface:interface": "Gi1", "interface:template": "foo", "interface:device": "r1"})
+    inst.validate()
+    # changing model file invalidates cached model
+    with open(os.path.join(models_dir, "vrf", "vrf.yang"), "a") as f:
+        f.write("\n")
+    gen = ttr(models_dir=models_dir, models_cache=cache)
+    gen.load_models()
+    assert gen.stats["models_cache"] == {"hits": 1, "misses": 1}
+    shutil.rmtree("./Output/test_yangson_loader_models_cache/")
+
+# test_yangson_loader_models_cache()
+
+
+def test_yangson_loader_demand_driven():
+    data = """
+- interface: Gi1/1
+  device: R1
+  template: interfaces.cisco_ios
+  model: interface
+    """
+    gen = ttr(data=data, data_plugin="yaml")
+    assert list(gen.models_dict) == ["interface"]
+    assert gen.stats["stages"]["load_models"]["items"] == 1
+
+# test_yangson_loader_demand_driven()
+
+
+def test_yangson_loader_no_models_referenced():
+    import subprocess
+    code = (
+        "import sys; sys.path.insert(0, '../'); from ttr import ttr; "
+        "gen = ttr('./mock_data/csv_data_1.csv'); gen.run(); "
+        "print('yangson' in sys.modules, gen.models_dict)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert out.stdout.strip() == "False {}", out.stderr
+
+# test_yangson_loader_no_models_referenced()
+
+
+def test_yangson_loader_parallel():
+    gen = ttr()
+    gen.load_models(models=["interface", "vrf"], workers=2)
+    assert sorted(gen.models_dict) == ["interface", "vrf"]
+    inst = gen.models_dict["interface"].from_raw({"interface:interface": "Gi1", "interface:template": "foo", "interface:device": "r1"})
+    inst.validate()
+
+# test_yangson_loader_parallel()
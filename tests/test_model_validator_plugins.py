@@ -246,4 +246,308 @@ def test_ttr_yang_validate_excel_data():
        ' vrf bar\n'
        '!'}
 	   
-# test_ttr_yang_validate_excel_data()
\ No newline at end of file
+# test_ttr_yang_validate_excel_data()
+
+def test_yangson_validate_batch():
+    from ttr.plugins.validate.validate_yangson import validate, validate_batch
+    gen = ttr()
+    gen.load_models(models=["interface"])
+    model = gen.models_dict["interface"]
+    data = [
+        {"interface": "Gi1", "device": "R1", "template": "foo", "vid": 100},
+        {"interface": "Gi2", "template": "foo", "vid": 101},
+        {"interface": "Gi3", "device": "R1", "template": "foo", "vid": "abc"},
+        {"interface": "Gi4", "device": "R1", "template": "foo", "ip": "10.0.0.1"},
+        {"interface": "Gi5", "device": "R2", "template": "foo", "vid": 102},
+    ]
+    res = validate_batch(data, model, "interface", on_fail="log")
+    # pprint.pprint(res)
+    assert [(i[0], i[1]) for i in res] == [(0, True), (1, False), (2, False), (3, True), (4, True)]
+    assert "interface:device" in res[1][2]
+    # batch results must match per-item validation results
+    assert [i[1] for i in res] == [validate(i, model, "interface", on_fail="log") for i in data]
+    # on_fail raise stops on first failure, same as validate
+    with pytest.raises(RuntimeError, match="validation failed - ") as excinfo:
+        validate_batch(data, model, "interface")
+    assert "interface:device" in str(excinfo.value)
+    # falls back to per-item validation if Yangson internals not available
+    import ttr.plugins.validate.validate_yangson as validate_yangson
+    validate_yangson.HAS_INTERNALS = False
+    try:
+        assert validate_batch(data, model, "interface", on_fail="log") == res
+    finally:
+        validate_yangson.HAS_INTERNALS = True
+
+# test_yangson_validate_batch()
+
+
+def test_ttr_yang_validate_parallel():
+    data = [
+        {"interface": "Gi{}".format(i), "device": "R{}".format(i % 3), "template": "interfaces.cisco_ios",
+         "vid": i, "model": "interface"}
+        for i in range(20)
+    ] + [
+        {"vrf_name": "v{}".format(i), "vrf_rd": "1:{}".format(i), "device": "R1", "template": "vrf.cisco_ios",
+         "model": "vrf"}
+        for i in range(5)
+    ]
+    serial = ttr(validator_kwargs={"on_fail": "log"})
+    serial.validate_data([dict(i) for i in data])
+    gen = ttr(validator_kwargs={"workers": 2})
+    gen.validate_data([dict(i) for i in data])
+    assert gen.stats["stages"]["validate_data"]["items"] == 25
+    # failures from all workers collected before raising
+    data[3]["vid"] = "abc"
+    data[15].pop("device")
+    with pytest.raises(RuntimeError, match="failed for 2 of 25 items") as excinfo:
+        ttr(validator_kwargs={"workers": 2}).validate_data([dict(i) for i in data])
+    assert "item 3 " in str(excinfo.value) and "item 15 " in str(excinfo.value)
+    # on_fail log does not raise
+    ttr(validator_kwargs={"workers": 2, "on_fail": "log"}).validate_data([dict(i) for i in data])
+
+# test_ttr_yang_validate_parallel()
+
+
+def test_ttr_yang_validate_run_iter_chunks(tmp_path):
+    import yaml
+    from ttr.ttr import VALIDATION_CHUNK_SIZE
+
+    items = VALIDATION_CHUNK_SIZE * 2 + 10
+    data = [
+        {"interface": "Gi{}".format(i), "device": "R{}".format(i // 100), "template": "interfaces.cisco_ios",
+         "vid": i % 4000 + 1, "model": "interface"}
+        for i in range(items)
+    ]
+    path = str(tmp_path / "data.yaml")
+    with open(path, "w") as f:
+        yaml.safe_dump(data, f)
+    gen = ttr(validator_kwargs={"workers": 2})
+    results = {}
+    for result_name, text in gen.run_iter(data=path):
+        results.setdefault(result_name, []).append(text)
+    assert len(results) == items // 100 + 1
+    # streamed items validated in chunks, not one by one
+    assert gen.stats["stages"]["validate_data"]["calls"] == 3
+    assert gen.stats["stages"]["validate_data"]["items"] == items
+    # failures reported for the chunk failed item belongs to
+    data[VALIDATION_CHUNK_SIZE + 5]["vid"] = "abc"
+    with open(path, "w") as f:
+        yaml.safe_dump(data, f)
+    with pytest.raises(RuntimeError, match="failed for 1 of {} items".format(VALIDATION_CHUNK_SIZE)):
+        list(ttr(validator_kwargs={"workers": 2}).run_iter(data=path))
+
+# test_ttr_yang_validate_run_iter_chunks()
+
+
+def test_ttr_yang_validation_cache():
+    import os
+    import shutil
+    if os.path.exists("./Output/test_ttr_yang_validation_cache/"):
+        shutil.rmtree("./Output/test_ttr_yang_validation_cache/")
+    shutil.copytree("./Models/", "./Output/test_ttr_yang_validation_cache/Models/")
+    models_dir = "./Output/test_ttr_yang_validation_cache/Models/"
+    cache = "./Output/test_ttr_yang_validation_cache/validation.sqlite"
+    data = [
+        {"interface": "Gi{}".format(i), "device": "R1", "template": "interfaces.cisco_ios", "model": "interface"}
+        for i in range(10)
+    ]
+    # first run validates all items
+    with ttr(models_dir=models_dir, validation_cache=cache) as gen:
+        gen.validate_data([dict(i) for i in data])
+        assert gen.stats["validation_cache"] == {"hits": 0, "misses": 10}
+    # second run skips items that passed validation before
+    data[0]["vid"] = 100
+    data[1]["vid"] = "abc"
+    with ttr(models_dir=models_dir, validation_cache=cache, validator_kwargs={"on_fail": "log"}) as gen:
+        gen.validate_data([dict(i) for i in data])
+        assert gen.stats["validation_cache"] == {"hits": 8, "misses": 2}
+    # failed items not cached
+    with ttr(models_dir=models_dir, validation_cache=cache, validator_kwargs={"on_fail": "log"}) as gen:
+        gen.validate_data([dict(i) for i in data])
+        assert gen.stats["validation_cache"] == {"hits": 9, "misses": 1}
+    # changing model file invalidates cached results
+    with open(os.path.join(models_dir, "interface", "interface.yang"), "a") as f:
+        f.write("\n")
+    with ttr(models_dir=models_dir, validation_cache=cache, validator_kwargs={"on_fail": "log"}) as gen:
+        gen.validate_data([dict(i) for i in data])
+        assert gen.stats["validation_cache"] == {"hits": 0, "misses": 10}
+    shutil.rmtree("./Output/test_ttr_yang_validation_cache/")
+
+# test_ttr_yang_validation_cache()
+
+
+def test_yangson_compiled_differential():
+    """
+    compiled validator must produce the same results as yangson validator
+    """
+    import itertools
+    from ttr.plugins.validate import validate_yangson, validate_yangson_compiled
+    gen = ttr()
+    gen.load_models()
+    values = {
+        "interface": ["Gi1", 1, None],
+        "device": ["R1", True, ""],
+        "template": ["interfaces.cisco_ios", 1.5],
+        "vid": [100, "100", -2147483649, 2147483647, True, 1.0],
+        "ip": ["10.0.0.1", "10.0.0.256", "1.1.1", "10.0.0.1%eth0", 1],
+        "mask": ["255.255.255.0", "255.255.255", "255.255.255.0 "],
+        "vrf_name": ["cust_a", 1],
+        "vrf_rd": ["1:1"],
+        "unknown": ["foo"],
+    }
+    for model_name in ["interface", "vrf"]:
+        model = gen.models_dict[model_name]
+        checker, _ = validate_yangson_compiled.compile_model(model)
+        assert checker is not None
+        data = []
+        keys = list(values)
+        # items with all combinations of keys present and single value variations
+        for present in itertools.product([False, True], repeat=len(keys)):
+            base = {k: values[k][0] for k, p in zip(keys, present) if p}
+            data.append(base)
+            for key in base:
+                for value in values[key][1:]:
+                    data.append(dict(base, **{key: value}))
+        # keys prefixed with model name
+        data.append({"{}:{}".format(model_name, k): v for k, v in data[-1].items()})
+        expected = validate_yangson.validate_batch(data, model, model_name, on_fail=None)
+        compiled = validate_yangson_compiled.validate_batch(data, model, model_name, on_fail=None)
+        mismatches = [
+            (data[e[0]], e, c) for e, c in zip(expected, compiled) if e[1] != c[1]
+        ]
+        assert mismatches == []
+        assert any(e[1] for e in expected) and not all(e[1] for e in expected)
+
+# test_yangson_compiled_differential()
+
+
+def test_ttr_yangson_compiled_validator():
+    gen = ttr(data="./mock_data/table_data_2_with_models.xlsx", validator="yangson_compiled")
+    assert sorted(gen.models_dict) == ["interface", "vrf"]
+    assert gen.stats["stages"]["validate_data"]["items"] == 4
+    with pytest.raises(RuntimeError):
+        ttr(validator="yangson_compiled").validate_data(
+            [{"interface": "Gi1", "device": "R1", "template": "foo", "vid": "abc", "model": "interface"}]
+        )
+
+# test_ttr_yangson_compiled_validator()
+
+
+def test_ttr_jsonschema_validator():
+    gen = ttr(
+        data="./mock_data/table_data_2_with_models.xlsx",
+        validator="jsonschema",
+        models_dir="./Models_jsonschema/",
+    )
+    assert sorted(gen.models_dict) == ["interface", "vrf"]
+    assert gen.stats["stages"]["validate_data"]["items"] == 4
+    with pytest.raises(RuntimeError, match="#/vid: expected integer value"):
+        ttr(validator="jsonschema", models_dir="./Models_jsonschema/").validate_data(
+            [{"interface": "Gi1", "device": "R1", "template": "foo", "vid": "abc", "model": "interface"}]
+        )
+
+# test_ttr_jsonschema_validator()
+
+
+def test_jsonschema_validate_batch():
+    from ttr.plugins.validate.validate_jsonschema import compile_schema, validate, validate_batch
+    gen = ttr(validator="jsonschema", models_dir="./Models_jsonschema/")
+    gen.load_models(models=["interface"])
+    model = gen.models_dict["interface"]
+    data = [
+        {"interface": "Gi1", "device": "R1", "template": "foo", "vid": 100},
+        {"interface": "Gi2", "template": "foo", "vid": 101},
+        {"interface": "Gi3", "device": "R1", "template": "foo", "vid": True},
+        {"interface": "Gi4", "device": "R1", "template": "foo", "ip": "10.0.0.1", "mask": "255.255.255.0"},
+        {"interface": "Gi5", "device": "R1", "template": "foo", "ip": "10.0.0.256"},
+        {"interface": "Gi6", "device": "R1", "template": "foo", "mask": "255.255.255.x"},
+        {"interface": "Gi7", "device": "R1", "template": "foo", "unknown": 1},
+    ]
+    res = validate_batch(data, model, "interface", on_fail="log")
+    # pprint.pprint(res)
+    assert [i[1] for i in res] == [True, False, False, True, False, False, False]
+    assert res[1][2] == "#: missing required property 'device'"
+    assert [i[1] for i in res] == [validate(i, model, "interface", on_fail="log") for i in data]
+    with pytest.raises(RuntimeError, match="failed for 5 of 7 items"):
+        validate_batch(data, model, "interface")
+    # combinators and recursive references
+    tree = compile_schema({
+        "$defs": {
+            "node": {
+                "type": "object",
+                "properties": {
+                    "name": {"anyOf": [{"type": "string"}, {"type": "integer"}]},
+                    "kind": {"oneOf": [{"const": "leaf"}, {"enum": ["node", "root"]}]},
+                    "tags": {"type": "array", "items": {"not": {"type": "null"}}, "uniqueItems": True},
+                    "children": {"type": "array", "items": {"$ref": "#/$defs/node"}},
+                },
+                "required": ["name"],
+            }
+        },
+        "allOf": [{"$ref": "#/$defs/node"}, {"maxProperties": 3}],
+    })
+    assert tree({"name": "a", "children": [{"name": 1, "kind": "leaf"}]}) is None
+    assert tree({"name": "a", "children": [{"name": 1.5}]}) == "#/children/0/name: does not match any of anyOf schemas"
+    assert tree({"name": "a", "children": [{"kind": "leaf"}]}) == "#/children/0: missing required property 'name'"
+    assert tree({"name": "a", "kind": "x"}) is not None
+    assert tree({"name": "a", "tags": [1, 1]}) is not None
+    assert tree({"name": "a", "tags": [None]}) is not None
+    assert tree({"name": "a", "kind": "root", "tags": [], "children": []}) is not None
+    with pytest.raises(RuntimeError, match="unsupported keyword 'patternProperties'"):
+        compile_schema({"patternProperties": {}})
+    # keywords values never embedded in generated code as is
+    for schema in [{"maximum": "it's"}, {"minimum": "0'; import os; x='"}, {"minLength": 1.5}]:
+        with pytest.raises(RuntimeError, match="must be"):
+            compile_schema(schema)
+    number = compile_schema({"maximum": 5.5, "multipleOf": 0.5})
+    assert number(6) == "#: 6 violates maximum 5.5"
+    assert number(5.25) == "#: 5.25 violates multipleOf 0.5"
+    assert number(5) is None
+    # multipleOf tolerates float rounding errors
+    tenth = compile_schema({"multipleOf": 0.1})
+    assert tenth(0.3) is None and tenth(1e20) is None and tenth(float("inf")) is not None
+    assert tenth(0.35) == "#: 0.35 violates multipleOf 0.1"
+    assert compile_schema({"multipleOf": 3})(10 ** 20 + 1) is not None
+    # non-finite limits, e.g. loaded from JSON Infinity or NaN, rejected
+    for limit in [float("inf"), float("-inf"), float("nan")]:
+        with pytest.raises(RuntimeError, match="must be finite number"):
+            compile_schema({"minimum": limit})
+    # references to itself rejected instead of recursing forever
+    for schema in [
+        {"$ref": "#"},
+        {"$defs": {"a": {"$ref": "#/$defs/b"}, "b": {"$ref": "#/$defs/a"}}, "$ref": "#/$defs/a"},
+    ]:
+        with pytest.raises(RuntimeError, match="refers to itself"):
+            compile_schema(schema)
+
+# test_jsonschema_validate_batch()
+
+
+def test_ttr_jsonschema_validate_parallel_and_cache():
+    import os
+    import shutil
+    if os.path.exists("./Output/test_ttr_jsonschema_validation_cache/"):
+        shutil.rmtree("./Output/test_ttr_jsonschema_validation_cache/")
+    shutil.copytree("./Models_jsonschema/", "./Output/test_ttr_jsonschema_validation_cache/Models/")
+    models_dir = "./Output/test_ttr_jsonschema_validation_cache/Models/"
+    cache = "./Output/test_ttr_jsonschema_validation_cache/validation.sqlite"
+    data = [
+        {"interface": "Gi{}".format(i), "device": "R1", "template": "interfaces.cisco_ios", "model": "interface"}
+        for i in range(10)
+    ]
+    kwargs = dict(validator="jsonschema", models_dir=models_dir, validation_cache=cache)
+    with ttr(validator_kwargs={"workers": 2}, **kwargs) as gen:
+        gen.validate_data([dict(i) for i in data])
+        assert gen.stats["validation_cache"] == {"hits": 0, "misses": 10}
+    with ttr(**kwargs) as gen:
+        gen.validate_data([dict(i) for i in data])
+        assert gen.stats["validation_cache"] == {"hits": 10, "misses": 0}
+    # changing model file invalidates cached results
+    with open(os.path.join(models_dir, "interface.json"), "a") as f:
+        f.write("\n")
+    with ttr(**kwargs) as gen:
+        gen.validate_data([dict(i) for i in data])
+        assert gen.stats["validation_cache"] == {"hits": 0, "misses": 10}
+    shutil.rmtree("./Output/test_ttr_jsonschema_validation_cache/")
+
+# test_ttr_jsonschema_validate_parallel_and_cache()
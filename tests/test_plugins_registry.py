@@ -0,0 +1,58 @@
+import sys
+sys.path.insert(0,'../')
+import pprint
+import subprocess
+
+from ttr import ttr
+from ttr.plugins import LazyPluginsRegistry
+from ttr.plugins.data import data_plugins
+from ttr.plugins.templates import templates_loaders_plugins
+
+
+class FakeEntryPoint:
+    name = "fake"
+
+    def load(self):
+        return lambda data, **kwargs: [{"device": "r1", "template": "foo", "data": data}]
+
+
+def test_lazy_registry_no_heavy_imports():
+    process = subprocess.run(
+        [sys.executable, "-c", "import sys; sys.path.insert(0, '../'); from ttr import ttr; "
+         "print(sorted(m for m in ['openpyxl', 'yaml', 'jinja2', 'yangson'] if m in sys.modules))"],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert process.stdout.strip() == "[]"
+
+# test_lazy_registry_no_heavy_imports()
+
+
+def test_lazy_registry_lookup():
+    registry = LazyPluginsRegistry(
+        group="ttr.plugins.test",
+        plugins={"csv": ".csv_loader:load"},
+        package="ttr.plugins.data",
+    )
+    assert "csv" in registry
+    assert registry["csv"] is data_plugins["csv"]
+    assert "foo" not in registry
+
+# test_lazy_registry_lookup()
+
+
+def test_lazy_registry_entry_points_discovery(monkeypatch):
+    monkeypatch.setattr("ttr.plugins._get_entry_points", lambda group: [FakeEntryPoint()])
+    registry = LazyPluginsRegistry(group="ttr.plugins.data", plugins={}, package="ttr.plugins.data")
+    assert list(registry) == ["fake"]
+    assert registry["fake"]("foo") == [{"device": "r1", "template": "foo", "data": "foo"}]
+
+# test_lazy_registry_entry_points_discovery()
+
+
+def test_lazy_registry_dir_templates_loader():
+    templates_dict = {}
+    assert templates_loaders_plugins["dir"]("device_base", templates_dict, "./Templates/test_path/")
+    assert "device_base" in templates_dict
+
+# test_lazy_registry_dir_templates_loader()
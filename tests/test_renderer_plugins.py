@@ -1,6 +1,7 @@
 import sys
 sys.path.insert(0,'../')
 import pprint
+import os
 
 from ttr import ttr
 
@@ -12,4 +13,132 @@ def test_jinja2_render_csv_1():
                'r2': '',
                'r3': ''}
                
-# test_jinja2_render_csv_1()
\ No newline at end of file
+# test_jinja2_render_csv_1()
+
+def test_jinja2_render_iter_csv_1():
+    generator = ttr("./mock_data/csv_data_1.csv")
+    results = list(generator.run_iter())
+    assert results == [('r1', 'hostname r1\n!\ninterface loopback0\n  ip address 1.1.1.1/32'),
+                       ('r2', ''),
+                       ('r3', '')]
+    assert generator.results is None
+
+# test_jinja2_render_iter_csv_1()
+
+
+def test_jinja2_render_iter_data_streaming():
+    generator = ttr()
+    results = list(generator.run_iter(data="./mock_data/table_multitab_data_2.xlsx"))
+    assert generator.data_loaded == []
+    assert results == [('r1', 'hostname r1\n!\ninterface loopback0\n  ip address 1.1.1.1/32'),
+                       ('r2', 'hostname r2\n!\ninterface loopback0\n  ip address 2.2.2.2/32'),
+                       ('r1', '\ninterface 10.0.0.1/24\n  ip address Eth1/32\ninterface 10.0.1.1/24\n  ip address Eth2/32')]
+    # concatenated chunks must match run method results
+    joined = {}
+    for result_name, text in results:
+        joined[result_name] = joined.get(result_name, "") + text
+    assert joined == ttr("./mock_data/table_multitab_data_2.xlsx").run()
+
+# test_jinja2_render_iter_data_streaming()
+
+
+def test_jinja2_render_iter_xlsx_streamed_row_by_row(monkeypatch):
+    from ttr.plugins.data import xlsx_loader
+
+    def load(*args, **kwargs):
+        raise AssertionError("spreadsheet loaded as a whole")
+
+    # validate each row as soon as it is read
+    monkeypatch.setattr(sys.modules["ttr.ttr"], "VALIDATION_CHUNK_SIZE", 1)
+    original_load = xlsx_loader.load
+    xlsx_loader.load = load
+    try:
+        generator = ttr()
+        results = generator.run_iter(data="./mock_data/table_multitab_data_2.xlsx")
+        first = next(results)
+        # first result rendered before rows of other tabs read
+        assert "data_plugin:xlsx" not in generator.stats["stages"]
+        results = [first] + list(results)
+    finally:
+        xlsx_loader.load = original_load
+    stages = generator.stats["stages"]
+    assert stages["data_plugin:xlsx"]["items"] == 4
+    assert stages["renderer:jinja2"]["items"] == len(results) == 3
+    assert stages["returner:self"]["items"] == 3
+    assert stages["returner:self"]["bytes"] == stages["renderer:jinja2"]["bytes"] > 0
+
+# test_jinja2_render_iter_xlsx_streamed_row_by_row()
+
+
+def test_jinja2_render_iter_with_processors():
+    generator = ttr(processors=["multitemplate"])
+    results = dict(generator.run_iter(data="./mock_data/table_multiple_templates.xlsx"))
+    assert results["r2"].endswith('interface Eth2\n  ip address 10.0.1.2 24')
+    assert ttr("./mock_data/table_multiple_templates.xlsx", processors=["multitemplate"]).run()["r2"].endswith(results["r2"])
+
+# test_jinja2_render_iter_with_processors()
+
+
+def test_jinja2_render_parallel_workers():
+    serial = ttr("./mock_data/table_multiple_templates.xlsx", processors=["multitemplate"]).run()
+    generator = ttr(
+        "./mock_data/table_multiple_templates.xlsx",
+        processors=["multitemplate"],
+        renderer_kwargs={"workers": 2}
+    )
+    parallel = generator.run()
+    assert parallel == serial
+    assert list(parallel.keys()) == list(serial.keys())
+    # renderer_kwargs must not be modified, making subsequent runs parallel too
+    assert generator.renderer_kwargs == {"workers": 2}
+
+# test_jinja2_render_parallel_workers()
+
+
+def test_jinja2_render_parallel_workers_missing_template():
+    serial = ttr("./mock_data/csv_data_1.csv").run()
+    parallel = ttr("./mock_data/csv_data_1.csv", renderer_kwargs={"workers": 3}).run()
+    assert parallel == serial
+
+# test_jinja2_render_parallel_workers_missing_template()
+
+
+def test_jinja2_render_include_and_import():
+    data = """
+- interface: Gi1/1
+  ip: 10.0.0.1
+  mask: 255.255.255.0
+  device: R1
+  template: interface_with_include
+    """
+    generator = ttr(
+        templates_dict={
+            "interface_with_include": '{% import "macros" as macros %}'
+                                      '{{ macros.hostname("R1") }}\n'
+                                      '{% include "ttr://simple/interface.cisco_ios.txt" %}',
+            "macros": '{% macro hostname(name) %}hostname {{ name }}{% endmacro %}',
+        }
+    )
+    generator.load_data(data, data_plugin="yaml")
+    res = generator.run()
+    # pprint.pprint(res)
+    assert res["R1"].startswith("hostname R1\ninterface Gi1/1\n")
+    assert "ttr://simple/interface.cisco_ios.txt" in generator.templates_dict
+
+# test_jinja2_render_include_and_import()
+
+
+def test_jinja2_render_bytecode_cache_dir(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    res_1 = ttr(
+        "./mock_data/table_multitab_data_2.xlsx",
+        renderer_kwargs={"cache_dir": cache_dir}
+    ).run()
+    assert os.listdir(cache_dir)
+    res_2 = ttr(
+        "./mock_data/table_multitab_data_2.xlsx",
+        renderer_kwargs={"cache_dir": cache_dir}
+    ).run()
+    assert res_1 == res_2 == ttr("./mock_data/table_multitab_data_2.xlsx").run()
+
+# test_jinja2_render_bytecode_cache_dir()
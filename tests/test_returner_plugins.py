@@ -35,3 +35,98 @@ def test_terminal_returner_1():
     )
 
 # test_terminal_returner_1()
+
+
+def test_file_returner_dump_iter():
+    # delete previously generated results
+    if os.path.exists("./Output/test_file_returner_dump_iter"):
+        shutil.rmtree("./Output/test_file_returner_dump_iter")
+    generator = ttr(
+        returner="file",
+        returner_kwargs={
+            "result_dir": "./Output/test_file_returner_dump_iter/"
+        }
+    )
+    for result_name, text in generator.run_iter(data="./mock_data/table_multitab_data_2.xlsx"):
+        assert os.path.exists("./Output/test_file_returner_dump_iter/{}.txt".format(result_name))
+    with open("./Output/test_file_returner_dump_iter/r1.txt") as f:
+        assert f.read() == 'hostname r1\n!\ninterface loopback0\n  ip address 1.1.1.1/32\ninterface 10.0.0.1/24\n  ip address Eth1/32\ninterface 10.0.1.1/24\n  ip address Eth2/32'
+    with open("./Output/test_file_returner_dump_iter/r2.txt") as f:
+        assert f.read() == 'hostname r2\n!\ninterface loopback0\n  ip address 2.2.2.2/32'
+
+# test_file_returner_dump_iter()
+
+
+def test_file_returner_incremental_results_cache():
+    result_dir = "./Output/test_file_returner_incremental_results_cache/"
+    if os.path.exists(result_dir):
+        shutil.rmtree(result_dir)
+    kwargs = {
+        "returner": "file",
+        "returner_kwargs": {"result_dir": result_dir},
+        "results_cache": os.path.join(result_dir, ".ttr_results_cache.sqlite"),
+    }
+    # first run renders all results
+    generator = ttr("./mock_data/table_multitab_data_2.xlsx", **kwargs)
+    generator.run()
+    assert generator.stats["results_cache"] == {"hits": 0, "misses": 2}
+    # tamper r1 file to verify it is not rewritten
+    with open(os.path.join(result_dir, "r1.txt"), "w") as f:
+        f.write("foo")
+    # second run takes results from cache and does not rewrite files
+    generator = ttr("./mock_data/table_multitab_data_2.xlsx", **kwargs)
+    res = generator.run()
+    assert generator.stats["results_cache"] == {"hits": 2, "misses": 0}
+    assert generator.results == ttr("./mock_data/table_multitab_data_2.xlsx").run()
+    with open(os.path.join(result_dir, "r1.txt")) as f:
+        assert f.read() == "foo"
+    # changing template content makes results that use it to render again
+    generator = ttr(
+        "./mock_data/table_multitab_data_2.xlsx",
+        templates_dict={"test_path/interf_cfg": "interface {{ interface }}"},
+        **kwargs
+    )
+    generator.run()
+    assert generator.stats["results_cache"] == {"hits": 1, "misses": 1}
+    with open(os.path.join(result_dir, "r1.txt")) as f:
+        assert f.read() == 'hostname r1\n!\ninterface loopback0\n  ip address 1.1.1.1/32\ninterface 10.0.0.1/24\ninterface 10.0.1.1/24'
+    shutil.rmtree(result_dir)
+
+# test_file_returner_incremental_results_cache()
+
+
+def test_results_cache_included_templates():
+    result_dir = "./Output/test_results_cache_included_templates/"
+    if os.path.exists(result_dir):
+        shutil.rmtree(result_dir)
+    data = """
+- device: r1
+  template: main
+- device: r2
+  template: dynamic
+"""
+    kwargs = {
+        "data_plugin": "yaml",
+        "results_cache": os.path.join(result_dir, ".ttr_results_cache.sqlite"),
+    }
+    templates_dict = {
+        "main": "hostname {{ device }}\n{% include 'part' %}",
+        "dynamic": "{% include template_name | default('part') %}",
+        "part": "ntp server 1.1.1.1",
+    }
+    generator = ttr(data, templates_dict=dict(templates_dict), **kwargs)
+    generator.run()
+    assert generator.stats["results_cache"] == {"hits": 0, "misses": 2}
+    generator = ttr(data, templates_dict=dict(templates_dict), **kwargs)
+    generator.run()
+    assert generator.stats["results_cache"] == {"hits": 1, "misses": 1}
+    # changing included template renders results that include it again
+    templates_dict["part"] = "ntp server 2.2.2.2"
+    generator = ttr(data, templates_dict=dict(templates_dict), **kwargs)
+    generator.run()
+    assert generator.stats["results_cache"] == {"hits": 0, "misses": 2}
+    assert generator.results["r1"] == "hostname r1\nntp server 2.2.2.2"
+    assert generator.results["r2"] == "ntp server 2.2.2.2"
+    shutil.rmtree(result_dir)
+
+# test_results_cache_included_templates()
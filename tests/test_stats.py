@@ -0,0 +1,36 @@
+import sys
+sys.path.insert(0,'../')
+import pprint
+import os
+
+from ttr import ttr
+from ttr.utils.cli import format_stats
+
+
+def test_stats_stages():
+    gen = ttr("./mock_data/table_multiple_templates.xlsx", processors=["multitemplate", "templates_split"])
+    gen.run()
+    # pprint.pprint(gen.stats)
+    stages = gen.stats["stages"]
+    assert list(stages) == ["data_plugin:xlsx", "processor:multitemplate", "processor:templates_split",
+                            "validate_data", "renderer:jinja2", "returner:self"]
+    assert stages["data_plugin:xlsx"]["items"] == 4
+    assert stages["processor:multitemplate"]["items"] == 8
+    assert stages["renderer:jinja2"]["items"] == 2
+    assert stages["renderer:jinja2"]["bytes"] == sum(len(i) for i in gen.results.values())
+    assert all(i["calls"] == 1 and i["time"] >= 0 for i in stages.values())
+
+# test_stats_stages()
+
+
+def test_stats_render_profile():
+    if os.path.exists("./Output/test_stats_render_profile.pstats"):
+        os.remove("./Output/test_stats_render_profile.pstats")
+    gen = ttr("./mock_data/csv_data_1.csv", render_profile="./Output/test_stats_render_profile.pstats")
+    gen.run()
+    assert os.path.isfile("./Output/test_stats_render_profile.pstats")
+    table = format_stats(gen.stats)
+    assert "renderer:jinja2" in table
+    os.remove("./Output/test_stats_render_profile.pstats")
+
+# test_stats_render_profile()
@@ -405,4 +405,89 @@ def test_ttr_xlsx_templates_loader_using_load_templates_method():
                                                           ' exit\n'
                                                           '!'}
                                                           
-# test_ttr_xlsx_templates_loader_using_load_templates_method()
\ No newline at end of file
+# test_ttr_xlsx_templates_loader_using_load_templates_method()
+
+def test_xlsx_workbook_cache_shared_by_data_and_templates_loaders():
+    import os
+    import shutil
+    from ttr.utils import workbook_cache
+    from ttr.plugins.templates import templates_loaders_plugins
+
+    workbook_cache.clear()
+    opened = []
+    original_open = workbook_cache._open
+
+    def counting_open(path, backend, options):
+        opened.append(path)
+        return original_open(path, backend, options)
+
+    workbook_cache._open = counting_open
+    try:
+        # same workbook used for data and templates opened once
+        path = "./mock_data/table_multitab_inline_templates_data_3.xlsx"
+        with ttr(data=path, templates=path) as gen:
+            gen.run()
+            templates_dict = {}
+            for _ in range(3):
+                assert templates_loaders_plugins["base"](
+                    "missing_template", templates_dict, path
+                ) is False
+            assert len(templates_dict) == 2
+            assert opened == [path]
+        # templates workbook opened once despite of template name misses
+        opened.clear()
+        templates = "./Templates/test_templates_file_1.xlsx"
+        templates_dict = {}
+        for name in ["missing_1", "missing_2", "interfaces.cisco_ios", "missing_1"]:
+            templates_loaders_plugins["base"](name, templates_dict, templates)
+        assert list(templates_dict) == ["interfaces.cisco_ios"]
+        assert opened == [templates]
+        # modifying workbook file invalidates cache
+        shutil.copy(templates, "./Output/test_xlsx_workbook_cache.xlsx")
+        templates = "./Output/test_xlsx_workbook_cache.xlsx"
+        templates_loaders_plugins["base"]("missing_1", {}, templates)
+        stat = os.stat(templates)
+        os.utime(templates, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        templates_loaders_plugins["base"]("missing_1", {}, templates)
+        assert opened.count(templates) == 2
+    finally:
+        workbook_cache._open = original_open
+        workbook_cache.clear()
+        if os.path.exists("./Output/test_xlsx_workbook_cache.xlsx"):
+            os.remove("./Output/test_xlsx_workbook_cache.xlsx")
+
+# test_xlsx_workbook_cache_shared_by_data_and_templates_loaders()
+
+
+def test_xlsx_workbook_cache_releases_files():
+    import os
+    from ttr.utils import workbook_cache
+
+    def open_files(path):
+        path = os.path.abspath(path)
+        ret = 0
+        for fd in os.listdir("/proc/self/fd"):
+            try:
+                ret += os.readlink("/proc/self/fd/{}".format(fd)) == path
+            except OSError:
+                pass
+        return ret
+
+    if not os.path.isdir("/proc/self/fd"):
+        return
+    workbook_cache.clear()
+    path = "./mock_data/table_multiple_templates.xlsx"
+    gen = ttr(data=path, processors=["multitemplate"])
+    assert open_files(path) == 0
+    gen.run()
+    assert open_files(path) == 0
+    # templates stay cached after workbook closed
+    assert workbook_cache.get_templates(path) is not None
+    # workbooks kept open until outermost scope exited
+    with workbook_cache.scope():
+        workbook_cache.open_workbook(path)
+        assert open_files(path) == 1
+    assert open_files(path) == 0
+    workbook_cache.clear()
+
+# test_xlsx_workbook_cache_releases_files()
@@ -0,0 +1,8 @@
+"""
+TTR Benchmarks
+##############
+
+Collection of benchmarks to measure TTR performance, each benchmark is a module
+that can be run using ``python -m ttr.bench.<module name>`` command and prints
+machine-readable JSON report.
+"""
@@ -0,0 +1,142 @@
+"""
+Synthetic Datasets
+******************
+
+Functions to generate synthetic datasets of configurable size for benchmarking.
+
+Each dataset row describes a pair of connected devices' interfaces using
+``multitemplate`` processor suffixes ``:a`` and ``:b``, with template columns
+containing ``;`` separated lists of templates to exercise ``templates_split``
+processor, for example::
+
+    {'device:a': 'device-0', 'interface:a': 'Eth0', 'ip:a': '10.0.0.0',
+     'template:a': 'bench_0; bench_1',
+     'device:b': 'device-1', 'interface:b': 'Eth10', 'ip:b': '10.0.0.1',
+     'template:b': 'bench_0; bench_1',
+     'mask': 31, 'vid': 100}
+
+After passing through ``multitemplate`` and ``templates_split`` processors
+each row produces ``2 * templates`` data items.
+"""
+import csv
+import os
+
+TEMPLATE = """interface {{{{ interface }}}}
+ description bench template {index}
+ encapsulation dot1q {{{{ vid }}}}
+ ip address {{{{ ip }}}}/{{{{ mask }}}}
+!"""
+
+
+def make_templates(templates=1):
+    """
+    Function to generate templates dictionary.
+
+    :param templates: (int) number of templates to generate
+    :return: dictionary of ``{template name: template content}``
+    """
+    return {"bench_{}".format(i): TEMPLATE.format(index=i) for i in range(templates)}
+
+
+def make_items(devices=10, rows=10, templates=1):
+    """
+    Generator function to produce synthetic data items.
+
+    :param devices: (int) number of devices
+    :param rows: (int) number of rows per device
+    :param templates: (int) number of templates referenced by each row
+    :return: yields data items dictionaries
+    """
+    template_names = "; ".join("bench_{}".format(i) for i in range(templates))
+    for d in range(devices):
+        for r in range(rows):
+            subnet = d * rows + r
+            yield {
+                "device:a": "device-{}".format(d),
+                "interface:a": "Eth{}".format(r),
+                "ip:a": "10.{}.{}.0".format(subnet // 256 % 256, subnet % 256),
+                "template:a": template_names,
+                "device:b": "device-{}".format((d + 1) % devices),
+                "interface:b": "Eth{}".format(rows + r),
+                "ip:b": "10.{}.{}.1".format(subnet // 256 % 256, subnet % 256),
+                "template:b": template_names,
+                "mask": 31,
+                "vid": 100 + r,
+            }
+
+
+def write_csv(items, path):
+    """
+    Function to save data items in CSV file.
+
+    :param items: (iterable) data items to save
+    :param path: (str) OS path to file
+    """
+    writer = None
+    with open(path, "w", newline="", encoding="UTF-8") as f:
+        for item in items:
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(item.keys()))
+                writer.writeheader()
+            writer.writerow(item)
+
+
+def write_yaml(items, path):
+    """
+    Function to save data items in YAML file.
+
+    :param items: (iterable) data items to save
+    :param path: (str) OS path to file
+    """
+    # optional dependency, only needed if this format requested
+    from yaml import safe_dump  # pylint: disable=import-outside-toplevel
+
+    with open(path, "w", encoding="UTF-8") as f:
+        safe_dump(list(items), f, default_flow_style=False, sort_keys=False)
+
+
+def write_xlsx(items, path):
+    """
+    Function to save data items in XLSX spreadsheet file.
+
+    :param items: (iterable) data items to save
+    :param path: (str) OS path to file
+    """
+    # optional dependency, only needed if this format requested
+    from openpyxl import Workbook  # pylint: disable=import-outside-toplevel
+
+    # not using write only mode as it does not save sheet dimensions
+    wb = Workbook()
+    sheet = wb.active
+    sheet.title = "data"
+    headers = None
+    for item in items:
+        if headers is None:
+            headers = list(item.keys())
+            sheet.append(headers)
+        sheet.append([item[h] for h in headers])
+    wb.save(path)
+
+
+writers = {"csv": write_csv, "yaml": write_yaml, "xlsx": write_xlsx}
+
+
+def make_dataset(directory, data_format, devices=10, rows=10, templates=1):
+    """
+    Function to generate dataset file.
+
+    :param directory: (str) OS path to directory to save dataset file in
+    :param data_format: (str) dataset format - ``csv``, ``yaml`` or ``xlsx``
+    :param devices: (int) number of devices
+    :param rows: (int) number of rows per device
+    :param templates: (int) number of templates referenced by each row
+    :return: OS path to dataset file
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+    path = os.path.join(
+        directory,
+        "bench_{}x{}x{}.{}".format(devices, rows, templates, data_format),
+    )
+    writers[data_format](make_items(devices, rows, templates), path)
+    return path
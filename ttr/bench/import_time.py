@@ -0,0 +1,116 @@
+"""
+Import Time Benchmark
+*********************
+
+Benchmark to measure TTR import time using ``python -X importtime`` in a fresh
+interpreter process, comparing lazy plugins loading against importing all
+built-in plugins upfront.
+
+Sample usage::
+
+    python -m ttr.bench.import_time --runs 5
+
+Prints JSON report, where times are in microseconds::
+
+    {
+      "lazy": {"cumulative_us": 21000, "heavy_modules": []},
+      "eager": {"cumulative_us": 412000, "heavy_modules": ["jinja2", "openpyxl", "yaml", "yangson"]},
+      "gain_us": 391000
+    }
+"""
+import argparse
+import json
+import subprocess  # nosec
+import sys
+
+HEAVY_MODULES = ["jinja2", "openpyxl", "yaml", "yangson"]
+
+LAZY_STATEMENT = "from ttr import ttr"
+EAGER_STATEMENT = """
+from ttr import ttr
+from ttr.plugins.data import data_plugins
+from ttr.plugins.processors import processors_plugins
+from ttr.plugins.validate import validate_plugins
+from ttr.plugins.models import models_loaders_plugins
+from ttr.plugins.templates import templates_loaders_plugins
+from ttr.plugins.renderers import renderers_plugins
+from ttr.plugins.returners import returners_plugins
+for registry in [data_plugins, processors_plugins, validate_plugins, models_loaders_plugins,
+                 templates_loaders_plugins, renderers_plugins, returners_plugins]:
+    for name in list(registry):
+        registry[name]
+"""
+
+
+def parse_importtime(output):
+    """
+    Function to parse ``python -X importtime`` output.
+
+    :param output: (str) stderr output of ``python -X importtime``
+    :return: dictionary of ``{module name: cumulative import time in microseconds}``
+        for top level modules
+    """
+    ret = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # nested imports indented with more than one space
+        if name.startswith("  "):
+            continue
+        ret[name.strip()] = int(cumulative.strip())
+    return ret
+
+
+def measure(statement, runs=5):
+    """
+    Function to measure import time of given statement.
+
+    :param statement: (str) Python code to run in a fresh interpreter
+    :param runs: (int) number of runs, best result reported
+    :return: dictionary with ``cumulative_us`` and ``heavy_modules`` keys
+    """
+    results = []
+    for _ in range(runs):
+        process = subprocess.run(  # nosec
+            [sys.executable, "-X", "importtime", "-c", statement],
+            stderr=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        modules = parse_importtime(process.stderr)
+        results.append(
+            {
+                "cumulative_us": sum(modules.values()),
+                "heavy_modules": sorted(
+                    m
+                    for m in HEAVY_MODULES
+                    if any(i.split(".")[0] == m for i in modules)
+                ),
+            }
+        )
+    return min(results, key=lambda result: result["cumulative_us"])
+
+
+def run(runs=5):
+    """
+    Function to run import time benchmark.
+
+    :param runs: (int) number of runs for each measurement
+    :return: report dictionary
+    """
+    lazy = measure(LAZY_STATEMENT, runs)
+    eager = measure(EAGER_STATEMENT, runs)
+    return {
+        "lazy": lazy,
+        "eager": eager,
+        "gain_us": eager["cumulative_us"] - lazy["cumulative_us"],
+    }
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description="TTR import time benchmark")
+    argparser.add_argument("--runs", type=int, default=5, help="Number of runs")
+    args = argparser.parse_args()
+    print(json.dumps(run(args.runs), indent=2))
@@ -0,0 +1,184 @@
+"""
+Pipeline Benchmark
+******************
+
+End-to-end benchmark that generates synthetic datasets and times each stage
+of TTR pipeline - ``load_data``, ``process_data``, ``validate_data``, ``render``
+and ``run_returner``.
+
+Sample usage::
+
+    python -m ttr.bench.pipeline --devices 100 --rows 50 --templates 3 --formats xlsx,csv,yaml
+
+Prints JSON report with a list of results, one per data format, times are in seconds::
+
+    [
+      {
+        "format": "csv",
+        "devices": 100,
+        "rows": 50,
+        "templates": 3,
+        "items_loaded": 5000,
+        "items_processed": 30000,
+        "results": 100,
+        "stages": {
+          "load_data": 0.021,
+          "process_data": 0.083,
+          "validate_data": 0.002,
+          "render": 0.412,
+          "run_returner": 0.011
+        },
+        "total": 0.529
+      },
+      ...
+    ]
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from ttr import ttr
+from ttr.bench.datasets import make_dataset, make_templates
+
+PROCESSORS = ["multitemplate", "filtering", "templates_split"]
+
+
+def run_pipeline(data, templates_dict, result_dir, renderer_kwargs=None):
+    """
+    Function to run TTR pipeline stages one by one timing each of them.
+
+    :param data: (str) OS path to dataset file
+    :param templates_dict: (dict) templates dictionary
+    :param result_dir: (str) OS path to directory to save results in
+    :param renderer_kwargs: (dict) arguments to pass on to renderer plugin
+    :return: report dictionary
+    """
+    stages = {}
+    gen = ttr(
+        templates_dict=templates_dict,
+        processors=PROCESSORS,
+        returner="file",
+        returner_kwargs={"result_dir": result_dir},
+        renderer_kwargs=renderer_kwargs,
+    )
+
+    start = time.perf_counter()
+    data_loaded = gen._run_data_plugin(data)  # pylint: disable=protected-access
+    stages["load_data"] = time.perf_counter() - start
+    items_loaded = len(data_loaded)
+
+    start = time.perf_counter()
+    data_loaded = gen.process_data(data_loaded)
+    stages["process_data"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gen.validate_data(data_loaded)
+    stages["validate_data"] = time.perf_counter() - start
+    gen.data_loaded = data_loaded
+
+    start = time.perf_counter()
+    gen.results = gen.run_renderer()
+    stages["render"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    gen.run_returner()
+    stages["run_returner"] = time.perf_counter() - start
+
+    return {
+        "items_loaded": items_loaded,
+        "items_processed": len(data_loaded),
+        "results": len(gen.results),
+        "stages": stages,
+        "total": sum(stages.values()),
+    }
+
+
+def run(
+    devices=10,
+    rows=10,
+    templates=1,
+    formats=("xlsx", "csv", "yaml"),
+    directory=None,
+    renderer_kwargs=None,
+):
+    """
+    Function to run pipeline benchmark for each of data formats.
+
+    :param devices: (int) number of devices
+    :param rows: (int) number of rows per device
+    :param templates: (int) number of templates referenced by each row
+    :param formats: (list) list of data formats to benchmark
+    :param directory: (str) OS path to directory to store datasets and results in,
+        temporary directory used and removed afterwards if not provided
+    :param renderer_kwargs: (dict) arguments to pass on to renderer plugin
+    :return: list of report dictionaries
+    """
+    ret = []
+    workdir = directory or tempfile.mkdtemp(prefix="ttr_bench_")
+    templates_dict = make_templates(templates)
+    try:
+        for data_format in formats:
+            data = make_dataset(
+                os.path.join(workdir, "data"), data_format, devices, rows, templates
+            )
+            report = {
+                "format": data_format,
+                "devices": devices,
+                "rows": rows,
+                "templates": templates,
+            }
+            report.update(
+                run_pipeline(
+                    data,
+                    dict(templates_dict),
+                    os.path.join(workdir, "output", data_format),
+                    renderer_kwargs,
+                )
+            )
+            ret.append(report)
+    finally:
+        if directory is None:
+            shutil.rmtree(workdir, ignore_errors=True)
+    return ret
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description="TTR pipeline benchmark")
+    argparser.add_argument("--devices", type=int, default=10, help="Number of devices")
+    argparser.add_argument(
+        "--rows", type=int, default=10, help="Number of rows per device"
+    )
+    argparser.add_argument(
+        "--templates", type=int, default=1, help="Number of templates per row"
+    )
+    argparser.add_argument(
+        "--formats",
+        type=str,
+        default="xlsx,csv,yaml",
+        help="Comma separated list of data formats",
+    )
+    argparser.add_argument(
+        "--dir", type=str, default=None, help="Directory to keep datasets in"
+    )
+    argparser.add_argument(
+        "--workers", type=int, default=None, help="Number of rendering processes"
+    )
+    argparser.add_argument(
+        "--output", type=str, default=None, help="File to save JSON report in"
+    )
+    args = argparser.parse_args()
+    reports = run(
+        devices=args.devices,
+        rows=args.rows,
+        templates=args.templates,
+        formats=[i.strip() for i in args.formats.split(",")],
+        directory=args.dir,
+        renderer_kwargs={"workers": args.workers} if args.workers else None,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as f:
+            json.dump(reports, f, indent=2)
+    print(json.dumps(reports, indent=2))
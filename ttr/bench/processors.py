@@ -0,0 +1,144 @@
+"""
+Processors Benchmark
+********************
+
+Benchmark to measure how processing time scales with number of data rows for
+``multitemplate`` -> ``filtering`` -> ``templates_split`` processors chain used
+by TTR CLI tool.
+
+Two modes compared:
+
+- ``pipeline`` - processors chained in a single pass using ``ttr.process_data_iter``
+- ``lists`` - processors run one after another, each producing a new list
+
+Sample usage::
+
+    python -m ttr.bench.processors --sizes 10000,100000,1000000 --templates 2
+
+Prints JSON report with a list of results, one per mode and number of rows, times
+are in seconds::
+
+    [
+      {
+        "mode": "pipeline",
+        "rows": 10000,
+        "items": 40000,
+        "time": 0.136,
+        "us_per_row": 13.6
+      },
+      ...
+    ]
+
+Linear scaling means that ``us_per_row`` stays roughly the same as number of rows grows.
+"""
+import argparse
+import json
+import time
+
+from ttr import ttr
+from ttr.bench.datasets import make_items
+from ttr.plugins.processors import processors_plugins
+
+PROCESSORS = ["multitemplate", "filtering", "templates_split"]
+ROWS_PER_DEVICE = 100
+
+
+def run_lists(data, processors_kwargs):
+    """
+    Function to run processors one after another passing lists between them.
+
+    :param data: (list) data items to process
+    :param processors_kwargs: (dict) arguments to pass on to processor plugins
+    :return: number of processed data items
+    """
+    for processor_plugin in PROCESSORS:
+        data = processors_plugins[processor_plugin](
+            data=data,
+            template_name_key="template",
+            result_name_key="device",
+            **processors_kwargs,
+        )
+    return len(data)
+
+
+def run_pipeline(data, processors_kwargs):
+    """
+    Function to run processors chained in a single pass.
+
+    :param data: (list) data items to process
+    :param processors_kwargs: (dict) arguments to pass on to processor plugins
+    :return: number of processed data items
+    """
+    gen = ttr(processors=PROCESSORS, processors_kwargs=processors_kwargs)
+    count = 0
+    for _ in gen.process_data_iter(data):
+        count += 1
+    return count
+
+
+modes = {"pipeline": run_pipeline, "lists": run_lists}
+
+
+def run(
+    sizes=(10000, 100000, 1000000), templates=1, modes_to_run=("pipeline", "lists")
+):
+    """
+    Function to run processors benchmark for each number of rows and mode.
+
+    :param sizes: (list) list of numbers of rows to benchmark
+    :param templates: (int) number of templates referenced by each row
+    :param modes_to_run: (list) list of modes to benchmark
+    :return: list of report dictionaries
+    """
+    ret = []
+    processors_kwargs = {"filters": ["device-*"]}
+    for rows in sizes:
+        for mode in modes_to_run:
+            devices = max(rows // ROWS_PER_DEVICE, 1)
+            data = list(make_items(devices, min(rows, ROWS_PER_DEVICE), templates))
+            start = time.perf_counter()
+            items = modes[mode](data, processors_kwargs)
+            elapsed = time.perf_counter() - start
+            del data
+            ret.append(
+                {
+                    "mode": mode,
+                    "rows": rows,
+                    "items": items,
+                    "time": round(elapsed, 4),
+                    "us_per_row": round(elapsed / rows * 1000000, 3),
+                }
+            )
+    return ret
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description="TTR processors benchmark")
+    argparser.add_argument(
+        "--sizes",
+        type=str,
+        default="10000,100000,1000000",
+        help="Comma separated list of numbers of rows",
+    )
+    argparser.add_argument(
+        "--templates", type=int, default=1, help="Number of templates per row"
+    )
+    argparser.add_argument(
+        "--modes",
+        type=str,
+        default="pipeline,lists",
+        help="Comma separated list of modes",
+    )
+    argparser.add_argument(
+        "--output", type=str, default=None, help="File to save JSON report in"
+    )
+    args = argparser.parse_args()
+    reports = run(
+        sizes=[int(i) for i in args.sizes.split(",")],
+        templates=args.templates,
+        modes_to_run=[i.strip() for i in args.modes.split(",")],
+    )
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as f:
+            json.dump(reports, f, indent=2)
+    print(json.dumps(reports, indent=2))
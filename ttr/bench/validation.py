@@ -0,0 +1,207 @@
+"""
+Validation Benchmark
+********************
+
+Benchmark to compare data validation plugins - ``yangson``, ``yangson_compiled`` and
+``jsonschema`` - on equivalent interface models. Models written to temporary
+directory, for each validator benchmark measures:
+
+- ``import_time`` - time to import validator and models loader plugins
+- ``load_time`` - time to load and compile models
+- ``validate_time`` - time to validate data items in a batch
+
+Sample usage::
+
+    python -m ttr.bench.validation --items 10000
+
+Prints JSON report with a list of results, one per validator, times are in seconds::
+
+    [
+      {
+        "validator": "jsonschema",
+        "items": 10000,
+        "invalid": 100,
+        "import_time": 0.0012,
+        "load_time": 0.0005,
+        "validate_time": 0.061,
+        "us_per_item": 6.1
+      },
+      ...
+    ]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from ttr import ttr
+from ttr.plugins.models import models_loaders_plugins
+from ttr.plugins.validate import validate_batch_plugins
+
+YANG_MODEL = """
+module interface {
+    yang-version "1.1";
+    namespace "http://ttr/bench";
+    prefix "ttr";
+    leaf interface {
+        mandatory true;
+        type string;
+    }
+    leaf template {
+        mandatory true;
+        type string;
+    }
+    leaf device {
+        mandatory true;
+        type string;
+    }
+    leaf description {
+        type string;
+    }
+    leaf vid {
+        type int32 {
+            range "1..4094";
+        }
+    }
+    leaf mask {
+        type string {
+            pattern '([0-9]{1,3}.){3}[0-9]{1,3}';
+        }
+    }
+    leaf vrf {
+        type string;
+    }
+}
+"""
+
+JSON_SCHEMA_MODEL = {
+    "type": "object",
+    "properties": {
+        "interface": {"type": "string"},
+        "template": {"type": "string"},
+        "device": {"type": "string"},
+        "description": {"type": "string"},
+        "vid": {"type": "integer", "minimum": 1, "maximum": 4094},
+        "mask": {"type": "string", "pattern": "^([0-9]{1,3}.){3}[0-9]{1,3}$"},
+        "vrf": {"type": "string"},
+    },
+    "required": ["interface", "template", "device"],
+    "additionalProperties": False,
+}
+
+validators = ("yangson", "yangson_compiled", "jsonschema")
+
+
+def make_models(path):
+    """
+    Function to write equivalent YANG and JSON Schema models to directory.
+
+    :param path: (str) OS path to directory to create models in
+    :return: dictionary of ``{validator: models directory}``
+    """
+    yang_dir = os.path.join(path, "yang")
+    os.makedirs(os.path.join(yang_dir, "interface"))
+    with open(
+        os.path.join(yang_dir, "interface", "interface.yang"), "w", encoding="utf-8"
+    ) as f:
+        f.write(YANG_MODEL.strip())
+    jsonschema_dir = os.path.join(path, "jsonschema")
+    os.makedirs(jsonschema_dir)
+    with open(
+        os.path.join(jsonschema_dir, "interface.json"), "w", encoding="utf-8"
+    ) as f:
+        json.dump(JSON_SCHEMA_MODEL, f)
+    return {
+        "yangson": yang_dir,
+        "yangson_compiled": yang_dir,
+        "jsonschema": jsonschema_dir,
+    }
+
+
+def make_data(items):
+    """
+    Function to generate data items, every 100th item is invalid.
+
+    :param items: (int) number of data items to generate
+    :return: list of data items dictionaries
+    """
+    return [
+        {
+            "interface": "Gi1/{}".format(i),
+            "template": "interfaces.cisco_ios",
+            "device": "device-{}".format(i // 100),
+            "description": "Customer {}".format(i),
+            "vid": i % 4000 + 1 if i % 100 else "abc",
+            "mask": "255.255.255.0",
+            "vrf": "cust_{}".format(i % 10),
+        }
+        for i in range(items)
+    ]
+
+
+def run(items=10000, validators_to_run=validators):
+    """
+    Function to run validation benchmark for each validator.
+
+    :param items: (int) number of data items to validate
+    :param validators_to_run: (list) list of validators to benchmark
+    :return: list of report dictionaries
+    """
+    ret = []
+    data = make_data(items)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        models_dirs = make_models(tmp_dir)
+        for validator in validators_to_run:
+            start = time.perf_counter()
+            validate_batch = validate_batch_plugins[validator]
+            models_loaders_plugins[validator]  # pylint: disable=pointless-statement
+            import_time = time.perf_counter() - start
+
+            gen = ttr(validator=validator, models_dir=models_dirs[validator])
+            start = time.perf_counter()
+            gen.load_models()
+            load_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            results = validate_batch(
+                data, gen.models_dict["interface"], "interface", on_fail=None
+            )
+            validate_time = time.perf_counter() - start
+            ret.append(
+                {
+                    "validator": validator,
+                    "items": items,
+                    "invalid": sum(1 for result in results if not result[1]),
+                    "import_time": round(import_time, 4),
+                    "load_time": round(load_time, 4),
+                    "validate_time": round(validate_time, 4),
+                    "us_per_item": round(validate_time / items * 1000000, 3),
+                }
+            )
+    return ret
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description="TTR validation benchmark")
+    argparser.add_argument(
+        "--items", type=int, default=10000, help="Number of data items to validate"
+    )
+    argparser.add_argument(
+        "--validators",
+        type=str,
+        default=",".join(validators),
+        help="Comma separated list of validators",
+    )
+    argparser.add_argument(
+        "--output", type=str, default=None, help="File to save JSON report in"
+    )
+    args = argparser.parse_args()
+    reports = run(
+        items=args.items,
+        validators_to_run=[i.strip() for i in args.validators.split(",")],
+    )
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as output_file:
+            json.dump(reports, output_file, indent=2)
+    print(json.dumps(reports, indent=2))
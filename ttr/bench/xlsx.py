@@ -0,0 +1,102 @@
+"""
+XLSX Loader Benchmark
+*********************
+
+Benchmark to compare ``xlsx`` data plugin parsing backends - ``openpyxl`` and
+``stdlib`` - on a synthetic spreadsheet, verifying that both backends load
+identical data.
+
+Sample usage::
+
+    python -m ttr.bench.xlsx --rows 100000
+
+Prints JSON report with a list of results, one per backend, times are in seconds::
+
+    [
+      {
+        "backend": "openpyxl",
+        "rows": 100000,
+        "time": 9.52,
+        "us_per_row": 95.2
+      },
+      {
+        "backend": "stdlib",
+        "rows": 100000,
+        "time": 2.91,
+        "us_per_row": 29.1,
+        "identical": true
+      }
+    ]
+"""
+import argparse
+import json
+import tempfile
+import time
+
+from ttr.bench.datasets import make_dataset
+from ttr.plugins.data import data_plugins
+
+ROWS_PER_DEVICE = 100
+backends = ("openpyxl", "stdlib")
+
+
+def run(rows=100000, backends_to_run=backends):
+    """
+    Function to run xlsx loader benchmark for each backend.
+
+    :param rows: (int) number of spreadsheet rows
+    :param backends_to_run: (list) list of backends to benchmark
+    :return: list of report dictionaries
+    """
+    ret = []
+    loaded = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = make_dataset(
+            tmp_dir,
+            "xlsx",
+            devices=max(rows // ROWS_PER_DEVICE, 1),
+            rows=min(rows, ROWS_PER_DEVICE),
+        )
+        for backend in backends_to_run:
+            start = time.perf_counter()
+            data = data_plugins["xlsx"](
+                path, templates_dict={}, template_name_key="template", backend=backend
+            )
+            elapsed = time.perf_counter() - start
+            report = {
+                "backend": backend,
+                "rows": len(data),
+                "time": round(elapsed, 4),
+                "us_per_row": round(elapsed / max(len(data), 1) * 1000000, 3),
+            }
+            loaded[backend] = [dict(item) for item in data]
+            if backend != backends_to_run[0]:
+                report["identical"] = loaded[backend] == loaded[backends_to_run[0]]
+            ret.append(report)
+            del data
+    return ret
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description="TTR xlsx loader benchmark")
+    argparser.add_argument(
+        "--rows", type=int, default=100000, help="Number of spreadsheet rows"
+    )
+    argparser.add_argument(
+        "--backends",
+        type=str,
+        default=",".join(backends),
+        help="Comma separated list of backends",
+    )
+    argparser.add_argument(
+        "--output", type=str, default=None, help="File to save JSON report in"
+    )
+    args = argparser.parse_args()
+    reports = run(
+        rows=args.rows,
+        backends_to_run=[i.strip() for i in args.backends.split(",")],
+    )
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as f:
+            json.dump(reports, f, indent=2)
+    print(json.dumps(reports, indent=2))
@@ -0,0 +1,155 @@
+"""
+YAML Loader Benchmark
+*********************
+
+Benchmark to compare ``yaml`` data plugin loading modes on a synthetic YAML file of
+given size in megabytes:
+
+- ``safe_load`` - pure Python ``yaml.safe_load`` of single document file, the way
+  YAML data loaded before ``CSafeLoader`` support
+- ``load`` - ``yaml`` data plugin ``load`` function parsing single document file
+- ``load_iter`` - ``yaml`` data plugin ``load_iter`` function parsing multiple
+  documents file with one device per document, one document at a time
+
+Sample usage::
+
+    python -m ttr.bench.yaml_loader --size 50
+
+Prints JSON report with a list of results, one per mode, times are in seconds::
+
+    [
+      {
+        "mode": "safe_load",
+        "items": 283700,
+        "size_mb": 53.14,
+        "time": 330.5487,
+        "mb_per_s": 0.16
+      },
+      {
+        "mode": "load",
+        "items": 283700,
+        "size_mb": 53.14,
+        "time": 73.6764,
+        "mb_per_s": 0.72,
+        "identical": true
+      },
+      ...
+    ]
+"""
+import argparse
+import itertools
+import json
+import os
+import tempfile
+import time
+
+from yaml import safe_dump, safe_dump_all, safe_load
+
+from ttr.bench.datasets import make_items
+from ttr.plugins.data import data_plugins, data_stream_plugins
+
+ROWS_PER_DEVICE = 10
+modes = ("safe_load", "load", "load_iter")
+
+
+def write_files(directory, size):
+    """
+    Function to write single document and multiple documents YAML files.
+
+    :param directory: (str) OS path to directory to create files in
+    :param size: (float) approximate size of each file in megabytes
+    :return: tuple of ``(single document file path, multiple documents file path)``
+    """
+    sample = safe_dump(
+        list(make_items(devices=10, rows=ROWS_PER_DEVICE)),
+        default_flow_style=False,
+        sort_keys=False,
+    )
+    devices = max(int(size * 1024 * 1024 / len(sample) * 10), 1)
+    items = list(make_items(devices=devices, rows=ROWS_PER_DEVICE))
+    single = os.path.join(directory, "bench_single.yaml")
+    with open(single, "w", encoding="UTF-8") as f:
+        safe_dump(items, f, default_flow_style=False, sort_keys=False)
+    multiple = os.path.join(directory, "bench_multiple.yaml")
+    with open(multiple, "w", encoding="UTF-8") as f:
+        safe_dump_all(
+            (
+                list(device_items)
+                for _, device_items in itertools.groupby(
+                    items, key=lambda item: item["device:a"]
+                )
+            ),
+            f,
+            default_flow_style=False,
+            sort_keys=False,
+        )
+    return single, multiple
+
+
+def run(size=50, modes_to_run=modes):
+    """
+    Function to run YAML loader benchmark for each mode.
+
+    :param size: (float) approximate size of YAML file in megabytes
+    :param modes_to_run: (list) list of modes to benchmark
+    :return: list of report dictionaries
+    """
+    ret = []
+    loaded = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        single, multiple = write_files(tmp_dir, size)
+        for mode in modes_to_run:
+            path = multiple if mode == "load_iter" else single
+            start = time.perf_counter()
+            if mode == "safe_load":
+                with open(path, encoding="UTF-8") as f:
+                    data = safe_load(f)
+            elif mode == "load":
+                data = data_plugins["yaml"](path)
+            elif mode == "load_iter":
+                # consume items one by one, keeping them for comparison only
+                data = list(data_stream_plugins["yaml"](path))
+            else:
+                raise RuntimeError(
+                    "ttr.bench.yaml_loader unsupported mode '{}'".format(mode)
+                )
+            elapsed = time.perf_counter() - start
+            size_mb = os.path.getsize(path) / 1024 / 1024
+            report = {
+                "mode": mode,
+                "items": len(data),
+                "size_mb": round(size_mb, 2),
+                "time": round(elapsed, 4),
+                "mb_per_s": round(size_mb / elapsed, 2),
+            }
+            loaded[mode] = data
+            if mode != modes_to_run[0]:
+                report["identical"] = loaded[mode] == loaded[modes_to_run[0]]
+            ret.append(report)
+            del data
+    return ret
+
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description="TTR YAML loader benchmark")
+    argparser.add_argument(
+        "--size", type=float, default=50, help="YAML file size in megabytes"
+    )
+    argparser.add_argument(
+        "--modes",
+        type=str,
+        default=",".join(modes),
+        help="Comma separated list of modes",
+    )
+    argparser.add_argument(
+        "--output", type=str, default=None, help="File to save JSON report in"
+    )
+    args = argparser.parse_args()
+    reports = run(
+        size=args.size,
+        modes_to_run=[i.strip() for i in args.modes.split(",")],
+    )
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as output_file:
+            json.dump(reports, output_file, indent=2)
+    print(json.dumps(reports, indent=2))
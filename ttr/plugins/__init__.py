@@ -0,0 +1,143 @@
+"""
+Plugins Registry
+################
+
+Each plugins package exposes a dictionary-like registry of ``{plugin name: function}``,
+e.g. ``data_plugins`` or ``renderers_plugins``. Registries import plugin modules on
+first lookup only, that way TTR does not import libraries such as ``openpyxl``,
+``yaml``, ``jinja2`` or ``yangson`` unless plugin that needs them is in use.
+
+In addition to built-in plugins, registries discover third-party plugins using
+Python package entry points, where entry points group names are:
+
+- ``ttr.plugins.data`` - data loader plugins
+- ``ttr.plugins.data_stream`` - streaming data loader plugins
+- ``ttr.plugins.processors`` - processor plugins
+- ``ttr.plugins.processors_stream`` - streaming processor plugins
+- ``ttr.plugins.validate`` - data validation plugins
+- ``ttr.plugins.validate_batch`` - batch data validation plugins
+- ``ttr.plugins.models`` - models loader plugins
+- ``ttr.plugins.templates`` - templates loader plugins
+- ``ttr.plugins.renderers`` - renderer plugins
+- ``ttr.plugins.renderers_stream`` - streaming renderer plugins
+- ``ttr.plugins.returners`` - returner plugins
+- ``ttr.plugins.returners_stream`` - streaming returner plugins
+
+For example, third-party package can register ``json`` data loader plugin in its
+``setup.py`` file::
+
+    setup(
+        ...
+        entry_points={
+            "ttr.plugins.data": ["json = my_package.json_loader:load"]
+        },
+    )
+
+Built-in plugins take precedence over third-party plugins with the same name.
+"""
+import importlib
+import logging
+from collections.abc import MutableMapping
+
+log = logging.getLogger(__name__)
+
+
+def _get_entry_points(group):
+    """
+    Function to retrieve a list of entry points for given group, ``importlib.metadata``
+    imported here as it takes significant time to import.
+
+    :param group: (str) entry points group name
+    """
+    # pylint: disable=import-outside-toplevel
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        try:
+            from importlib_metadata import entry_points
+        except ImportError:
+            return []
+    try:
+        eps = entry_points()
+        if hasattr(eps, "select"):
+            return list(eps.select(group=group))
+        return list(eps.get(group, []))
+    except Exception as e:
+        log.error(
+            "TTR:plugins failed to discover '{}' entry points, error: {}".format(
+                group, e
+            )
+        )
+        return []
+
+
+class LazyPluginsRegistry(MutableMapping):
+    """
+    Dictionary-like registry of plugins that imports plugin module on first lookup.
+
+    :param group: (str) entry points group name to discover third-party plugins in
+    :param plugins: (dict) dictionary of ``{plugin name: "module:function"}`` references,
+        where module name can be relative to ``package``
+    :param package: (str) package name to resolve relative module names against
+    """
+
+    def __init__(self, group, plugins, package):
+        self.group = group
+        self.package = package
+        self._references = dict(plugins)
+        self._loaded = {}
+        self._entry_points_discovered = False
+
+    def _discover_entry_points(self):
+        if self._entry_points_discovered:
+            return
+        self._entry_points_discovered = True
+        for entry_point in _get_entry_points(self.group):
+            if entry_point.name in self._references:
+                log.debug(
+                    "TTR:plugins '{}' plugin '{}' already registered, skipping entry point".format(
+                        self.group, entry_point.name
+                    )
+                )
+                continue
+            self._references[entry_point.name] = entry_point
+
+    def __getitem__(self, name):
+        if name in self._loaded:
+            return self._loaded[name]
+        if name not in self:
+            raise KeyError(name)
+        reference = self._references[name]
+        if isinstance(reference, str):
+            module_name, function_name = reference.split(":")
+            module = importlib.import_module(module_name, self.package)
+            plugin = getattr(module, function_name)
+        else:
+            plugin = reference.load()
+        self._loaded[name] = plugin
+        return plugin
+
+    def __setitem__(self, name, plugin):
+        self._references[name] = plugin
+        self._loaded[name] = plugin
+
+    def __delitem__(self, name):
+        del self._references[name]
+        self._loaded.pop(name, None)
+
+    def __contains__(self, name):
+        if name in self._references:
+            return True
+        self._discover_entry_points()
+        return name in self._references
+
+    def __iter__(self):
+        self._discover_entry_points()
+        return iter(self._references)
+
+    def __len__(self):
+        self._discover_entry_points()
+        return len(self._references)
+
+    def __repr__(self):
+        return "{}({!r}, {})".format(type(self).__name__, self.group, list(self))
@@ -1,10 +1,33 @@
-from . import csv_loader
-from . import xlsx_loader
-from . import yaml_loader
+from .. import LazyPluginsRegistry
 
-data_plugins = {
-    "csv": csv_loader.load,
-    "xlsx": xlsx_loader.load,
-    "yaml": yaml_loader.load,
-    "yml": yaml_loader.load,
-}
+data_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.data",
+    plugins={
+        "csv": ".csv_loader:load",
+        "json": ".jsonl_loader:load",
+        "jsonl": ".jsonl_loader:load",
+        "db": ".sqlite_loader:load",
+        "sqlite": ".sqlite_loader:load",
+        "sqlite3": ".sqlite_loader:load",
+        "xlsx": ".xlsx_loader:load",
+        "yaml": ".yaml_loader:load",
+        "yml": ".yaml_loader:load",
+    },
+    package=__name__,
+)
+
+data_stream_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.data_stream",
+    plugins={
+        "csv": ".csv_loader:load_iter",
+        "json": ".jsonl_loader:load_iter",
+        "jsonl": ".jsonl_loader:load_iter",
+        "db": ".sqlite_loader:load_iter",
+        "sqlite": ".sqlite_loader:load_iter",
+        "sqlite3": ".sqlite_loader:load_iter",
+        "xlsx": ".xlsx_loader:load_iter",
+        "yaml": ".yaml_loader:load_iter",
+        "yml": ".yaml_loader:load_iter",
+    },
+    package=__name__,
+)
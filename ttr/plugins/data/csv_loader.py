@@ -4,7 +4,8 @@ CSV Spreadsheets loader plugin
 
 **Plugin Name:** ``csv``
 
-Support loading data from CSV text file.
+Support loading data from CSV text file, from all ``*.csv`` files in a directory or
+from CSV text string.
 
 Spreadsheet must contain a column or multiple columns with headers starting
 with ``template_name_key`` argument string. Values of template(s) columns either
@@ -14,42 +15,380 @@ relative to ``template_dir`` argument supplied to TTR object on instantiation.
 In addition, table must contain column with ``result_name_key`` values, they used
 to combine results, i.e. rendering results for identical ``result_name_key`` combined
 in a single string. ``result_name_key`` used further by returners to return results.
+
+**Streaming**
+
+``load_iter`` function yields data items one by one reading files using large
+buffered reads, such that big CSV files can be rendered using TTR ``run_iter``
+method without loading them in memory as a whole::
+
+    from ttr import ttr
+
+    gen = ttr(returner="file", returner_kwargs={"result_dir": "./Output/"})
+    for result_name, text in gen.run_iter(data="./inventory_export.csv"):
+        pass
+
+Files in a directory read concurrently by a pool of ``workers`` threads, each file
+read ahead in batches of rows while data items produced in files' names order.
+
+**Type coercion**
+
+All values loaded as strings by default, ``types`` argument can be used to convert
+values of given columns, e.g. ``data_plugin_kwargs={"types": {"vid": "int"}}``.
+Supported types are ``int``, ``float``, ``bool`` or any callable that takes string
+and returns converted value. Values that fail conversion or empty values left as is.
 """
 import logging
 import csv
+import io
 import os
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from ...utils.compact_rows import RowsSchema
+from ...utils.pushdown import make_projection, make_row_filter
 
 log = logging.getLogger(__name__)
 
+BUFFER_SIZE = 1024 * 1024  # bytes
+BATCH_SIZE = 1000  # rows
+QUEUE_SIZE = 8  # batches to read ahead for each file
+_DONE = object()
 
-def load(
-    data, templates_dict=None, template_name_key=None, **kwargs
+TYPES = {
+    "int": int,
+    "float": float,
+    "bool": lambda value: {
+        "true": True,
+        "yes": True,
+        "1": True,
+        "false": False,
+        "no": False,
+        "0": False,
+    }[value.strip().lower()],
+    "str": str,
+}
+
+
+def _make_converters(fieldnames, types):
+    """
+    Function to form list of ``(column index, header, converter)`` tuples.
+
+    :param fieldnames: (list) list of headers
+    :param types: (dict) dictionary of ``{header: type name or callable}``
+    """
+    converters = []
+    for index, header in enumerate(fieldnames):
+        if header not in types:
+            continue
+        converter = types[header]
+        if not callable(converter):
+            if converter not in TYPES:
+                raise RuntimeError(
+                    "csv_loader, unsupported type '{}' for '{}' column, supported: {}".format(
+                        converter, header, ", ".join(TYPES)
+                    )
+                )
+            converter = TYPES[converter]
+        converters.append((index, header, converter))
+    return converters
+
+
+def _convert(row, converters, failed):
+    """
+    Function to convert row values in place.
+
+    :param row: (list) row values
+    :param converters: (list) list of ``(column index, header, converter)`` tuples
+    :param failed: (set) set of columns conversion failed for, to log them once
+    """
+    for index, header, converter in converters:
+        if index >= len(row) or row[index] == "":
+            continue
+        try:
+            row[index] = converter(row[index])
+        except Exception as e:
+            if header not in failed:
+                failed.add(header)
+                log.warning(
+                    "csv_loader, failed to convert '{}' column value '{}', leaving "
+                    "such values as is, error: {}".format(header, row[index], e)
+                )
+
+
+def _make_ragged_item(row, fieldnames, restkey, restval, row_filter, projected):
+    """
+    Function to make data item dictionary out of row that has more or less values
+    than there are headers, same as ``csv.DictReader`` does.
+
+    :param row: (list) row values
+    :param fieldnames: (list) list of headers
+    :param restkey: (str) key to store values for which there are no headers
+    :param restval: value to use for missing values
+    :param row_filter: (callable) function to check row values against filters or None
+    :param projected: (set) set of headers to load or None to load all of them
+    :return: dictionary or None if row filtered out
+    """
+    item = dict(zip(fieldnames, row))
+    if len(row) > len(fieldnames):
+        item[restkey] = row[len(fieldnames) :]
+    else:
+        for key in fieldnames[len(row) :]:
+            item[key] = restval
+    if row_filter is not None and not row_filter([item[key] for key in fieldnames]):
+        return None
+    if projected is not None:
+        item = {k: v for k, v in item.items() if k in projected}
+    return item
+
+
+def _read_rows(
+    csvfile,
+    fieldnames=None,
+    restkey=None,
+    restval=None,
+    template_name_key=None,
+    result_name_key=None,
+    filters=None,
+    columns=None,
+    types=None,
+    **kwargs,
+):
+    """
+    Generator function to read rows from CSV file object sharing headers across rows,
+    produces the same results as ``csv.DictReader``.
+
+    :param csvfile: (obj) file object to read rows from
+    :param fieldnames: (list) list of headers, first row used as headers if not provided
+    :param restkey: (str) key to store values for which there are no headers
+    :param restval: value to use for missing values
+    :param template_name_key: (str) templates column header name
+    :param result_name_key: (str) name of the column to match ``filters`` against
+    :param filters: (list) glob patterns to skip rows that do not match
+    :param columns: (list) list of columns names to load
+    :param types: (dict) dictionary of ``{header: type name or callable}``
+    :param kwargs: (dict) any additional arguments to pass on to ``csv.reader``
+    """
+    reader = csv.reader(csvfile, **kwargs)
+    if fieldnames is None:
+        fieldnames = next(reader, None)
+        if fieldnames is None:
+            return
+    headers_count = len(fieldnames)
+    converters = _make_converters(fieldnames, types) if types else None
+    failed = set()
+    row_filter = make_row_filter(fieldnames, result_name_key, filters)
+    indexes = make_projection(fieldnames, columns, template_name_key, result_name_key)
+    projected = None
+    if indexes is None:
+        schema = RowsSchema(fieldnames)
+    else:
+        schema = RowsSchema([fieldnames[index] for index in indexes])
+        projected = set(schema.headers)
+    for row in reader:
+        # skip empty rows same as csv.DictReader does
+        if row == []:
+            continue
+        if converters:
+            _convert(row, converters, failed)
+        if len(row) == headers_count:
+            if row_filter is not None and not row_filter(row):
+                continue
+            if indexes is not None:
+                row = [row[index] for index in indexes]
+            yield schema.make_row(row)
+        else:
+            item = _make_ragged_item(
+                row, fieldnames, restkey, restval, row_filter, projected
+            )
+            if item is not None:
+                yield item
+
+
+def _read_file(path, **kwargs):
+    """
+    Generator function to read data items from CSV file.
+
+    :param path: (str) OS path to CSV file
+    :param kwargs: (dict) arguments for ``_read_rows`` function
+    """
+    with open(path, newline="", encoding="UTF-8", buffering=BUFFER_SIZE) as csvfile:
+        yield from _read_rows(csvfile, **kwargs)
+
+
+def _put(out, item, stop):
+    """
+    Function to put item in queue, giving up if ``stop`` event set.
+    """
+    while not stop.is_set():
+        try:
+            out.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _read_file_batches(path, out, stop, kwargs):
+    """
+    Function to read CSV file in batches of rows, run by worker threads.
+
+    :param path: (str) OS path to CSV file
+    :param out: (obj) queue to put batches of data items in
+    :param stop: (obj) ``threading.Event`` to stop reading the file
+    :param kwargs: (dict) arguments for ``_read_rows`` function
+    """
+    try:
+        batch = []
+        for item in _read_file(path, **kwargs):
+            batch.append(item)
+            if len(batch) >= BATCH_SIZE:
+                _put(out, batch, stop)
+                batch = []
+                if stop.is_set():
+                    return
+        _put(out, batch, stop)
+    except Exception:
+        log.error(
+            "csv_loader, failed to load '{}' file, skipping it, error: {}".format(
+                path, traceback.format_exc()
+            )
+        )
+    finally:
+        _put(out, _DONE, stop)
+
+
+def _read_directory(path, workers, kwargs):
+    """
+    Generator function to read data items from all CSV files in directory using
+    pool of threads, yielding data items in files' names order.
+
+    :param path: (str) OS path to directory
+    :param workers: (int) number of threads to use
+    :param kwargs: (dict) arguments for ``_read_rows`` function
+    """
+    files = sorted(
+        os.path.join(path, filename)
+        for filename in os.listdir(path)
+        if filename.lower().endswith(".csv")
+        and os.path.isfile(os.path.join(path, filename))
+    )
+    if not files:
+        log.warning("csv_loader, no '*.csv' files found in '{}' directory".format(path))
+        return
+    log.debug(
+        "csv_loader, loading {} files using {} threads".format(len(files), workers)
+    )
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=QUEUE_SIZE) for _ in files]
+    with ThreadPoolExecutor(max_workers=min(workers, len(files))) as executor:
+        try:
+            for filepath, out in zip(files, queues):
+                executor.submit(_read_file_batches, filepath, out, stop, kwargs)
+            for out in queues:
+                while True:
+                    batch = out.get()
+                    if batch is _DONE:
+                        break
+                    yield from batch
+        finally:
+            stop.set()
+
+
+def load_iter(
+    data,
+    templates_dict=None,
+    template_name_key=None,
+    result_name_key=None,
+    filters=None,
+    columns=None,
+    types=None,
+    workers=4,
+    **kwargs,
 ):  # pylint: disable=unused-argument
     """
-    Function to load CSV spreadsheet.
+    Generator function to load CSV data one data item at a time.
 
-    :param data: OS path to CSV text file
+    :param data: OS path to CSV text file, OS path to directory with ``*.csv`` files or
+        CSV text
     :param templates_dict: (dict) dictionary to load templates from spreadsheet, not supported by csv loader
     :param template_name_key: (str) templates column header prefix, not supported by csv loader
-    :param kwargs: (dict) any additional arguments to pass on to ``csv.DictReader``
-        object instantiation
+    :param result_name_key: (str) name of the column to match ``filters`` against
+    :param filters: (list) list of glob patterns, rows with ``result_name_key`` values
+        that do not match any of the patterns skipped
+    :param columns: (list) list of columns names to load, ``template_name_key`` and
+        ``result_name_key`` columns always loaded, by default all columns loaded
+    :param types: (dict) dictionary of ``{header: type}`` to convert columns values,
+        where type is ``int``, ``float``, ``bool`` or callable
+    :param workers: (int) number of threads to use to read files in directory
+    :param kwargs: (dict) any additional arguments to pass on to ``csv.reader`` object
+        instantiation, ``fieldnames``, ``restkey`` and ``restval`` arguments supported
+        with the same meaning as for ``csv.DictReader``
+    :return: yields data items
     """
-    ret = None
-
+    kwargs.update(
+        template_name_key=template_name_key,
+        result_name_key=result_name_key,
+        filters=filters,
+        columns=columns,
+        types=types,
+    )
+    if not isinstance(data, str):
+        raise SystemExit(
+            "csv_loader, unsupported data, should be either OS path to file, directory or text"
+        )
     # load from file
-    if os.path.isfile(data):
-        with open(data, newline="", encoding="UTF-8") as csvfile:
-            reader = csv.DictReader(csvfile, **kwargs)
-            ret = [dict(row) for row in reader]
+    if os.path.isfile(data[:5000]):
+        yield from _read_file(data, **kwargs)
     # load all csv files from folder
-    elif os.path.isdir(data):
-        pass
+    elif os.path.isdir(data[:5000]):
+        yield from _read_directory(data, workers or 1, kwargs)
     # load data text as is using stringio module
-    elif isinstance(data, str):
-        pass
     else:
-        raise SystemExit(
-            "csv_loader, unsupported data, should be either OS path to file, directory or text"
-        )
+        yield from _read_rows(io.StringIO(data, newline=""), **kwargs)
+
 
-    return ret
+def load(
+    data,
+    templates_dict=None,
+    template_name_key=None,
+    result_name_key=None,
+    filters=None,
+    columns=None,
+    types=None,
+    workers=4,
+    **kwargs,
+):  # pylint: disable=unused-argument
+    """
+    Function to load CSV spreadsheet.
+
+    :param data: OS path to CSV text file, OS path to directory with ``*.csv`` files or
+        CSV text
+    :param templates_dict: (dict) dictionary to load templates from spreadsheet, not supported by csv loader
+    :param template_name_key: (str) templates column header prefix, not supported by csv loader
+    :param result_name_key: (str) name of the column to match ``filters`` against
+    :param filters: (list) list of glob patterns, rows with ``result_name_key`` values
+        that do not match any of the patterns skipped
+    :param columns: (list) list of columns names to load, ``template_name_key`` and
+        ``result_name_key`` columns always loaded, by default all columns loaded
+    :param types: (dict) dictionary of ``{header: type}`` to convert columns values,
+        where type is ``int``, ``float``, ``bool`` or callable
+    :param workers: (int) number of threads to use to read files in directory
+    :param kwargs: (dict) any additional arguments to pass on to ``csv.reader`` object
+        instantiation, ``fieldnames``, ``restkey`` and ``restval`` arguments supported
+        with the same meaning as for ``csv.DictReader``
+    :return: list of data items
+    """
+    return list(
+        load_iter(
+            data,
+            template_name_key=template_name_key,
+            result_name_key=result_name_key,
+            filters=filters,
+            columns=columns,
+            types=types,
+            workers=workers,
+            **kwargs,
+        )
+    )
@@ -0,0 +1,163 @@
+"""
+JSON Lines loader
+*****************
+
+**Plugin Name:** ``jsonl``, ``json``
+
+Plugin to load data to render from `JSON Lines <https://jsonlines.org/>`_ files -
+one JSON object per line - or from JSON files containing a list of objects.
+
+JSON Lines files parsed line by line, as a result memory usage stays bounded
+regardless of file size when data rendered using TTR ``run_iter`` method. Files with
+``.json`` extension and text parsed as a single JSON document first - a list of data
+items or a single data item - falling back to parsing them line by line if they are
+not a valid JSON document.
+
+Gzip compressed files, e.g. ``inventory.jsonl.gz``, decompressed on the fly,
+compression detected using file's content rather than extension.
+
+**Prerequisites:**
+
+- Optionally uses `orjson <https://pypi.org/project/orjson/>`_ library to parse
+  JSON if installed, falling back to Python built-in ``json`` module
+
+Sample JSON Lines file content::
+
+    {"device": "rt1", "interface": "Gi1/1", "template": "ttr://simple/interface.cisco_ios.txt"}
+    {"device": "rt2", "interface": "Gi1/2", "template": "ttr://simple/interface.cisco_ios.txt"}
+
+Lines that contain JSON list produce one data item per list element, empty lines
+skipped.
+"""
+import gzip
+import io
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+BUFFER_SIZE = 1024 * 1024  # bytes
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _open(path):
+    """
+    Function to open file for reading in binary mode, decompressing gzip files.
+
+    :param path: (str) OS path to file
+    :return: binary file object, caller responsible for closing it
+    """
+    f = open(path, "rb", buffering=BUFFER_SIZE)  # pylint: disable=consider-using-with
+    if f.peek(2)[:2] != GZIP_MAGIC:
+        return f
+    f.close()
+    return io.BufferedReader(gzip.open(path, "rb"), BUFFER_SIZE)
+
+
+def _is_json_file(path):
+    """
+    Function to check if file has ``.json`` or ``.json.gz`` extension.
+
+    :param path: (str) OS path to file
+    """
+    path = path.lower()
+    return path.endswith(".json") or path.endswith(".json.gz")
+
+
+def _iter_document(content, source):
+    """
+    Generator function to parse content as a single JSON document, falling back to
+    parsing it as JSON Lines.
+
+    :param content: (bytes) JSON document or JSON Lines content
+    :param source: (str) data source name for logging
+    :return: yields data items
+    """
+    try:
+        document = loads(content)
+    except ValueError:
+        yield from _iter_lines(io.BytesIO(content), source)
+        return
+    if isinstance(document, list):
+        yield from document
+    elif document is not None:
+        yield document
+
+
+def _iter_lines(stream, source):
+    """
+    Generator function to parse JSON lines.
+
+    :param stream: (obj) binary file object
+    :param source: (str) data source name for logging
+    :return: yields data items
+    """
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            item = loads(line)
+        except ValueError as e:
+            log.error(
+                "jsonl_loader, '{}' line {} is not valid JSON, skipping it, error: {}".format(
+                    source, line_number, e
+                )
+            )
+            continue
+        if isinstance(item, list):
+            yield from item
+        else:
+            yield item
+
+
+def load_iter(
+    data, templates_dict=None, template_name_key=None, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Generator function to load JSON Lines data line by line from file or from string.
+
+    :param data: string, OS path to ``.jsonl``, ``.json`` or gzip compressed file or
+        JSON Lines text
+    :param templates_dict: (dict) dictionary to load templates from spreadsheet, not supported by jsonl loader
+    :param template_name_key: (str) templates column header prefix, not supported by jsonl loader
+    :param kwargs: (dict) any additional arguments are ignored
+    :return: yields data items
+    """
+    if not isinstance(data, str):
+        raise SystemExit(
+            "jsonl_loader, unsupported data, should be either OS path to file or text"
+        )
+    # load from file
+    if "\n" not in data and os.path.isfile(data):
+        stream = _open(data)
+        try:
+            if _is_json_file(data):
+                yield from _iter_document(stream.read(), data)
+            else:
+                yield from _iter_lines(stream, data)
+        finally:
+            stream.close()
+    # load text as is
+    else:
+        yield from _iter_document(data.encode("utf-8"), "text")
+
+
+def load(
+    data, templates_dict=None, template_name_key=None, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Function to load JSON Lines data from file or from string.
+
+    :param data: string, OS path to ``.jsonl``, ``.json`` or gzip compressed file or
+        JSON Lines text
+    :param templates_dict: (dict) dictionary to load templates from spreadsheet, not supported by jsonl loader
+    :param template_name_key: (str) templates column header prefix, not supported by jsonl loader
+    :param kwargs: (dict) any additional arguments are ignored
+    :return: list of data items
+    """
+    return list(load_iter(data))
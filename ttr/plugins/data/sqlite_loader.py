@@ -0,0 +1,321 @@
+"""
+SQLite loader
+*************
+
+**Plugin Name:** ``sqlite``, ``sqlite3``, ``db``
+
+Plugin to load data to render from SQLite database tables or from results of SQL
+query. Rows fetched from database in batches of ``batch_size`` rows, such that big
+tables can be rendered using TTR ``run_iter`` method without loading them in memory
+as a whole.
+
+By default all database tables loaded in tables creation order, except for
+templates table. Same as for spreadsheets, tables must contain a column or multiple
+columns with names starting with ``template_name_key``, tables without such a
+column skipped.
+
+Sample usage::
+
+    from ttr import ttr
+
+    # load all tables
+    gen = ttr("./inventory.sqlite")
+
+    # load single table
+    gen = ttr("./inventory.sqlite", data_plugin_kwargs={"table": "interfaces"})
+
+    # load SQL query results
+    gen = ttr(
+        "./inventory.sqlite",
+        data_plugin_kwargs={
+            "query": "SELECT * FROM interfaces WHERE site = ?",
+            "params": ["site1"],
+        },
+    )
+
+**Filtering pushdown**
+
+``filtering`` processor glob patterns translated into SQL ``GLOB`` conditions
+against columns with names starting with ``result_name_key``, as a result rows
+filtered by SQLite and never fetched. Patterns that cannot be translated into
+equivalent ``GLOB`` patterns disable such a pushdown, ``filtering`` processor
+filters data in that case.
+
+**Templates**
+
+If database contains ``templates`` table with ``name`` and ``template`` columns,
+templates loaded from it, for example::
+
+    CREATE TABLE templates (name TEXT PRIMARY KEY, template TEXT);
+    INSERT INTO templates VALUES ('interface', 'interface {{ interface }}');
+
+Database can also be used as TTR ``templates`` argument to load templates by name.
+"""
+import logging
+import os
+import re
+import sqlite3
+from urllib.request import pathname2url
+
+from ...utils.compact_rows import RowsSchema
+from ...utils.pushdown import make_projection
+
+log = logging.getLogger(__name__)
+
+GLOB_SET_RE = re.compile(r"\[(!?)([^\[\]!^]+)\]")
+
+
+def connect(path):
+    """
+    Function to open SQLite database in read-only mode.
+
+    :param path: (str) OS path to database file
+    :return: ``sqlite3.Connection`` object
+    """
+    return sqlite3.connect(
+        "file:{}?mode=ro".format(pathname2url(os.path.abspath(path))), uri=True
+    )
+
+
+def _quote(name):
+    """
+    Function to quote SQL identifier.
+    """
+    return '"{}"'.format(str(name).replace('"', '""'))
+
+
+def _literal(value):
+    """
+    Function to form SQL string literal.
+    """
+    return "'{}'".format(str(value).replace("'", "''"))
+
+
+def to_glob(pattern):
+    """
+    Function to translate ``fnmatch`` pattern into equivalent SQLite ``GLOB`` pattern.
+
+    :param pattern: (str) ``fnmatch`` glob pattern
+    :return: ``GLOB`` pattern string or None if pattern cannot be translated
+    """
+    pattern = str(pattern)
+    ret = []
+    position = 0
+    for match in GLOB_SET_RE.finditer(pattern):
+        ret.append(pattern[position : match.start()])
+        ret.append("[{}{}]".format("^" if match.group(1) else "", match.group(2)))
+        position = match.end()
+    ret.append(pattern[position:])
+    # unmatched or complex character sets not supported
+    if any("[" in i for i in ret[::2]):
+        return None
+    return "".join(ret)
+
+
+def _make_where(headers, result_name_key, filters):
+    """
+    Function to form SQL ``WHERE`` clause to filter rows by ``result_name_key`` values.
+
+    Rows kept if any of the columns with names starting with ``result_name_key``
+    matches any of the patterns or contains non text value, same as
+    ``ttr.utils.pushdown.make_row_filter`` does.
+
+    :param headers: (list) list of columns names
+    :param result_name_key: (str) name of ``result_name_key`` column
+    :param filters: (list) list of glob patterns
+    :return: ``WHERE`` clause string, empty if no filtering can be done
+    """
+    if not result_name_key or not filters or not any(filters):
+        return ""
+    globs = [to_glob(pattern) for pattern in filters]
+    if None in globs:
+        log.debug(
+            "sqlite_loader, filters '{}' cannot be translated to GLOB".format(filters)
+        )
+        return ""
+    conditions = []
+    for header in headers:
+        if not header.startswith(result_name_key):
+            continue
+        conditions.append("typeof({}) != 'text'".format(_quote(header)))
+        conditions.extend(
+            "{} GLOB {}".format(_quote(header), _literal(glob)) for glob in globs
+        )
+    return " WHERE {}".format(" OR ".join(conditions)) if conditions else ""
+
+
+def load_templates(connection, templates_dict, templates_table="templates"):
+    """
+    Function to load all templates from templates table.
+
+    :param connection: (obj) ``sqlite3.Connection`` object
+    :param templates_dict: (dict) dictionary to load templates in
+    :param templates_table: (str) name of templates table
+    :return: True if templates table exists, False otherwise
+    """
+    exists = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?",
+        (templates_table,),
+    ).fetchone()
+    if not exists:
+        return False
+    # table name quoted as SQL identifier, connection is read-only
+    templates_sql = "SELECT name, template FROM {}".format(  # nosec B608
+        _quote(templates_table)
+    )
+    templates_dict.update(connection.execute(templates_sql).fetchall())
+    return True
+
+
+def _iter_source(
+    connection,
+    source,
+    name,
+    params,
+    template_name_key,
+    result_name_key,
+    filters,
+    columns,
+    batch_size,
+):
+    """
+    Generator function to fetch rows from table or query.
+
+    :param source: (str) table name or query SQL to select rows from
+    :param name: (str) table name or ``query`` for logging
+    :return: yields data items
+    """
+    # source is quoted table name or query given by user, values passed as parameters,
+    # connection is read-only
+    cursor = connection.execute(
+        "SELECT * FROM {} LIMIT 0".format(source), params or ()  # nosec B608
+    )
+    headers = [i[0] for i in cursor.description]
+    if not any(header.startswith(template_name_key) for header in headers):
+        log.warning(
+            "sqlite_loader, no '{}' column in '{}', skipping it".format(
+                template_name_key, name
+            )
+        )
+        return
+    indexes = make_projection(headers, columns, template_name_key, result_name_key)
+    if indexes is not None:
+        selected = [headers[index] for index in indexes]
+    else:
+        selected = headers
+    # headers quoted as SQL identifiers, filters formed using _literal
+    sql = "SELECT {} FROM {}{}".format(  # nosec B608
+        ", ".join(_quote(header) for header in selected),
+        source,
+        _make_where(headers, result_name_key, filters),
+    )
+    log.debug("sqlite_loader, loading data using SQL: {}".format(sql))
+    cursor = connection.execute(sql, params or ())
+    schema = RowsSchema(selected)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        for row in rows:
+            yield schema.make_row(row)
+
+
+def load_iter(
+    data,
+    templates_dict=None,
+    template_name_key="template",
+    table=None,
+    query=None,
+    params=None,
+    result_name_key=None,
+    filters=None,
+    columns=None,
+    batch_size=1000,
+    templates_table="templates",
+    **kwargs,
+):  # pylint: disable=unused-argument
+    """
+    Generator function to load data from SQLite database in batches of rows.
+
+    :param data: (str) OS path to SQLite database file
+    :param templates_dict: (dict) dictionary to load templates from templates table
+    :param template_name_key: (str) templates column name prefix
+    :param table: (str) name of table or view to load, by default all tables loaded
+    :param query: (str) SQL query to load results of, takes precedence over ``table``
+    :param params: (list or dict) parameters for SQL query placeholders
+    :param result_name_key: (str) name of the column to match ``filters`` against
+    :param filters: (list) list of glob patterns to filter rows using SQL ``GLOB``
+    :param columns: (list) list of columns names to load, ``template_name_key`` and
+        ``result_name_key`` columns always loaded, by default all columns loaded
+    :param batch_size: (int) number of rows to fetch from database at a time
+    :param templates_table: (str) name of templates table
+    :param kwargs: (dict) any additional arguments ignored
+    :return: yields data items
+    """
+    if not isinstance(data, str) or not os.path.isfile(data):
+        raise SystemExit(
+            "sqlite_loader, unsupported data, should be OS path to SQLite database file"
+        )
+    connection = connect(data)
+    try:
+        if templates_dict is not None:
+            load_templates(connection, templates_dict, templates_table)
+        if query:
+            sources = [("({})".format(query), "query", params)]
+        elif table:
+            sources = [(_quote(table), table, None)]
+        else:
+            sources = [
+                (_quote(name), name, None)
+                for (name,) in connection.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND "
+                    "name NOT LIKE 'sqlite_%' AND name != ? ORDER BY rowid",
+                    (templates_table,),
+                )
+            ]
+        for source, name, source_params in sources:
+            yield from _iter_source(
+                connection,
+                source,
+                name,
+                source_params,
+                template_name_key,
+                result_name_key,
+                filters,
+                columns,
+                batch_size,
+            )
+    finally:
+        connection.close()
+
+
+def load(
+    data,
+    templates_dict=None,
+    template_name_key="template",
+    result_name_key=None,
+    filters=None,
+    **kwargs,
+):
+    """
+    Function to load data from SQLite database.
+
+    :param data: (str) OS path to SQLite database file
+    :param templates_dict: (dict) dictionary to load templates from templates table
+    :param template_name_key: (str) templates column name prefix
+    :param result_name_key: (str) name of the column to match ``filters`` against
+    :param filters: (list) list of glob patterns to filter rows using SQL ``GLOB``
+    :param kwargs: (dict) ``table``, ``query``, ``params``, ``columns``,
+        ``batch_size`` and ``templates_table`` arguments for ``load_iter`` function
+    :return: list of data items
+    """
+    return list(
+        load_iter(
+            data,
+            templates_dict=templates_dict,
+            template_name_key=template_name_key,
+            result_name_key=result_name_key,
+            filters=filters,
+            **kwargs,
+        )
+    )
@@ -30,6 +30,73 @@ First row in the spreadsheet must contain headers, otherwise spreadsheet not loa
 
 .. note:: empty cells loaded with value of ``None``
 
+.. note:: to reduce memory usage, rows loaded as ``ttr.utils.compact_rows.Row``
+    objects that share headers across all rows of the same tab and behave
+    like dictionaries
+
+**Parsing backends**
+
+By default spreadsheets parsed using ``openpyxl`` library. Alternatively, ``stdlib``
+backend can be used to read workbook zip archive directly using Python standard library
+``ttr.utils.xlsx_reader`` module - shared strings parsed once and each sheet streamed
+row by row, producing the same data as ``openpyxl`` backend faster. Backend selected
+using ``data_plugin_kwargs``::
+
+    from ttr import ttr
+
+    gen = ttr("./path/to/table.xlsx", data_plugin_kwargs={"backend": "stdlib"})
+
+**Snapshot cache**
+
+Parsed sheets can be cached in SQLite database by supplying ``snapshot_cache``
+argument, on subsequent runs only sheets that changed since previous run parsed,
+while the rest of the sheets loaded from their snapshots using
+``ttr.utils.xlsx_snapshot_cache`` module::
+
+    from ttr import ttr
+
+    gen = ttr(
+        "./path/to/table.xlsx",
+        data_plugin_kwargs={"snapshot_cache": "./cache/ttr_xlsx_snapshots.sqlite"},
+    )
+
+TTR CLI tool uses snapshot cache when ``--cache-dir`` argument provided.
+
+**Parallel loading**
+
+Sheets of big multi-tab workbooks can be parsed concurrently using a pool of
+``workers`` processes, each process opens the workbook in read-only mode and parses
+sheets assigned to it. Loaded data combined in original sheets order, as a result
+produced data is the same as when sheets parsed one by one::
+
+    from ttr import ttr
+
+    gen = ttr("./path/to/table.xlsx", data_plugin_kwargs={"workers": 4})
+
+Workers can be combined with snapshot cache, in which case only sheets without
+valid snapshot parsed by workers.
+
+**Streaming**
+
+TTR ``run_iter`` method uses ``load_iter`` function to read data tabs rows one by
+one, templates tabs loaded before any of the rows produced. Memory usage bounded by
+the rows of single result if rows grouped by ``result_name_key`` values::
+
+    from ttr import ttr
+
+    gen = ttr(returner="file", returner_kwargs={"result_dir": "./Output/"})
+    for result_name, text in gen.run_iter(data="./path/to/table.xlsx"):
+        print("{} saved".format(result_name))
+
+**Filtering and columns pushdown**
+
+If ``filtering`` processor used and all processors before it listed in
+``ttr.ttr.PUSHDOWN_SAFE_PROCESSORS``, TTR passes ``filters`` and ``result_name_key``
+to this plugin, so that rows that ``filtering`` processor would drop skipped while
+reading sheets, without creating data items for them. In addition, ``columns``
+argument can be supplied in ``data_plugin_kwargs`` to load only listed columns, refer
+to ``ttr.utils.pushdown`` module for details.
+
 Sample spreadsheet table that contains details for interfaces configuration:
 
 +--------+-----------+-----+------+----------+------+--------------------------------------+
@@ -163,34 +230,50 @@ and device B configurations or forward and rollback configurations etc.
 """
 
 import logging
+import multiprocessing
+import os
 import traceback
 
 from ..templates import templates_loaders_plugins
+from ...utils import workbook_cache
+from ...utils.compact_rows import RowsSchema
+from ...utils.pushdown import pushdown
+from ...utils.xlsx_reader import XlsxWorkbook
+from ...utils.xlsx_snapshot_cache import SnapshotCache, hash_sheets
 
 log = logging.getLogger(__name__)
 
-try:
-    from openpyxl import load_workbook
 
-except ImportError:
-    log.error("ttr:xlsx_loader failed to import openpyxl module")
-
-
-def load_data_from_sheet(sheet, ret, template_name_key):
+def load_data_from_sheet(
+    sheet, ret, template_name_key, snapshot=None, **pushdown_kwargs
+):
     """
     Function to load data from sheet
 
-    :param sheet: (obj) openpyxl workbook sheet object
+    :param sheet: (obj) openpyxl workbook sheet object or ``ttr.utils.xlsx_reader``
+        worksheet object
     :param ret: (list) list to append loading results to
     :param template_name_key: (str) templates column header name
+    :param snapshot: (list) optional list to append ``(headers, rows tuples)`` to
+    :param pushdown_kwargs: (dict) ``result_name_key``, ``filters`` and ``columns``
+        arguments for ``ttr.utils.pushdown.pushdown`` function
+    """
+    ret.extend(
+        iter_data_from_sheet(sheet, template_name_key, snapshot, **pushdown_kwargs)
+    )
+
+
+def iter_data_from_sheet(sheet, template_name_key, snapshot=None, **pushdown_kwargs):
     """
+    Generator function to load data from sheet row by row, refer to
+    ``load_data_from_sheet`` function for arguments description.
+
+    :return: yields data items
+    """
+    # read headers and data rows in a single pass over the sheet
+    rows = sheet.iter_rows(values_only=True)
     try:
-        headers = []
-        for i in range(1, sheet.max_column + 1):
-            if sheet.cell(row=1, column=i).value is None:
-                headers.append(None)
-            else:
-                headers.append(sheet.cell(row=1, column=i).value)
+        headers = list(next(rows, ()))
         # strip spaces if any
         headers = [i.strip() if isinstance(i, str) else i for i in headers]
         # check headers
@@ -230,12 +313,177 @@ def load_data_from_sheet(sheet, ret, template_name_key):
             sheet.title, headers
         )
     )
-    for row in sheet.iter_rows(min_row=2, values_only=True):
+    if snapshot is not None:
+        rows = list(rows)
+        snapshot.append((headers, rows))
+    headers, rows = pushdown(headers, rows, template_name_key, **pushdown_kwargs)
+    schema = RowsSchema(headers)
+    for row in rows:
         # from data item
-        ret.append(dict(zip(headers, row)))
+        yield schema.make_row(row)
 
 
-def load(data, templates_dict, template_name_key, **kwargs):
+def _parse_sheet(wb, sheet_name, template_name_key):
+    """
+    Helper function to parse single sheet into a snapshot tuple.
+
+    :param wb: (obj) workbook object
+    :param sheet_name: (str) name of the sheet to parse
+    :param template_name_key: (str) templates column header prefix
+    :return: ``("templates", templates dictionary)`` tuple for templates tabs or
+        ``("data", headers, rows tuples)`` tuple for data tabs, where headers is
+        None if sheet was skipped
+    """
+    if "TEMPLATE" in sheet_name.upper():
+        tab_templates = {}
+        templates_loaders_plugins["xlsx"](tab_templates, sheet=wb[sheet_name])
+        return ("templates", tab_templates)
+    parsed = []
+    load_data_from_sheet(wb[sheet_name], [], template_name_key, snapshot=parsed)
+    return ("data",) + (parsed[0] if parsed else (None, []))
+
+
+def _apply_snapshot(
+    snapshot, ret, workbook_templates, template_name_key, pushdown_kwargs
+):
+    """
+    Helper function to add sheet snapshot content to loaded data or templates.
+
+    :param snapshot: (tuple) sheet snapshot produced by ``_parse_sheet`` function
+    :param ret: (list) list to append data items to
+    :param workbook_templates: (dict) dictionary to add templates to
+    :param template_name_key: (str) templates column header prefix
+    :param pushdown_kwargs: (dict) arguments for ``ttr.utils.pushdown.pushdown``
+    """
+    if snapshot[0] == "templates":
+        workbook_templates.update(snapshot[1])
+    elif snapshot[1] is not None:
+        headers, rows = pushdown(
+            snapshot[1], snapshot[2], template_name_key, **pushdown_kwargs
+        )
+        schema = RowsSchema(headers)
+        ret.extend(schema.make_row(row) for row in rows)
+
+
+_worker_workbook = None
+
+
+def _init_worker(data, backend, kwargs):
+    """
+    Function to open workbook once per worker process.
+    """
+    global _worker_workbook  # pylint: disable=global-statement
+    _worker_workbook = workbook_cache.open_workbook(data, backend, **kwargs)
+
+
+def _parse_sheet_worker(args):
+    """
+    Function to parse sheet in worker process.
+
+    :param args: (tuple) ``(sheet name, template name key)`` tuple
+    """
+    return _parse_sheet(_worker_workbook, *args)
+
+
+def _parse_sheets(data, sheet_names, template_name_key, backend, workers, kwargs):
+    """
+    Helper function to parse several sheets, using a pool of processes if more
+    than one worker requested.
+
+    :param data: (str) OS path to ``.xlsx`` file
+    :param sheet_names: (list) names of sheets to parse
+    :param template_name_key: (str) templates column header prefix
+    :param backend: (str) spreadsheet parsing backend
+    :param workers: (int) maximum number of processes to use
+    :param kwargs: (dict) arguments for openpyxl ``load_workbook`` function
+    :return: list of snapshot tuples in ``sheet_names`` order
+    """
+    if not sheet_names:
+        return []
+    workers = min(workers or 1, len(sheet_names))
+    if workers > 1:
+        log.debug(
+            "XLSX loader, parsing {} tabs using {} processes".format(
+                len(sheet_names), workers
+            )
+        )
+        try:
+            with multiprocessing.Pool(
+                processes=workers,
+                initializer=_init_worker,
+                initargs=(data, backend, kwargs),
+            ) as pool:
+                return pool.map(
+                    _parse_sheet_worker,
+                    [(sheet_name, template_name_key) for sheet_name in sheet_names],
+                )
+        except Exception as e:
+            log.warning(
+                "XLSX loader, failed to parse tabs in parallel, parsing them one "
+                "by one, error: {}".format(e)
+            )
+    wb = workbook_cache.open_workbook(data, backend, **kwargs)
+    return [
+        _parse_sheet(wb, sheet_name, template_name_key) for sheet_name in sheet_names
+    ]
+
+
+def _load_with_snapshots(
+    data, template_name_key, backend, kwargs, snapshot_cache, stats, parse_sheets
+):
+    """
+    Helper function to load sheets from snapshot cache, parsing only sheets which
+    snapshots are missing or outdated.
+
+    :param data: (str) OS path to ``.xlsx`` file
+    :param template_name_key: (str) templates column header prefix
+    :param backend: (str) spreadsheet parsing backend
+    :param kwargs: (dict) arguments for openpyxl ``load_workbook`` function
+    :param snapshot_cache: (str) OS path to snapshot cache SQLite database file
+    :param stats: (dict) dictionary to count snapshot ``hits`` and ``misses`` in
+    :param parse_sheets: (callable) function to parse list of sheets into snapshots
+    :return: list of sheets snapshots in workbook sheets order
+    """
+    # snapshots content depends on parsing backend and its arguments
+    salt = "{}:{}:{!r}".format(template_name_key, backend, sorted(kwargs.items()))
+    keys = hash_sheets(data, salt=salt)
+    with SnapshotCache(snapshot_cache) as cache:
+        snapshots = {}
+        for sheet_name, key in keys.items():
+            if sheet_name.startswith("#"):
+                log.debug("XLSX loader, skipping tab - '{}'".format(sheet_name))
+                continue
+            snapshots[sheet_name] = cache.get(data, sheet_name, key)
+            if snapshots[sheet_name] is not None:
+                stats["hits"] += 1
+                log.debug(
+                    "XLSX loader, loaded tab '{}' from snapshot".format(sheet_name)
+                )
+            else:
+                stats["misses"] += 1
+
+        # parse sheets that have no valid snapshot
+        misses = [name for name, snapshot in snapshots.items() if snapshot is None]
+        for sheet_name, snapshot in zip(misses, parse_sheets(misses)):
+            cache.update(data, sheet_name, keys[sheet_name], snapshot)
+            snapshots[sheet_name] = snapshot
+
+    return list(snapshots.values())
+
+
+def load(
+    data,
+    templates_dict,
+    template_name_key,
+    backend="openpyxl",
+    snapshot_cache=None,
+    stats=None,
+    workers=None,
+    result_name_key=None,
+    filters=None,
+    columns=None,
+    **kwargs,
+):
     """
     Function to load XLSX spreadsheet. Takes OS path to ``.xlsx`` file
     and returns list of dictionaries, where keys equal to headers
@@ -244,23 +492,181 @@ def load(data, templates_dict, template_name_key, **kwargs):
     :param data: string, OS path to ``.xlsx`` file
     :param templates_dict: dictionary to load templates from spreadsheet
     :param template_name_key: string, templates column header prefix
+    :param backend: string, spreadsheet parsing backend - ``openpyxl`` (default) or
+        ``stdlib`` to parse workbook using ``ttr.utils.xlsx_reader`` module that relies
+        on Python standard library only
+    :param snapshot_cache: string, OS path to SQLite database file to cache parsed
+        sheets snapshots in, only sheets that changed since previous run parsed
+    :param stats: dictionary to count snapshot cache ``hits`` and ``misses`` in
+    :param workers: integer, number of processes to use to parse sheets in parallel,
+        sheets parsed one by one if not greater than 1
+    :param result_name_key: string, name of the column to match ``filters`` against
+    :param filters: list of glob patterns, rows with ``result_name_key`` values that
+        do not match any of the patterns skipped
+    :param columns: list of columns names to load, ``template_name_key`` and
+        ``result_name_key`` columns always loaded, by default all columns loaded
+    :param kwargs: any additional arguments to pass on to openpyxl ``load_workbook``
+        function, ignored by ``stdlib`` backend
+
+    Templates loaded from workbook templates tabs cached using
+    ``ttr.utils.workbook_cache`` module, such that xlsx templates loader does
+    not need to open the same spreadsheet again. Workbook closed once loaded,
+    unless loaded within outer ``workbook_cache.scope``.
+    """
+    with workbook_cache.scope():
+        return _load(
+            data,
+            templates_dict,
+            template_name_key,
+            backend,
+            snapshot_cache,
+            stats,
+            workers,
+            {
+                "result_name_key": result_name_key,
+                "filters": filters,
+                "columns": columns,
+            },
+            kwargs,
+        )
+
+
+def _load(
+    data,
+    templates_dict,
+    template_name_key,
+    backend,
+    snapshot_cache,
+    stats,
+    workers,
+    pushdown_kwargs,
+    kwargs,
+):
+    """
+    Helper function to load XLSX spreadsheet, refer to ``load`` function for
+    arguments description.
     """
     ret = []
+    workbook_templates = {}
+    is_file = isinstance(data, (str, os.PathLike)) and os.path.isfile(data)
+
+    def parse_sheets(sheet_names):
+        # workers need a file path to open workbook with
+        return _parse_sheets(
+            data,
+            sheet_names,
+            template_name_key,
+            backend,
+            workers if is_file else None,
+            kwargs,
+        )
 
-    kwargs.setdefault("data_only", True)
-    kwargs.setdefault("read_only", True)
+    if snapshot_cache or (workers and workers > 1 and is_file):
+        if snapshot_cache:
+            if stats is None:
+                stats = {}
+            stats.setdefault("hits", 0)
+            stats.setdefault("misses", 0)
+            snapshots = _load_with_snapshots(
+                data,
+                template_name_key,
+                backend,
+                kwargs,
+                snapshot_cache,
+                stats,
+                parse_sheets,
+            )
+        else:
+            # list sheets without parsing shared strings or styles
+            with XlsxWorkbook(data) as wb:
+                sheet_names = [i for i in wb.sheetnames if not i.startswith("#")]
+            snapshots = parse_sheets(sheet_names)
+        for snapshot in snapshots:
+            _apply_snapshot(
+                snapshot, ret, workbook_templates, template_name_key, pushdown_kwargs
+            )
+    else:
+        # workbook shared with xlsx templates loader, opened at most once per file version
+        wb = workbook_cache.open_workbook(data, backend, **kwargs)
 
-    wb = load_workbook(data, **kwargs)
+        for sheet_name in wb.sheetnames:
 
-    for sheet_name in wb.sheetnames:
+            if sheet_name.startswith("#"):
+                log.debug("XLSX loader, skipping tab - '{}'".format(sheet_name))
+                continue
 
-        if sheet_name.startswith("#"):
-            log.debug("XLSX loader, skipping tab - '{}'".format(sheet_name))
-            continue
+            if "TEMPLATE" in sheet_name.upper():
+                templates_loaders_plugins["xlsx"](
+                    workbook_templates, sheet=wb[sheet_name]
+                )
+            else:
+                load_data_from_sheet(
+                    wb[sheet_name], ret, template_name_key, **pushdown_kwargs
+                )
 
-        if "TEMPLATE" in sheet_name.upper():
-            templates_loaders_plugins["xlsx"](templates_dict, sheet=wb[sheet_name])
-        else:
-            load_data_from_sheet(wb[sheet_name], ret, template_name_key)
+    # cache templates for xlsx templates loader to not load them again
+    workbook_cache.set_templates(data, workbook_templates)
+    templates_dict.update(workbook_templates)
 
     return ret
+
+
+def load_iter(
+    data,
+    templates_dict,
+    template_name_key,
+    backend="openpyxl",
+    snapshot_cache=None,
+    workers=None,
+    result_name_key=None,
+    filters=None,
+    columns=None,
+    **kwargs,
+):
+    """
+    Generator function to load XLSX spreadsheet row by row, used by TTR ``run_iter``
+    method to render spreadsheets without loading all their rows in memory.
+
+    Templates tabs loaded first, after that rows of data tabs produced as they read
+    from the workbook. If ``snapshot_cache`` or more than one ``workers`` requested,
+    spreadsheet loaded as a whole using ``load`` function.
+
+    Refer to ``load`` function for arguments description.
+
+    :return: yields data items
+    """
+    if snapshot_cache or (workers and workers > 1):
+        yield from load(
+            data,
+            templates_dict,
+            template_name_key,
+            backend=backend,
+            snapshot_cache=snapshot_cache,
+            workers=workers,
+            result_name_key=result_name_key,
+            filters=filters,
+            columns=columns,
+            **kwargs,
+        )
+        return
+    kwargs.pop("stats", None)
+    with workbook_cache.scope():
+        wb = workbook_cache.open_workbook(data, backend, **kwargs)
+        sheet_names = [i for i in wb.sheetnames if not i.startswith("#")]
+        workbook_templates = {}
+        for sheet_name in sheet_names:
+            if "TEMPLATE" in sheet_name.upper():
+                templates_loaders_plugins["xlsx"](
+                    workbook_templates, sheet=wb[sheet_name]
+                )
+        workbook_cache.set_templates(data, workbook_templates)
+        templates_dict.update(workbook_templates)
+        for sheet_name in sheet_names:
+            if "TEMPLATE" not in sheet_name.upper():
+                yield from iter_data_from_sheet(
+                    wb[sheet_name],
+                    template_name_key,
+                    result_name_key=result_name_key,
+                    filters=filters,
+                    columns=columns,
+                )
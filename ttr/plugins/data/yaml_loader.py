@@ -9,6 +9,28 @@ YAML loader
 - Requires PyYAML library
 
 Plugin to load data to render from YAML structured text.
+
+If PyYAML compiled with `libyaml <https://pyyaml.org/wiki/LibYAML>`_ bindings,
+``CSafeLoader`` used to parse YAML, falling back to pure Python ``SafeLoader``
+otherwise.
+
+**Multiple documents**
+
+YAML text can contain multiple documents separated by ``---`` lines, each document
+either a list of data items or a single data item, for example one document per
+device::
+
+    device: rt1
+    interface: Gi1/1
+    template: ttr://simple/interface.cisco_ios.txt
+    ---
+    device: rt2
+    interface: Gi1/2
+    template: ttr://simple/interface.cisco_ios.txt
+
+``load_iter`` function parses such a text one document at a time yielding data
+items, TTR ``run_iter`` method uses it to render big YAML files without loading
+them in memory as a whole.
 """
 import logging
 import os
@@ -16,37 +38,77 @@ import os
 log = logging.getLogger(__name__)
 
 try:
-    from yaml import safe_load
+    from yaml import load_all, SafeLoader
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        Loader = SafeLoader
 except ImportError:
     log.error(
         "yaml_loader: failed to import YAML module, install: 'python -m pip install pyyaml'"
     )
 
 
-def load(
-    data, templates_dict=None, template_name_key=None, **kwargs
+def _is_file(data):
+    """
+    Function to check if data is an OS path to file rather than YAML text.
+
+    :param data: (str) OS path to file or YAML text
+    """
+    return "\n" not in data and len(data) < 4096 and os.path.isfile(data)
+
+
+def load_iter(
+    data, templates_dict=None, template_name_key=None, loader=None, **kwargs
 ):  # pylint: disable=unused-argument
     """
-    Function to load YAML data from text file or from string. Text file should have
-    ``.yml`` or ``.yaml`` extension to properly detect loader.
+    Generator function to load YAML documents one by one from text file or from
+    string, yielding data items.
 
     :param data: string, OS path to text file or YAML structured text
     :param templates_dict: (dict) dictionary to load templates from spreadsheet, not supported by yaml loader
     :param template_name_key: (str) templates column header prefix, not supported by yaml loader
+    :param loader: PyYAML loader class to use, default is ``CSafeLoader`` if
+        available, ``SafeLoader`` otherwise
     :param kwargs: (dict) any additional arguments are ignored
+    :return: yields items of documents that are lists, documents that are
+        dictionaries yielded as is, empty documents skipped
     """
-    ret = None
+    if not isinstance(data, str):
+        raise SystemExit(
+            "yaml_loader, unsupported data, should be either OS path to file or text"
+        )
+
+    def iter_documents(stream):
+        for document in load_all(stream, Loader=loader or Loader):
+            if isinstance(document, list):
+                yield from document
+            elif document is not None:
+                yield document
 
     # load from file
-    if os.path.isfile(data[:1000]):
-        with open(data, newline="", encoding="UTF-8") as yamlfile:
-            ret = safe_load(yamlfile)
+    if _is_file(data):
+        with open(data, encoding="UTF-8") as yamlfile:
+            yield from iter_documents(yamlfile)
     # load as is
-    elif isinstance(data, str):
-        ret = safe_load(data)
     else:
-        raise SystemExit(
-            "yaml_loader, unsupported data, should be either OS path to file or text"
-        )
+        yield from iter_documents(data)
+
+
+def load(
+    data, templates_dict=None, template_name_key=None, loader=None, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Function to load YAML data from text file or from string. Text file should have
+    ``.yml`` or ``.yaml`` extension to properly detect loader.
 
-    return ret
+    :param data: string, OS path to text file or YAML structured text
+    :param templates_dict: (dict) dictionary to load templates from spreadsheet, not supported by yaml loader
+    :param template_name_key: (str) templates column header prefix, not supported by yaml loader
+    :param loader: PyYAML loader class to use, default is ``CSafeLoader`` if
+        available, ``SafeLoader`` otherwise
+    :param kwargs: (dict) any additional arguments are ignored
+    :return: list of data items loaded from all YAML documents
+    """
+    return list(load_iter(data, loader=loader))
@@ -1,3 +1,11 @@
-from . import yangson_model_loader
+from .. import LazyPluginsRegistry
 
-models_loaders_plugins = {"yangson": yangson_model_loader.load}
+models_loaders_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.models",
+    plugins={
+        "yangson": ".yangson_model_loader:load",
+        "yangson_compiled": ".yangson_model_loader:load",
+        "jsonschema": ".jsonschema_model_loader:load",
+    },
+    package=__name__,
+)
@@ -0,0 +1,77 @@
+"""
+JSON Schema Models Loader
+*************************
+
+**Reference name** ``jsonschema``
+
+This plugin loads JSON Schema models from ``*.json`` files and compiles them into
+validation functions using ``jsonschema`` validation plugin.
+
+File name without ``.json`` extension used as a reference name for the model.
+
+For example, this is directory tree with JSON Schema models inside::
+
+    |-- Models
+        |-- interface.json
+        |-- vrf.json
+
+Above directory structure translated to two models named ``interface`` and ``vrf``, these
+names can be used to reference models in data for validation, e.g.::
+
+    - interface: Gi1/1
+      vid: 100
+      device: R1
+      template: interfaces.cisco_ios
+      model: interface # JSON Schema model name to validate this data item
+
+.. autofunction:: ttr.plugins.models.jsonschema_model_loader.load
+"""
+import json
+import logging
+import os
+
+from ..validate.validate_jsonschema import compile_schema
+
+log = logging.getLogger(__name__)
+
+
+def load(
+    models_dict, models_dir, models=None, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Loads JSON Schema models from files and compiles them into validation functions.
+
+    :param models_dict: (dict) dictionary to store compiled models at
+    :param models_dir: (str) OS path to directory with ``*.json`` JSON Schema files
+    :param models: (list) names of models to load, loads all models if not provided
+    :param kwargs: (dict) any additional arguments ignored, models compiled on each
+        load, as such models ``cache`` not in use
+    :param return: None
+    """
+    if models is None:
+        models = [
+            filename[: -len(".json")]
+            for filename in sorted(os.listdir(models_dir))
+            if filename.endswith(".json")
+        ]
+
+    for model_name in models:
+        if model_name in models_dict:
+            log.debug(
+                "ttr:jsonschema_model_loader model '{}' already loaded, skipping".format(
+                    model_name
+                )
+            )
+            continue
+        path = os.path.join(models_dir, "{}.json".format(model_name))
+        if not os.path.isfile(path):
+            log.error(
+                "ttr:jsonschema_model_loader model '{}' file not found in '{}'".format(
+                    model_name, models_dir
+                )
+            )
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+        models_dict[model_name] = compile_schema(schema, name=model_name)
+        log.debug("ttr:jsonschema_model_loader loaded '{}' model".format(model_name))
@@ -89,6 +89,9 @@ For reference, YANG model ``Models/interface/interface.yang`` file content is::
 import logging
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+
+from ...utils.models_cache import ModelsCache, hash_model_directory
 
 log = logging.getLogger(__name__)
 
@@ -208,7 +211,86 @@ def _make_library(ydir):
     return json.dumps(res, indent=2)
 
 
-def load(models_dict, models_dir, **kwargs):  # pylint: disable=unused-argument
+def _yangson_version():
+    """
+    Function to retrieve yangson library version to include in models cache key.
+    """
+    try:
+        # importlib.metadata takes significant time to import, only needed for cache
+        # pylint: disable=import-outside-toplevel
+        from importlib.metadata import version
+
+        return version("yangson")
+    except Exception:
+        return ""
+
+
+def _build_model(path):
+    """
+    Function to parse YANG modules in model directory and instantiate DataModel.
+
+    :param path: (str) OS path to model directory
+    :return: tuple of ``(YANG modules library JSON string, DataModel object)``
+    """
+    yang_modules_library = _make_library(path)
+    return yang_modules_library, DataModel(yltxt=yang_modules_library, mod_path=[path])
+
+
+def _build_models(paths, workers=None):
+    """
+    Function to build several models, using a pool of processes if more than one
+    model needs to be built.
+
+    :param paths: (dict) dictionary of ``{model name: model directory path}``
+    :param workers: (int) maximum number of processes to use, defaults to CPU count
+    :return: dictionary of ``{model name: (library, DataModel)}``
+    """
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return dict(zip(paths, executor.map(_build_model, paths.values())))
+        except Exception as e:
+            log.warning(
+                "ttr:yangson_module_loader failed to load models in parallel, "
+                "loading them one by one, error: {}".format(e)
+            )
+    return {name: _build_model(path) for name, path in paths.items()}
+
+
+def _models_to_load(models_dict, models_dir, models):
+    """
+    Function to decide on models to load, one per-directory under models_dir path.
+
+    :param models_dict: (dict) dictionary of already loaded models
+    :param models_dir: (str) OS path to directory with YANG models subdirectories
+    :param models: (list) names of models to load, all models if None
+    :return: dictionary of ``{model name: model directory path}``
+    """
+    to_load = {}
+    for directory in os.listdir(models_dir) if models is None else models:
+        if directory in models_dict:
+            log.debug(
+                "ttr:yangson_module_loader model '{}' already loaded, skipping".format(
+                    directory
+                )
+            )
+            continue
+        path = os.path.join(models_dir, directory)
+        if not os.path.isdir(path):
+            log.error(
+                "ttr:yangson_module_loader model '{}' directory not found in '{}'".format(
+                    directory, models_dir
+                )
+            )
+            continue
+        to_load[directory] = path
+    return to_load
+
+
+def load(
+    models_dict, models_dir, models=None, cache=None, stats=None, workers=None, **kwargs
+):  # pylint: disable=unused-argument
     """
     Creates JSON-encoded YANG library data [RFC7895] and instantiates data model object out of it.
 
@@ -216,6 +298,12 @@ def load(models_dict, models_dir, **kwargs):  # pylint: disable=unused-argument
         subdirectory models loaded to form single DataModel and added to models_dict under
         directory name key.
     :param models_dict: (dict) dictionary to store loaded model object at
+    :param models: (list) names of models to load, loads all models if not provided
+    :param cache: (str) OS path to SQLite database file to cache YANG modules libraries
+        and DataModel objects in, cached models keyed by hash of ``.yang`` files content
+    :param stats: (dict) dictionary to count models ``cache`` hits and misses in
+    :param workers: (int) maximum number of processes to use to load several models,
+        defaults to CPU count
     :param kwargs: (dict) any additional arguments ignored
     :param return: None
     """
@@ -224,27 +312,59 @@ def load(models_dict, models_dir, **kwargs):  # pylint: disable=unused-argument
             "ttr:yangson_model_loader: Failed to import yangson library, make sure it is installed."
         )
 
-    # create models one per-directory under models_dir path
-    for directory in os.listdir(models_dir):
-        if directory in models_dict:
-            log.debug(
-                "ttr:yangson_module_loader model '{}' already loaded, skipping".format(
-                    directory
+    to_load = _models_to_load(models_dict, models_dir, models)
+    models_cache = None
+    salt = None
+    keys = {}
+    if cache and to_load:
+        models_cache = ModelsCache(cache)
+        salt = "yangson:{}".format(_yangson_version())
+        if stats is None:
+            stats = {}
+        stats.setdefault("hits", 0)
+        stats.setdefault("misses", 0)
+
+    try:
+        # load models from cache
+        if models_cache is not None:
+            for directory, path in list(to_load.items()):
+                keys[directory] = hash_model_directory(path, salt=salt)
+                cached = models_cache.get(directory, keys[directory])
+                if cached is None:
+                    stats["misses"] += 1
+                    continue
+                stats["hits"] += 1
+                yang_modules_library, model = cached
+                if model is None:
+                    model = DataModel(yltxt=yang_modules_library, mod_path=[path])
+                log.debug(
+                    "ttr:yangson_module_loader loaded '{}' model from cache".format(
+                        directory
+                    )
                 )
-            )
-            continue
-        path = os.path.join(models_dir, directory)
-        yang_modules_library = _make_library(path)
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug(
-                "ttr:yangson_module_loader constructed '{}' YANG modules library:\n{}".format(
-                    directory, yang_modules_library
+                models_dict[directory] = model
+                to_load.pop(directory)
+
+        # build the rest of models
+        for directory, (yang_modules_library, model) in _build_models(
+            to_load, workers
+        ).items():
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "ttr:yangson_module_loader constructed '{}' YANG modules library:\n{}".format(
+                        directory, yang_modules_library
+                    )
                 )
-            )
-        models_dict[directory] = DataModel(yltxt=yang_modules_library, mod_path=[path])
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug(
-                "ttr:yangson_module_loader loaded '{}' YANG model:\n{}".format(
-                    directory, models_dict[directory].ascii_tree()
+                log.debug(
+                    "ttr:yangson_module_loader loaded '{}' YANG model:\n{}".format(
+                        directory, model.ascii_tree()
+                    )
                 )
-            )
+            models_dict[directory] = model
+            if models_cache is not None:
+                models_cache.update(
+                    directory, keys[directory], yang_modules_library, model
+                )
+    finally:
+        if models_cache is not None:
+            models_cache.close()
@@ -1,9 +1,21 @@
-from . import multitemplate_processor
-from . import templates_split
-from . import filtering
+from .. import LazyPluginsRegistry
 
-processors_plugins = {
-    "multitemplate": multitemplate_processor.process,
-    "templates_split": templates_split.process,
-    "filtering": filtering.process,
-}
+processors_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.processors",
+    plugins={
+        "multitemplate": ".multitemplate_processor:process",
+        "templates_split": ".templates_split:process",
+        "filtering": ".filtering:process",
+    },
+    package=__name__,
+)
+
+processors_stream_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.processors_stream",
+    plugins={
+        "multitemplate": ".multitemplate_processor:process_iter",
+        "templates_split": ".templates_split:process_iter",
+        "filtering": ".filtering:process_iter",
+    },
+    package=__name__,
+)
@@ -52,11 +52,33 @@ def process(
     if not any(filters):
         return data
 
-    ret = []
+    return list(process_iter(data, result_name_key, filters))
+
+
+def process_iter(
+    data, result_name_key, filters=None, **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Generator function to filter data items one by one using glob patterns.
+
+    :param data: iterable of dictionaries to process
+    :param filters: list, list of glob patterns to use for filtering. Filtering successful
+        if at list one pattern matches
+    :param result_name_key: (str) name of the key in data items value of which should be
+        used as a key in results dictionary, default ``device``
+    :param kwargs: (dict) any additional arguments ignored
+    :return: yields filtered data items
+    """
+    filters = filters or []
+
+    if not any(filters):
+        yield from data
+        return
+
+    filters = [str(pattern) for pattern in filters]
 
     # iterate over data and filter it
-    while data:
-        item = data.pop(0)
+    for item in data:
         # run sanity checks
         if not isinstance(item.get(result_name_key, None), str):
             log.warning(
@@ -67,8 +89,6 @@ def process(
             continue
         for pattern in filters:
             # run filtering
-            if fnmatchcase(item[result_name_key], str(pattern)):
-                ret.append(item)
+            if fnmatchcase(item[result_name_key], pattern):
+                yield item
                 break
-
-    return ret
@@ -57,6 +57,8 @@ all dictionaries.
 """
 import logging
 
+from ...utils.compact_rows import RowsSchema
+
 log = logging.getLogger(__name__)
 
 
@@ -68,10 +70,22 @@ def process(data, template_name_key, **kwargs):  # pylint: disable=unused-argume
     :param template_name_key: string, name of the template key
     :param kwargs: (dict) any additional arguments ignored
     """
-    ret = []
+    return list(process_iter(data, template_name_key))
+
+
+def process_iter(data, template_name_key, **kwargs):  # pylint: disable=unused-argument
+    """
+    Generator function to process multitemplate data items one by one.
+
+    :param data: (iterable), data to process - iterable of dictionaries
+    :param template_name_key: string, name of the template key
+    :param kwargs: (dict) any additional arguments ignored
+    :return: yields data items produced for each suffix
+    """
     headers = tuple()
     previous_headers = tuple()
     headers_to_endings = {}
+    schemas = {}
 
     # scan through data to split in multiple items
     for datum in data:
@@ -101,13 +115,17 @@ def process(data, template_name_key, **kwargs):  # pylint: disable=unused-argume
             }
             if template_name_key in headers_without_endings:
                 headers_to_endings = {"": headers_without_endings, **headers_to_endings}
+            # form schemas shared by items produced for each ending
+            schemas = {
+                ending: RowsSchema(
+                    [
+                        h[: -len(ending)] if h.endswith(ending) and ending else h
+                        for h in headers_item
+                    ]
+                )
+                for ending, headers_item in headers_to_endings.items()
+            }
         # form data
         for ending, headers_item in headers_to_endings.items():
-            ret.append(
-                {
-                    h[: -len(ending)] if h.endswith(ending) and ending else h: datum[h]
-                    for h in headers_item
-                }
-            )
+            yield schemas[ending].make_row(tuple(datum[h] for h in headers_item))
         previous_headers = headers
-    return ret
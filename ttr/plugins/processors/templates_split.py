@@ -69,11 +69,23 @@ def process(
     :param split_char: str, character to use to split template names
     :param kwargs: (dict) any additional arguments ignored
     """
-    ret = []
+    return list(process_iter(data, template_name_key, split_char))
 
+
+def process_iter(
+    data, template_name_key, split_char=";", **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Generator function to split templates of data items one by one.
+
+    :param data: iterable of dictionaries to process
+    :param template_name_key: string, name of the template key
+    :param split_char: str, character to use to split template names
+    :param kwargs: (dict) any additional arguments ignored
+    :return: yields data items with single template each
+    """
     # iterate over data and split templates
-    while data:
-        item = data.pop(0)
+    for item in data:
         # run sanity check
         if not isinstance(item.get(template_name_key, None), str):
             continue
@@ -85,9 +97,6 @@ def process(
             for t_name in templates:
                 item_copy = item.copy()
                 item_copy[template_name_key] = t_name
-                ret.append(item_copy)
+                yield item_copy
         else:
-            ret.append(item)
-
-    del data
-    return ret
+            yield item
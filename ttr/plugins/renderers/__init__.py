@@ -1,3 +1,13 @@
-from . import jinja2_renderer
+from .. import LazyPluginsRegistry
 
-renderers_plugins = {"jinja2": jinja2_renderer.render}
+renderers_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.renderers",
+    plugins={"jinja2": ".jinja2_renderer:render"},
+    package=__name__,
+)
+
+renderers_stream_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.renderers_stream",
+    plugins={"jinja2": ".jinja2_renderer:render_iter"},
+    package=__name__,
+)
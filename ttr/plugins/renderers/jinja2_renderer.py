@@ -48,14 +48,142 @@ And this is the content of ``ttr://interfaces.cisco_ios`` template::
 This renderer will combine each item in above data with
 ``ttr://interfaces.cisco_ios`` template and return results for further
 processing.
+
+**Parallel rendering**
+
+If ``renderer_kwargs`` contains ``workers`` argument with value greater than 1, data
+partitioned by ``result_name_key`` values and rendered using pool of ``workers``
+processes. Templates dictionary shipped to each worker process once on startup
+and templates compiled within worker. Results order and content are the same as
+for single process rendering::
+
+    from ttr import ttr
+
+    gen = ttr(data="./data/devices.xlsx", renderer_kwargs={"workers": 4})
+    results = gen.run()
+
+Same can be achieved using TTR CLI tool ``-j, --jobs`` argument.
+
+**Templates environment and bytecode cache**
+
+Renderer uses single ``jinja2.Environment`` object with a loader that sources
+templates from ``templates_dict``, TTR templates collection using ``ttr://`` names
+and ``templates`` directory or spreadsheet, as a result templates can reference
+each other using ``{% include %}`` and ``{% import %}`` statements, for example::
+
+    {% include "ttr://simple/interface.cisco_ios.txt" %}
+
+If ``renderer_kwargs`` contains ``cache_dir`` argument, compiled templates bytecode
+stored in that directory using ``jinja2.FileSystemBytecodeCache``, that way
+subsequent runs skip parsing and compiling unchanged templates::
+
+    gen = ttr(data="./data/devices.xlsx", renderer_kwargs={"cache_dir": "./.ttr_cache/"})
+
+Same can be achieved using TTR CLI tool ``-c, --cache-dir`` argument.
 """
 import logging
+import multiprocessing
+import os
 import jinja2
 
 from ..templates import templates_loaders_plugins
 
 log = logging.getLogger(__name__)
 
+# variables to store rendering context within worker process
+_worker_context = {}
+
+
+class TTRTemplatesLoader(jinja2.BaseLoader):
+    """
+    Jinja2 templates loader that sources templates content using TTR ``base``
+    templates loader plugin, as a result templates can be loaded from ``templates_dict``,
+    TTR templates collection using ``ttr://`` names, ``templates`` directory or
+    spreadsheet. That allows to use ``{% include %}`` and ``{% import %}`` statements
+    within templates.
+
+    :param templates: (str) OS path to directory or file with templates
+    :param templates_dict: (dict) dictionary keyed by template name with template content as a value
+    """
+
+    def __init__(self, templates, templates_dict):
+        self.templates = templates
+        self.templates_dict = templates_dict
+
+    def get_source(self, environment, template):
+        if not templates_loaders_plugins["base"](
+            template, self.templates_dict, self.templates
+        ):
+            raise jinja2.TemplateNotFound(template)
+        return self.templates_dict[template], None, lambda: True
+
+
+def _make_environment(templates, templates_dict, cache_dir=None, **renderer_kwargs):
+    """
+    Helper function to create Jinja2 environment object.
+
+    :param templates: (str) OS path to directory or file with templates
+    :param templates_dict: (dict) dictionary keyed by template name with template content as a value
+    :param cache_dir: (str) OS path to directory to store compiled templates bytecode in
+    :param renderer_kwargs: (dict) kwargs to pass on to ``jinja2.Environment`` object instantiation
+    :return: ``jinja2.Environment`` object
+    """
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+        renderer_kwargs["bytecode_cache"] = jinja2.FileSystemBytecodeCache(cache_dir)
+    autoescape = renderer_kwargs.pop("autoescape", False)
+    # rendering device configuration text, not HTML, HTML escaping would corrupt it
+    return jinja2.Environment(  # nosec B701
+        loader=TTRTemplatesLoader(templates, templates_dict),
+        autoescape=autoescape,
+        **renderer_kwargs,
+    )
+
+
+def _render_datum(datum, template_name_key, environment, templates_objects_dict):
+    """
+    Helper function to render single data item.
+
+    :param datum: (dict) data item to render
+    :param environment: (obj) ``jinja2.Environment`` object to load templates with
+    :param templates_objects_dict: (dict) cache of compiled ``jinja2.Template`` objects
+        keyed by template name
+    :return: rendered string or ``None`` on failure
+    """
+    template_name = datum[template_name_key]
+
+    # load and compile Jinja2 template object
+    if template_name not in templates_objects_dict:
+        try:
+            templates_objects_dict[template_name] = environment.get_template(
+                template_name
+            )
+        except jinja2.TemplateNotFound:
+            log.error(
+                "TTR:Jinja2 renderer failed to load template file: '{}' from '{}'".format(
+                    template_name, environment.loader.templates
+                )
+            )
+            return None
+        except Exception as e:
+            log.error(
+                "Jinja2 renderer failed to load template: {}; error: {}".format(
+                    template_name, e
+                )
+            )
+            return None
+
+    # render data
+    try:
+        return templates_objects_dict[template_name].render(datum)
+    except Exception as e:
+        log.error(
+            "Jinja2 renderer failed to render template: {}; error: {}; data: {}".format(
+                template_name, e, datum
+            )
+        )
+    return None
+
 
 def render(
     data,
@@ -72,7 +200,9 @@ def render(
     :param templates_dict: (dict), dictionary keyed by template name with template content as a value
     :param template_name_key: (str), name of template key to use for data rendering, default - ``template``
     :param result_name_key: (str), name of result key to use to combine rendering results, default - ``device``
-    :param renderer_kwargs: (dict), kwargs to pass on to ``jinja2.Template(.., **kwargs)`` object instantiation
+    :param renderer_kwargs: (dict), kwargs to pass on to ``jinja2.Environment(.., **kwargs)`` object
+        instantiation except for ``workers`` argument - number of processes to use for rendering
+        and ``cache_dir`` argument - OS path to directory to cache compiled templates in
 
     By default ``renderer_kwargs`` will include::
 
@@ -80,55 +210,186 @@ def render(
     """
     result = {}
     templates_objects_dict = {}
+    workers = renderer_kwargs.pop("workers", None)
 
     renderer_kwargs.setdefault("trim_blocks", True)
     renderer_kwargs.setdefault("lstrip_blocks", True)
 
+    if workers and workers > 1:
+        return _render_parallel(
+            data,
+            template_name_key,
+            templates,
+            templates_dict,
+            result_name_key,
+            workers,
+            **renderer_kwargs,
+        )
+
+    environment = _make_environment(templates, templates_dict, **renderer_kwargs)
+
     # iterate over data and render it
     for datum in data:
         result_name = datum[result_name_key]
         result.setdefault(result_name, [])
-        template_name = datum[template_name_key]
-
-        # get template content
-        if templates_loaders_plugins["base"](template_name, templates_dict, templates):
-            template_content = templates_dict[template_name]
-        else:
-            log.error(
-                "TTR:Jinja2 renderer failed to load template file: '{}' from '{}'".format(
-                    template_name, templates
-                )
-            )
-            continue
-
-        # create Jinja2 template object
-        if template_name not in templates_objects_dict:
-            try:
-                templates_objects_dict[template_name] = jinja2.Template(
-                    template_content, **renderer_kwargs
-                )
-            except Exception as e:
-                log.error(
-                    "Jinja2 renderer failed to load template: {}; error: {}".format(
-                        template_name, e
-                    )
-                )
-                continue
-
-        # render data
-        try:
-            result[result_name].append(
-                templates_objects_dict[template_name].render(datum)
-            )
-        except Exception as e:
-            log.error(
-                "Jinja2 renderer failed to render template: {}; error: {}; data: {}".format(
-                    template_name, e, datum
-                )
-            )
+        rendered = _render_datum(
+            datum, template_name_key, environment, templates_objects_dict
+        )
+        if rendered is not None:
+            result[result_name].append(rendered)
     # transform results into strings
     for result_name, result_list in result.items():
         result[result_name] = "\n".join(result_list)
         del result_list
 
     return result
+
+
+def _init_worker(template_name_key, templates, templates_dict, renderer_kwargs):
+    """
+    Function to initialize rendering context within worker process.
+    """
+    _worker_context.update(
+        template_name_key=template_name_key,
+        environment=_make_environment(templates, templates_dict, **renderer_kwargs),
+        templates_objects_dict={},
+    )
+
+
+def _render_result(result_item):
+    """
+    Function to render all data items of single result within worker process.
+
+    :param result_item: (tuple) ``(result_name, [data items])`` tuple
+    :return: ``(result_name, text)`` tuple
+    """
+    result_name, items = result_item
+    result_list = []
+    for datum in items:
+        rendered = _render_datum(
+            datum,
+            _worker_context["template_name_key"],
+            _worker_context["environment"],
+            _worker_context["templates_objects_dict"],
+        )
+        if rendered is not None:
+            result_list.append(rendered)
+    return result_name, "\n".join(result_list)
+
+
+def _render_parallel(
+    data,
+    template_name_key,
+    templates,
+    templates_dict,
+    result_name_key,
+    workers,
+    **renderer_kwargs
+):
+    """
+    Function to render data using pool of worker processes.
+
+    :param workers: (int) number of worker processes to use
+    :return: dictionary keyed by ``result_name_key`` values
+    """
+    # partition data by result name preserving results order
+    partitions = {}
+    for datum in data:
+        partitions.setdefault(datum[result_name_key], []).append(datum)
+
+    # load templates content before shipping templates dictionary to workers
+    for template_name in {
+        datum[template_name_key] for items in partitions.values() for datum in items
+    }:
+        templates_loaders_plugins["base"](template_name, templates_dict, templates)
+
+    log.debug(
+        "TTR:Jinja2 renderer rendering {} results using {} processes".format(
+            len(partitions), workers
+        )
+    )
+
+    with multiprocessing.Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(template_name_key, templates, templates_dict, renderer_kwargs),
+    ) as pool:
+        return dict(
+            pool.imap(
+                _render_result,
+                partitions.items(),
+                chunksize=max(1, len(partitions) // (workers * 4)),
+            )
+        )
+
+
+def render_iter(
+    data,
+    template_name_key,
+    templates,
+    templates_dict,
+    result_name_key,
+    **renderer_kwargs
+):
+    """
+    Streaming variant of ``render`` function, takes iterable of data items and
+    yields ``(result_name, text)`` tuples as soon as consecutive items with the
+    same ``result_name_key`` value rendered.
+
+    :param data: (iterable), iterable of dictionaries to render, e.g. generator
+    :param templates_dict: (dict), dictionary keyed by template name with template content as a value
+    :param template_name_key: (str), name of template key to use for data rendering, default - ``template``
+    :param result_name_key: (str), name of result key to use to combine rendering results, default - ``device``
+    :param renderer_kwargs: (dict), kwargs to pass on to ``jinja2.Environment(.., **kwargs)`` object
+        instantiation except for ``cache_dir`` argument - OS path to directory to cache compiled
+        templates in
+
+    Only one result's rendered strings held in memory at a time. If items for the same
+    ``result_name_key`` value are not consecutive, several tuples produced for that
+    result, concatenating their text gives the same string as ``render`` function
+    produces for that result.
+    """
+    templates_objects_dict = {}
+    results_with_content = set()
+    result_name = None
+    result_list = []
+    first_item = True
+    renderer_kwargs.pop("workers", None)
+
+    renderer_kwargs.setdefault("trim_blocks", True)
+    renderer_kwargs.setdefault("lstrip_blocks", True)
+    environment = _make_environment(templates, templates_dict, **renderer_kwargs)
+
+    for datum in data:
+        datum_result_name = datum[result_name_key]
+        # yield previous result if result name changed
+        if datum_result_name != result_name and not first_item:
+            yield _make_chunk(result_name, result_list, results_with_content)
+            result_list = []
+        result_name = datum_result_name
+        first_item = False
+        rendered = _render_datum(
+            datum, template_name_key, environment, templates_objects_dict
+        )
+        if rendered is not None:
+            result_list.append(rendered)
+    # yield last result
+    if not first_item:
+        yield _make_chunk(result_name, result_list, results_with_content)
+
+
+def _make_chunk(result_name, result_list, results_with_content):
+    """
+    Helper function to join rendered strings into ``(result_name, text)`` tuple,
+    prepending newline if previous chunks for this result produced content.
+
+    :param result_name: (str) result name
+    :param result_list: (list) list of rendered strings
+    :param results_with_content: (set) names of results that already produced content
+    """
+    text = "\n".join(result_list)
+    if result_list:
+        if result_name in results_with_content:
+            text = "\n" + text
+        results_with_content.add(result_name)
+    return result_name, text
@@ -1,9 +1,21 @@
-from . import file_returner
-from . import terminal_returner
-from . import self_returner
+from .. import LazyPluginsRegistry
 
-returners_plugins = {
-    "self": self_returner.dump,
-    "file": file_returner.dump,
-    "terminal": terminal_returner.dump,
-}
+returners_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.returners",
+    plugins={
+        "self": ".self_returner:dump",
+        "file": ".file_returner:dump",
+        "terminal": ".terminal_returner:dump",
+    },
+    package=__name__,
+)
+
+returners_stream_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.returners_stream",
+    plugins={
+        "self": ".self_returner:dump_iter",
+        "file": ".file_returner:dump_iter",
+        "terminal": ".terminal_returner:dump_iter",
+    },
+    package=__name__,
+)
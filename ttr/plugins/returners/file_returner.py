@@ -36,6 +36,13 @@ will iterate over ``data_dict`` using keys as filenames
 populating files with values at the end ``./Output/`` directory
 will contain two files named ``rt-1.txt`` and ``rt-2.txt`` with
 respective content.
+
+When used together with TTR ``results_cache`` argument, files for results that
+did not change since previous run are not rewritten.
+
+Streaming ``dump_iter`` function consumes ``(result_name, text)`` tuples produced by
+``ttr.run_iter`` method, writing each result to file as soon as it is received;
+subsequent text for the same result appended to already created file.
 """
 import logging
 import os
@@ -44,7 +51,7 @@ log = logging.getLogger(__name__)
 
 
 def dump(
-    data_dict, result_dir="./Output/", **kwargs
+    data_dict, result_dir="./Output/", unchanged=None, **kwargs
 ):  # pylint: disable=unused-argument
     """
     Function to save results in text files.
@@ -52,12 +59,41 @@ def dump(
     :param data_dict: (dict) dictionary keyed by ``result_name_key`` where
                       values are strings to save in text files
     :param result_dir: (str) OS path to directory to save results in
+    :param unchanged: (set) names of results not changed since previous run, their
+        files not rewritten if already exist in ``result_dir``
     :param kwargs: (dict) any additional arguments ignored
     """
+    unchanged = unchanged or set()
+
     if not os.path.exists(result_dir):
         os.makedirs(result_dir)
 
     for datum_name, filedata in data_dict.items():
         filename = os.path.join(result_dir, "{}.txt".format(datum_name))
+        if datum_name in unchanged and os.path.isfile(filename):
+            continue
         with open(filename, "w", encoding="utf-8") as f:
             f.write(filedata)
+
+
+def dump_iter(
+    results, result_dir="./Output/", **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Generator function to save streamed results in text files.
+
+    :param results: (iterable) iterable of ``(result_name, text)`` tuples
+    :param result_dir: (str) OS path to directory to save results in
+    :param kwargs: (dict) any additional arguments ignored
+    :return: yields ``(result_name, text)`` tuples after saving them in files
+    """
+    if not os.path.exists(result_dir):
+        os.makedirs(result_dir)
+
+    seen = set()
+    for datum_name, filedata in results:
+        filename = os.path.join(result_dir, "{}.txt".format(datum_name))
+        with open(filename, "a" if datum_name in seen else "w", encoding="utf-8") as f:
+            f.write(filedata)
+        seen.add(datum_name)
+        yield datum_name, filedata
@@ -20,3 +20,13 @@ def dump(data_dict, **kwargs):  # pylint: disable=unused-argument
     :param kwargs: (dict) any additional arguments ignored
     """
     # do nothing
+
+
+def dump_iter(results, **kwargs):  # pylint: disable=unused-argument
+    """
+    Generator function that yields streamed results as is.
+
+    :param results: (iterable) iterable of ``(result_name, text)`` tuples
+    :param kwargs: (dict) any additional arguments ignored
+    """
+    yield from results
@@ -85,3 +85,31 @@ def dump(data_dict, **kwargs):  # pylint: disable=unused-argument
             )
         )
         print(value)
+
+
+def dump_iter(results, **kwargs):  # pylint: disable=unused-argument
+    """
+    Generator function to print streamed results to terminal screen.
+
+    :param results: (iterable) iterable of ``(result_name, text)`` tuples
+    :param kwargs: (dict) any additional arguments ignored
+    :return: yields ``(result_name, text)`` tuples after printing them
+    """
+    seen = set()
+    for key, value in results:
+        if key in seen:
+            # skip newline already printed after previous chunk of this result
+            if value:
+                print(value[1:] if value.startswith("\n") else value)
+        else:
+            print(
+                """
+# ---------------------------------------------------------------------------
+# {} rendering results
+# ---------------------------------------------------------------------------""".format(
+                    key
+                )
+            )
+            print(value)
+            seen.add(key)
+        yield key, value
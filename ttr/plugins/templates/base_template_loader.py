@@ -19,10 +19,7 @@ TTR will continue processing other data items.
 import os
 import logging
 
-from . import xlsx_template_loader
-from . import ttr_template_loader
-from . import file_template_loader
-from . import dir_template_loader
+from . import templates_loaders_plugins
 
 log = logging.getLogger(__name__)
 
@@ -56,16 +53,18 @@ def load(
         return False
     # check if template_name referring to template in TTR package
     if template_name.startswith("ttr://"):
-        return ttr_template_loader.load(template_name, templates_dict)
+        return templates_loaders_plugins["ttr"](template_name, templates_dict)
     # check if template_name is a path to file
     if os.path.isfile(template_name):
-        return file_template_loader.load(template_name, templates_dict)
+        return templates_loaders_plugins["file"](template_name, templates_dict)
     # check if templates is a path to directory then search for template_name in it
     if os.path.isdir(templates):
-        return dir_template_loader.load(template_name, templates_dict, templates)
+        return templates_loaders_plugins["dir"](
+            template_name, templates_dict, templates
+        )
     # check if templates reference to xlsx file
     if os.path.isfile(templates) and templates.endswith(".xlsx"):
-        is_loaded = xlsx_template_loader.load(
+        is_loaded = templates_loaders_plugins["xlsx"](
             templates_dict=templates_dict, templates=templates
         )
         log.debug(
@@ -75,9 +74,14 @@ def load(
         )
         # check if template with requested name actually loaded
         return template_name in templates_dict
+    # check if templates reference to SQLite database
+    if os.path.isfile(templates) and templates.endswith((".sqlite", ".sqlite3", ".db")):
+        return templates_loaders_plugins["sqlite"](
+            template_name, templates_dict, templates
+        )
     # check if templates reference to txt file
     if os.path.isfile(templates) and templates.endswith(".txt"):
-        return file_template_loader.load(
+        return templates_loaders_plugins["file"](
             template_name, templates_dict, filepath=templates
         )
 
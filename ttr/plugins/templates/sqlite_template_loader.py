@@ -0,0 +1,67 @@
+"""
+SQLite Template Loader
+**********************
+
+**Reference name** ``sqlite``
+
+Loads templates for rendering from ``templates`` table of SQLite database, table
+must have ``name`` and ``template`` columns::
+
+    CREATE TABLE templates (name TEXT PRIMARY KEY, template TEXT);
+
+Used when TTR ``templates`` argument is OS path to ``.sqlite``, ``.sqlite3`` or
+``.db`` file, for example::
+
+    from ttr import ttr
+
+    gen = ttr(data="./data.csv", templates="./inventory.sqlite")
+"""
+import logging
+import traceback
+
+from ..data.sqlite_loader import connect
+
+log = logging.getLogger(__name__)
+
+
+def load(
+    template_name, templates_dict, templates, templates_table="templates", **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Function to load template content from SQLite database.
+
+    :param template_name: (str) name of template to load
+    :param templates_dict: (dict) dictionary to store template content in
+    :param templates: (str) OS path to SQLite database file
+    :param templates_table: (str) name of templates table
+    :param kwargs: (dict) any additional arguments ignored
+    :return: ``True`` on success and ``False`` on failure to load template
+    """
+    try:
+        connection = connect(templates)
+        try:
+            # table name quoted as SQL identifier, connection is read-only
+            row = connection.execute(
+                'SELECT template FROM "{}" WHERE name = ?'.format(  # nosec B608
+                    templates_table.replace('"', '""')
+                ),
+                (template_name,),
+            ).fetchone()
+        finally:
+            connection.close()
+    except Exception:
+        log.error(
+            "TTR:sqlite_template_loader - failed to load '{}' template from '{}' database, error: {}".format(
+                template_name, templates, traceback.format_exc()
+            )
+        )
+        return False
+    if row is None:
+        log.error(
+            "TTR:sqlite_template_loader - '{}' template not found in '{}' database".format(
+                template_name, templates
+            )
+        )
+        return False
+    templates_dict[template_name] = row[0]
+    return True
@@ -36,14 +36,12 @@ Above templates loaded in a dictionary::
 
 In this case templates referenced in data using ``interface`` and ``logging`` template names
 """
+
 import logging
 
-log = logging.getLogger(__name__)
+from ...utils import workbook_cache
 
-try:
-    from openpyxl import load_workbook
-except ImportError:
-    log.error("Failed to import openpyxl module")
+log = logging.getLogger(__name__)
 
 
 def load(
@@ -68,16 +66,26 @@ def load(
         return False
 
     if templates:
-        wb = load_workbook(templates, data_only=True, read_only=True)
-
-        for sheet_name in wb.sheetnames:
-            if sheet_name.startswith("#"):
-                log.debug(
-                    "TTR:xlsx_template_loader, skipping tab - '{}'".format(sheet_name)
-                )
-                continue
-            if "TEMPLATE" in sheet_name.upper():
-                load_templates_from_sheet(wb[sheet_name], templates_dict)
+        # templates tabs parsed once per file version, cached templates reused
+        workbook_templates = workbook_cache.get_templates(templates)
+        if workbook_templates is None:
+            workbook_templates = {}
+            with workbook_cache.scope():
+                wb = workbook_cache.open_workbook(templates)
+
+                for sheet_name in wb.sheetnames:
+                    if sheet_name.startswith("#"):
+                        log.debug(
+                            "TTR:xlsx_template_loader, skipping tab - '{}'".format(
+                                sheet_name
+                            )
+                        )
+                        continue
+                    if "TEMPLATE" in sheet_name.upper():
+                        load_templates_from_sheet(wb[sheet_name], workbook_templates)
+
+                workbook_cache.set_templates(templates, workbook_templates)
+        templates_dict.update(workbook_templates)
     if sheet:
         load_templates_from_sheet(sheet, templates_dict)
 
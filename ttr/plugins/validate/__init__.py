@@ -1,3 +1,21 @@
-from . import validate_yangson
+from .. import LazyPluginsRegistry
 
-validate_plugins = {"yangson": validate_yangson.validate}
+validate_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.validate",
+    plugins={
+        "yangson": ".validate_yangson:validate",
+        "yangson_compiled": ".validate_yangson_compiled:validate",
+        "jsonschema": ".validate_jsonschema:validate",
+    },
+    package=__name__,
+)
+
+validate_batch_plugins = LazyPluginsRegistry(
+    group="ttr.plugins.validate_batch",
+    plugins={
+        "yangson": ".validate_yangson:validate_batch",
+        "yangson_compiled": ".validate_yangson_compiled:validate_batch",
+        "jsonschema": ".validate_jsonschema:validate_batch",
+    },
+    package=__name__,
+)
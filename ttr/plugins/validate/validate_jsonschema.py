@@ -0,0 +1,664 @@
+"""
+JSON Schema Data Validation
+***************************
+
+**Reference name** ``jsonschema``
+
+This plugin validates data items using JSON Schema models. It does not depend on any
+third-party libraries - each schema compiled once into Python source code of a
+validation function specialised for that schema, that function executed for each
+data item.
+
+Supported JSON Schema keywords:
+
+* ``type`` - ``string``, ``integer``, ``number``, ``boolean``, ``null``, ``object``,
+  ``array`` or a list of them
+* ``enum``, ``const``
+* ``minimum``, ``maximum``, ``exclusiveMinimum``, ``exclusiveMaximum``, ``multipleOf``
+* ``minLength``, ``maxLength``, ``pattern``, ``format`` - ``ipv4`` and ``ipv6``
+  formats checked, other formats ignored
+* ``properties``, ``required``, ``additionalProperties``, ``minProperties``,
+  ``maxProperties``
+* ``items``, ``minItems``, ``maxItems``, ``uniqueItems``
+* ``allOf``, ``anyOf``, ``oneOf``, ``not``
+* ``$ref`` to local ``#/definitions/<name>`` or ``#/$defs/<name>`` definitions
+
+Annotation keywords such as ``title``, ``description``, ``default`` or ``$schema``
+ignored, any other keyword raises ``RuntimeError`` when schema compiled.
+
+For example, this is JSON Schema model ``Models/interface.json`` file content::
+
+    {
+        "type": "object",
+        "properties": {
+            "interface": {"type": "string"},
+            "device": {"type": "string"},
+            "template": {"type": "string"},
+            "description": {"type": "string"},
+            "vid": {"type": "integer", "minimum": 1, "maximum": 4094},
+            "ip": {"type": "string", "format": "ipv4"},
+            "mask": {"type": "string", "pattern": "^([0-9]{1,3}.){3}[0-9]{1,3}$"},
+            "vrf": {"type": "string"}
+        },
+        "required": ["interface", "device", "template"],
+        "additionalProperties": false
+    }
+
+Models loaded using ``jsonschema`` models loader plugin.
+
+.. autofunction:: ttr.plugins.validate.validate_jsonschema.compile_schema
+.. autofunction:: ttr.plugins.validate.validate_jsonschema.validate
+.. autofunction:: ttr.plugins.validate.validate_jsonschema.validate_batch
+"""
+import ipaddress
+import logging
+import math
+import re
+from collections.abc import Mapping
+
+log = logging.getLogger(__name__)
+
+ANNOTATIONS = {
+    "$schema",
+    "$id",
+    "$comment",
+    "title",
+    "description",
+    "default",
+    "examples",
+    "definitions",
+    "$defs",
+    "readOnly",
+    "writeOnly",
+    "deprecated",
+}
+
+TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool)) "
+    "or (isinstance({v}, float) and {v}.is_integer()))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "object": "isinstance({v}, Mapping)",
+    "array": "isinstance({v}, (list, tuple))",
+}
+
+
+def _is_ipv4(value):
+    try:
+        ipaddress.IPv4Address(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_ipv6(value):
+    try:
+        ipaddress.IPv6Address(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _is_multiple(value, divisor):
+    """
+    Helper function to check if value is a multiple of divisor, tolerating float
+    rounding errors, e.g. ``0.3`` is a multiple of ``0.1``.
+    """
+    if isinstance(value, int) and isinstance(divisor, int):
+        return value % divisor == 0
+    quotient = value / divisor
+    if not math.isfinite(quotient):
+        return False
+    return abs(quotient - round(quotient)) <= 1e-9 * max(1.0, abs(quotient))
+
+
+def _json_equal(a, b):
+    """
+    Helper function to compare values following JSON semantics, where booleans
+    are not equal to numbers.
+    """
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_json_equal(i, j) for i, j in zip(a, b))
+    if isinstance(a, Mapping) and isinstance(b, Mapping):
+        return a.keys() == b.keys() and all(_json_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _is_unique(values):
+    for i, a in enumerate(values):
+        for b in values[i + 1 :]:
+            if _json_equal(a, b):
+                return False
+    return True
+
+
+class _SchemaCompiler:
+    """
+    Class to generate Python source code of validation functions for JSON Schema.
+
+    :param schema: (dict) JSON Schema dictionary
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.lines = []
+        self.constants = {}
+        self.functions = {}  # id(subschema) -> function name
+        self.refs = {}  # $ref -> function name
+        self.resolving = set()  # $ref being resolved, to detect self-references
+        self.tables = []  # properties dispatch tables
+        self.pending = []
+
+    def constant(self, value):
+        """
+        Method to add constant to generated code namespace.
+        """
+        name = "_c{}".format(len(self.constants))
+        self.constants[name] = value
+        return name
+
+    def function(self, schema):
+        """
+        Method to get name of function that validates subschema, scheduling its
+        generation if needed.
+        """
+        if isinstance(schema, Mapping) and "$ref" in schema:
+            return self.ref(schema["$ref"])
+        if id(schema) not in self.functions:
+            name = "_v{}".format(len(self.functions))
+            self.functions[id(schema)] = name
+            self.pending.append((name, schema))
+        return self.functions[id(schema)]
+
+    def ref(self, reference):
+        """
+        Method to resolve local ``$ref`` reference to validation function name.
+        """
+        if reference not in self.refs:
+            if reference in self.resolving:
+                raise RuntimeError(
+                    "ttr:validate_jsonschema: $ref '{}' refers to itself".format(
+                        reference
+                    )
+                )
+            self.resolving.add(reference)
+            if reference == "#":
+                target = self.schema
+            else:
+                parts = reference.split("/")
+                if parts[0] != "#" or len(parts) != 3:
+                    raise RuntimeError(
+                        "ttr:validate_jsonschema: unsupported $ref '{}'".format(
+                            reference
+                        )
+                    )
+                target = self.schema.get(parts[1], {}).get(parts[2])
+                if target is None:
+                    raise RuntimeError(
+                        "ttr:validate_jsonschema: $ref '{}' not found".format(reference)
+                    )
+            self.refs[reference] = self.function(target)
+            self.resolving.discard(reference)
+        return self.refs[reference]
+
+    def compile(self):
+        """
+        Method to generate Python source code for schema.
+
+        :return: tuple of ``(source code, namespace constants)``
+        """
+        self.function(self.schema)
+        while self.pending:
+            name, schema = self.pending.pop(0)
+            self.emit_function(name, schema)
+        # properties tables reference functions, hence defined after them
+        for name, table in self.tables:
+            self.lines.append(
+                "{} = {{{}}}".format(
+                    name, ", ".join("{!r}: {}".format(k, f) for k, f in table.items())
+                )
+            )
+        return "\n".join(self.lines), self.constants
+
+    def emit_function(self, name, schema):
+        """
+        Method to generate validation function for subschema, function returns
+        error string or None if value is valid.
+        """
+        body = []
+        if schema is False:
+            body.append("return path + ': not allowed'")
+        elif schema is not True:
+            for keyword in schema:
+                if keyword not in KEYWORDS and keyword not in ANNOTATIONS:
+                    raise RuntimeError(
+                        "ttr:validate_jsonschema: unsupported keyword '{}'".format(
+                            keyword
+                        )
+                    )
+            for keywords, emitter in EMITTERS:
+                if any(keyword in schema for keyword in keywords):
+                    emitter(self, schema, body)
+        self.lines.append("def {}(value, path):".format(name))
+        for line in body:
+            self.lines.append("    " + line)
+        self.lines.append("    return None")
+        self.lines.append("")
+
+    @staticmethod
+    def number(schema, keyword, integer=False):
+        """
+        Method to get numeric keyword value, making sure it is a number before it
+        used in generated code.
+
+        :param schema: (dict) subschema dictionary
+        :param keyword: (str) keyword name
+        :param integer: (bool) if True, value must be non negative integer
+        :return: keyword value
+        """
+        value = schema[keyword]
+        if integer:
+            valid = isinstance(value, int) and value >= 0
+        else:
+            valid = isinstance(value, (int, float)) and math.isfinite(value)
+        if isinstance(value, bool) or not valid:
+            raise RuntimeError(
+                "ttr:validate_jsonschema: '{}' must be {}, got {!r}".format(
+                    keyword,
+                    "non negative integer" if integer else "finite number",
+                    value,
+                )
+            )
+        return value
+
+    # keywords emitters
+
+    def emit_type(self, schema, body):
+        """
+        Method to generate ``type`` check, types must be known JSON Schema types.
+        """
+        types = schema["type"]
+        types = [types] if isinstance(types, str) else list(types)
+        for type_name in types:
+            if type_name not in TYPE_CHECKS:
+                raise RuntimeError(
+                    "ttr:validate_jsonschema: unsupported type '{}'".format(type_name)
+                )
+        condition = " or ".join(TYPE_CHECKS[t].format(v="value") for t in types)
+        body.append("if not ({}):".format(condition))
+        body.append(
+            "    return path + ': expected {} value, got ' + repr(value)".format(
+                " or ".join(types)
+            )
+        )
+
+    def emit_enum(self, schema, body):
+        """
+        Method to generate ``enum`` check against list of allowed values constant.
+        """
+        body.append(
+            "if not any(_json_equal(value, i) for i in {}):".format(
+                self.constant(list(schema["enum"]))
+            )
+        )
+        body.append(
+            "    return path + ': ' + repr(value) + ' is not one of enum values'"
+        )
+
+    def emit_const(self, schema, body):
+        """
+        Method to generate ``const`` check against a single value constant.
+        """
+        body.append(
+            "if not _json_equal(value, {}):".format(self.constant(schema["const"]))
+        )
+        body.append("    return path + ': ' + repr(value) + ' is not const value'")
+
+    def emit_numeric(self, schema, body):
+        """
+        Method to generate range and ``multipleOf`` checks for numeric values,
+        keywords values must be numbers.
+        """
+        checks = []
+        for keyword, operator in [
+            ("minimum", "<"),
+            ("maximum", ">"),
+            ("exclusiveMinimum", "<="),
+            ("exclusiveMaximum", ">="),
+        ]:
+            if keyword in schema:
+                limit = self.number(schema, keyword)
+                checks.append(
+                    (
+                        "value {} {!r}".format(operator, limit),
+                        " violates {} {!r}".format(keyword, limit),
+                    )
+                )
+        if "multipleOf" in schema:
+            divisor = self.number(schema, "multipleOf")
+            if divisor <= 0:
+                raise RuntimeError(
+                    "ttr:validate_jsonschema: 'multipleOf' must be greater than 0"
+                )
+            checks.append(
+                (
+                    "not _is_multiple(value, {!r})".format(divisor),
+                    " violates multipleOf {!r}".format(divisor),
+                )
+            )
+        body.append(
+            "if isinstance(value, (int, float)) and not isinstance(value, bool):"
+        )
+        for condition, message in checks:
+            body.append("    if {}:".format(condition))
+            body.append(
+                "        return path + ': ' + repr(value) + {!r}".format(message)
+            )
+
+    def emit_string(self, schema, body):
+        """
+        Method to generate length, ``pattern`` and ``format`` checks for strings.
+        """
+        body.append("if isinstance(value, str):")
+        if "minLength" in schema:
+            limit = self.number(schema, "minLength", integer=True)
+            body.append("    if len(value) < {!r}:".format(limit))
+            body.append("        return path + ': ' + repr(value) + ' is too short'")
+        if "maxLength" in schema:
+            limit = self.number(schema, "maxLength", integer=True)
+            body.append("    if len(value) > {!r}:".format(limit))
+            body.append("        return path + ': ' + repr(value) + ' is too long'")
+        if "pattern" in schema:
+            regex = self.constant(re.compile(schema["pattern"]))
+            body.append("    if {}.search(value) is None:".format(regex))
+            body.append(
+                "        return path + ': ' + repr(value) + ' does not match pattern'"
+            )
+        if schema.get("format") in ("ipv4", "ipv6"):
+            body.append("    if not _is_{}(value):".format(schema["format"]))
+            body.append(
+                "        return path + ': ' + repr(value) + {!r}".format(
+                    " is not valid {}".format(schema["format"])
+                )
+            )
+        body.append("    pass")
+
+    def emit_object(self, schema, body):
+        """
+        Method to generate ``required`` and properties count checks, as well as
+        dispatch of properties values to their validation functions.
+        """
+        properties = schema.get("properties", {})
+        additional = schema.get("additionalProperties", True)
+        body.append("if isinstance(value, Mapping):")
+        for key in schema.get("required", []):
+            body.append("    if {!r} not in value:".format(key))
+            body.append(
+                "        return path + {!r}".format(
+                    ": missing required property {!r}".format(key)
+                )
+            )
+        if "minProperties" in schema:
+            limit = self.number(schema, "minProperties", integer=True)
+            body.append("    if len(value) < {!r}:".format(limit))
+            body.append("        return path + ': too few properties'")
+        if "maxProperties" in schema:
+            limit = self.number(schema, "maxProperties", integer=True)
+            body.append("    if len(value) > {!r}:".format(limit))
+            body.append("        return path + ': too many properties'")
+        if properties or additional is not True:
+            checks = "_p{}".format(len(self.tables))
+            self.tables.append(
+                (checks, {key: self.function(sub) for key, sub in properties.items()})
+            )
+            body.append("    for key, item in value.items():")
+            body.append("        check = {}.get(key)".format(checks))
+            body.append("        if check is None:")
+            if additional is False:
+                body.append(
+                    "            return path + ': additional property ' + repr(key) + ' not allowed'"
+                )
+            elif additional is True:
+                body.append("            continue")
+            else:
+                body.append("            check = {}".format(self.function(additional)))
+            body.append("        error = check(item, path + '/' + str(key))")
+            body.append("        if error:")
+            body.append("            return error")
+
+    def emit_array(self, schema, body):
+        """
+        Method to generate items count and uniqueness checks, as well as ``items``
+        validation function calls for each array item.
+        """
+        body.append("if isinstance(value, (list, tuple)):")
+        if "minItems" in schema:
+            limit = self.number(schema, "minItems", integer=True)
+            body.append("    if len(value) < {!r}:".format(limit))
+            body.append("        return path + ': too few items'")
+        if "maxItems" in schema:
+            limit = self.number(schema, "maxItems", integer=True)
+            body.append("    if len(value) > {!r}:".format(limit))
+            body.append("        return path + ': too many items'")
+        if schema.get("uniqueItems"):
+            body.append("    if not _is_unique(value):")
+            body.append("        return path + ': items are not unique'")
+        if "items" in schema:
+            if not isinstance(schema["items"], (Mapping, bool)):
+                raise RuntimeError(
+                    "ttr:validate_jsonschema: only single schema 'items' supported"
+                )
+            body.append("    for index, item in enumerate(value):")
+            body.append(
+                "        error = {}(item, path + '/' + str(index))".format(
+                    self.function(schema["items"])
+                )
+            )
+            body.append("        if error:")
+            body.append("            return error")
+        body.append("    pass")
+
+    def emit_ref(self, schema, body):
+        """
+        Method to generate call to ``$ref`` referenced schema validation function.
+        """
+        body.append("error = {}(value, path)".format(self.ref(schema["$ref"])))
+        body.append("if error:")
+        body.append("    return error")
+
+    def emit_all_of(self, schema, body):
+        """
+        Method to generate ``allOf`` check, first subschema error returned.
+        """
+        for sub in schema["allOf"]:
+            body.append("error = {}(value, path)".format(self.function(sub)))
+            body.append("if error:")
+            body.append("    return error")
+
+    def emit_any_of(self, schema, body):
+        """
+        Method to generate ``anyOf`` check, valid if any of subschemas matches.
+        """
+        functions = ", ".join(self.function(sub) for sub in schema["anyOf"])
+        body.append("if all(f(value, path) for f in ({},)):".format(functions))
+        body.append("    return path + ': does not match any of anyOf schemas'")
+
+    def emit_one_of(self, schema, body):
+        """
+        Method to generate ``oneOf`` check, valid if exactly one subschema matches.
+        """
+        functions = ", ".join(self.function(sub) for sub in schema["oneOf"])
+        body.append(
+            "if sum(1 for f in ({},) if not f(value, path)) != 1:".format(functions)
+        )
+        body.append("    return path + ': must match exactly one of oneOf schemas'")
+
+    def emit_not(self, schema, body):
+        """
+        Method to generate ``not`` check, valid if subschema does not match.
+        """
+        body.append("if not {}(value, path):".format(self.function(schema["not"])))
+        body.append("    return path + ': must not match not schema'")
+
+
+EMITTERS = [
+    (("$ref",), _SchemaCompiler.emit_ref),
+    (("type",), _SchemaCompiler.emit_type),
+    (("enum",), _SchemaCompiler.emit_enum),
+    (("const",), _SchemaCompiler.emit_const),
+    (
+        ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf"),
+        _SchemaCompiler.emit_numeric,
+    ),
+    (("minLength", "maxLength", "pattern", "format"), _SchemaCompiler.emit_string),
+    (
+        (
+            "properties",
+            "required",
+            "additionalProperties",
+            "minProperties",
+            "maxProperties",
+        ),
+        _SchemaCompiler.emit_object,
+    ),
+    (("items", "minItems", "maxItems", "uniqueItems"), _SchemaCompiler.emit_array),
+    (("allOf",), _SchemaCompiler.emit_all_of),
+    (("anyOf",), _SchemaCompiler.emit_any_of),
+    (("oneOf",), _SchemaCompiler.emit_one_of),
+    (("not",), _SchemaCompiler.emit_not),
+]
+
+KEYWORDS = {keyword for keywords, _ in EMITTERS for keyword in keywords}
+
+
+class CompiledSchema:
+    """
+    Class that holds validation function compiled from JSON Schema, calling class
+    instance with data item returns error string or None if data item is valid.
+
+    Instances can be pickled, e.g. to pass them to worker processes, validation
+    function recompiled from schema on unpickling.
+
+    :param schema: (dict) JSON Schema dictionary
+    :param name: (str) name of the schema to use in generated code filename
+    """
+
+    def __init__(self, schema, name="schema"):
+        self.schema = schema
+        self.name = name
+        self.source, constants = _SchemaCompiler(schema).compile()
+        namespace = {
+            "Mapping": Mapping,
+            "_json_equal": _json_equal,
+            "_is_unique": _is_unique,
+            "_is_multiple": _is_multiple,
+            "_is_ipv4": _is_ipv4,
+            "_is_ipv6": _is_ipv6,
+            **constants,
+        }
+        # source generated by _SchemaCompiler, schema values only embedded in it
+        # as repr() literals of validated numbers or via namespace constants
+        exec(  # nosec B102 # pylint: disable=exec-used
+            compile(self.source, "<ttr jsonschema {}>".format(name), "exec"),
+            namespace,
+        )
+        self._validate = namespace["_v0"]
+
+    def __call__(self, data):
+        return self._validate(data, "#")
+
+    def __reduce__(self):
+        return (self.__class__, (self.schema, self.name))
+
+
+def compile_schema(schema, name="schema"):
+    """
+    Function to compile JSON Schema into validation function.
+
+    :param schema: (dict) JSON Schema dictionary
+    :param name: (str) name of the schema to use in generated code filename
+    :return: ``CompiledSchema`` object, generated Python source code available
+        in its ``source`` attribute
+    """
+    return CompiledSchema(schema, name)
+
+
+def validate(
+    data, model_content, model_name, on_fail="raise", **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Validate data for compliance with JSON Schema.
+
+    :param data: (dict) dictionary data to validate
+    :param model_content: (obj) ``CompiledSchema`` object produced by ``compile_schema``
+    :param model_name: (str) name of the model
+    :param on_fail: (str) action to do if validation fails - ``raise`` (default) or ``log``
+    :param kwargs: (dict) any additional arguments ignored
+
+    Returns:
+
+    * True if validation succeeded
+    * False if validation failed and ``on_fail`` is "log"
+    * Raises ``RuntimeError`` exception if validation failed and ``on_fail`` is "raise"
+    """
+    error = model_content(data)
+    if error is None:
+        return True
+    error = "model '{}' {}".format(model_name, error)
+    if on_fail == "raise":
+        raise RuntimeError(
+            "ttr:validate_jsonschema: validation failed - '{}'".format(error)
+        )
+    if on_fail == "log":
+        log.error("ttr:validate_jsonschema: validation failed - '{}'".format(error))
+    return False
+
+
+def validate_batch(
+    data, model_content, model_name, on_fail="raise", **kwargs
+):  # pylint: disable=unused-argument
+    """
+    Validate a list of data items for compliance with the same JSON Schema.
+
+    :param data: (list) list of dictionaries data to validate
+    :param model_content: (obj) ``CompiledSchema`` object produced by ``compile_schema``
+    :param model_name: (str) name of the model
+    :param on_fail: (str) action to do if validation fails - ``raise`` (default) or ``log``,
+        for any other value failures only returned in results
+    :param kwargs: (dict) any additional arguments ignored
+
+    Returns a list of ``(index, valid, error)`` tuples, one per data item, where ``index``
+    is data item position in ``data`` list, ``valid`` is True or False and ``error`` is
+    error message string or None.
+
+    If ``on_fail`` is "raise", ``RuntimeError`` exception raised after all items validated
+    if any of them failed validation.
+    """
+    ret = []
+    failed = []
+    for index, item in enumerate(data):
+        error = model_content(item)
+        if error is None:
+            ret.append((index, True, None))
+            continue
+        ret.append((index, False, error))
+        failed.append("item {} - '{}'".format(index, error))
+        if on_fail == "log":
+            log.error(
+                "ttr:validate_jsonschema: model '{}' validation failed - {}".format(
+                    model_name, failed[-1]
+                )
+            )
+
+    if failed and on_fail == "raise":
+        raise RuntimeError(
+            "ttr:validate_jsonschema: model '{}' validation failed for {} of {} items - {}".format(
+                model_name, len(failed), len(data), "; ".join(failed)
+            )
+        )
+
+    return ret
@@ -7,6 +7,17 @@ Yangson Data Validation
 This plugin relies on Yangson library for data instance validation using YANG models.
 
 .. autofunction:: ttr.plugins.validate.validate_yangson.validate
+
+Batch validation function validates a list of data items against the same model.
+Validation scope and content type resolved once per batch and, if model has no
+``when`` statements, check of data item members against model schema done once
+for each distinct set of members, instead of doing it for each data item.
+
+That optimization relies on Yangson schema node internals, if those are not available
+in installed Yangson release, batch validation falls back to validating each data item
+using Yangson public API.
+
+.. autofunction:: ttr.plugins.validate.validate_yangson.validate_batch
 """
 import logging
 
@@ -14,13 +25,25 @@ log = logging.getLogger(__name__)
 
 try:
     from yangson import enumerations
+    from yangson.instance import InstanceNode
+    from yangson.schemanode import InternalNode
 
     HAS_LIBS = True
+    # batch fast path uses these Yangson internals, check they are still there
+    HAS_INTERNALS = all(
+        callable(getattr(cls, name, None))
+        for cls, name in (
+            (InternalNode, "_check_schema_pattern"),
+            (InternalNode, "_validate"),
+            (InstanceNode, "_member"),
+        )
+    )
 except ImportError:
     log.debug(
         "ttr.yangson_model_validator: failed to import Yangson library, make sure it is installed"
     )
     HAS_LIBS = False
+    HAS_INTERNALS = False
 
 
 def validate(
@@ -49,6 +72,41 @@ def validate(
     * False if validation failed and ``on_fail`` is "log"
     * Raises ``RuntimeError`` exception if validation failed and ``on_fail`` is "raise"
     """
+    scope, ctype = _get_enumerations(validation_scope, content_type)
+
+    # run validation of data
+    _data = None
+    try:
+        _data = _prefix_keys(data, model_name)
+        inst = model_content.from_raw(_data)
+        _ = inst.validate(scope=scope, ctype=ctype)
+    except Exception as e:
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "ttr:validate_yangson: validation failed, Original Data:\n'{}';\nPrepared Data:\n'{}',\nModel '{}';\nModel tree:\n'{}'".format(
+                    data, _data, model_content, model_content.ascii_tree()
+                )
+            )
+        if on_fail == "raise":
+            raise RuntimeError(
+                "ttr:validate_yangson: validation failed - '{}'".format(e)
+            )
+        if on_fail == "log":
+            log.error("ttr:validate_yangson: validation failed - '{}'".format(e))
+            return False
+
+    return True
+
+
+def _get_enumerations(validation_scope, content_type):
+    """
+    Helper function to map validation scope and content type strings to
+    Yangson enumerations.
+
+    :param validation_scope: (str) all, semantics or syntax
+    :param content_type: (str) all, config or nonconfig
+    :return: tuple of ``(ValidationScope, ContentType)``
+    """
     # decide on validation scopes and content
     if validation_scope == "all":
         scope = enumerations.ValidationScope.all
@@ -62,29 +120,137 @@ def validate(
         ctype = enumerations.ContentType.config
     elif content_type == "nonconfig":
         ctype = enumerations.ContentType.nonconfig
+    return scope, ctype
 
-    # run validation of data
-    try:
-        _data = {
-            "{}:{}".format(model_name, k)
-            if not k.startswith("{}:".format(model_name))
-            else k: d
-            for k, d in data.items()
-        }
-        inst = model_content.from_raw(_data)
-        _ = inst.validate(scope=scope, ctype=ctype)
-    except Exception as e:
+
+def _prefix_keys(data, model_name):
+    """
+    Helper function to prefix data keys with model name.
+
+    :param data: (dict) data item
+    :param model_name: (str) name of the model
+    :return: dictionary with keys prefixed with ``<model_name>:``
+    """
+    prefix = "{}:".format(model_name)
+    return {k if k.startswith(prefix) else prefix + k: d for k, d in data.items()}
+
+
+def _has_when(schema_node):
+    """
+    Helper function to check if schema node or any of its descendants has
+    ``when`` statement, in which case members allowed depend on data values.
+
+    :param schema_node: (obj) Yangson schema node
+    :return: True or False
+    """
+    if getattr(schema_node, "when", None) is not None:
+        return True
+    return any(_has_when(child) for child in getattr(schema_node, "children", []))
+
+
+def _validate_instance(inst, scope, ctype, checked_members):
+    """
+    Helper function to validate instance of top level schema node, checking data
+    members against schema only once for each distinct set of members.
+
+    :param inst: (obj) Yangson RootNode instance to validate
+    :param scope: (obj) Yangson ValidationScope
+    :param ctype: (obj) Yangson ContentType
+    :param checked_members: (set) set of members sets that passed schema check
+
+    Replicates ``InternalNode._validate`` of Yangson, only used if ``HAS_INTERNALS``.
+    """
+    # pylint: disable=protected-access
+    schema = inst.schema_node
+    if scope.value & enumerations.ValidationScope.syntax.value:
+        members = frozenset(inst.value)
+        if members not in checked_members:
+            schema._check_schema_pattern(inst, ctype)
+            checked_members.add(members)
+    for member in inst:
+        inst._member(member).validate(scope, ctype)
+    super(InternalNode, schema)._validate(inst, scope, ctype)
+
+
+def validate_batch(
+    data,
+    model_content,
+    model_name,
+    validation_scope="all",
+    content_type="all",
+    on_fail="raise",
+):
+    """
+    Validate a list of data items for compliance with the same YANG model.
+
+    :param data: (list) list of dictionaries data to validate
+    :param model_content: (obj) Fully instantiated Yangson DataModel object
+    :param model_name: (str) name of the model
+    :param content_type: (str) optional, content type as per
+        https://yangson.labs.nic.cz/enumerations.html supported - all, config, nonconfig
+    :param validation_scope: (str) optional, validation scope as per
+        https://yangson.labs.nic.cz/enumerations.html supported - all, semantics, syntax
+    :param on_fail: (str) action to do if validation fails - ``raise`` (default) or ``log``,
+        for any other value failures only returned in results
+
+    Returns a list of ``(index, valid, error)`` tuples, one per data item, where ``index``
+    is data item position in ``data`` list, ``valid`` is True or False and ``error`` is
+    error message string or None.
+
+    If ``on_fail`` is "raise", ``RuntimeError`` exception raised on first data item that
+    failed validation, same as ``validate`` function does.
+    """
+    scope, ctype = _get_enumerations(validation_scope, content_type)
+    schema = model_content.schema
+    # use fast path only if members allowed do not depend on data values
+    fast_path = (
+        HAS_INTERNALS
+        and getattr(type(schema), "_validate") is getattr(InternalNode, "_validate")
+        and not _has_when(schema)
+    )
+    checked_members = set()
+    ret = []
+    failed = []
+
+    for index, item in enumerate(data):
+        _data = None
+        try:
+            _data = _prefix_keys(item, model_name)
+            inst = model_content.from_raw(_data)
+            if fast_path:
+                _validate_instance(inst, scope, ctype, checked_members)
+            else:
+                inst.validate(scope=scope, ctype=ctype)
+            ret.append((index, True, None))
+        except Exception as e:
+            ret.append((index, False, str(e)))
+            failed.append("item {} - '{}'".format(index, e))
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "ttr:validate_yangson: validation failed, Original Data:\n'{}';\nPrepared Data:\n'{}',\nModel '{}'".format(
+                        item, _data, model_name
+                    )
+                )
+            if on_fail == "raise":
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        "ttr:validate_yangson: model '{}' tree:\n'{}'".format(
+                            model_name, model_content.ascii_tree()
+                        )
+                    )
+                raise RuntimeError(
+                    "ttr:validate_yangson: validation failed - '{}'".format(e)
+                )
+            if on_fail == "log":
+                log.error(
+                    "ttr:validate_yangson: validation failed - {}".format(failed[-1])
+                )
+
+    if failed and log.isEnabledFor(logging.DEBUG):
         log.debug(
-            "ttr:validate_yangson: validation failed, Original Data:\n'{}';\nPrepared Data:\n'{}',\nModel '{}';\nModel tree:\n'{}'".format(
-                data, _data, model_content, model_content.ascii_tree()
+            "ttr:validate_yangson: model '{}' tree:\n'{}'".format(
+                model_name, model_content.ascii_tree()
             )
         )
-        if on_fail == "raise":
-            raise RuntimeError(
-                "ttr:validate_yangson: validation failed - '{}'".format(e)
-            )
-        if on_fail == "log":
-            log.error("ttr:validate_yangson: validation failed - '{}'".format(e))
-            return False
 
-    return True
+    return ret
@@ -0,0 +1,285 @@
+"""
+Yangson Compiled Data Validation
+********************************
+
+**Reference name** ``yangson_compiled``
+
+This plugin walks Yangson DataModel once and compiles a checker function for it,
+checker function then used to validate data syntax without constructing Yangson
+instance objects for each data item.
+
+Checker functions can be compiled for models that consist of top level leaves of
+these types:
+
+* ``string`` and types derived from it, e.g. ``inet:ipv4-address``, including
+  ``length`` and ``pattern`` restrictions
+* ``int8``, ``int16``, ``int32``, ``uint8``, ``uint16``, ``uint32`` including
+  ``range`` restrictions
+* ``boolean`` and ``enumeration``
+
+Checker function verifies that all mandatory leaves present, no unknown leaves
+given and leaves' values are of correct type and within restrictions.
+
+If model contains any other statements, e.g. containers, lists, ``when`` statements
+or other types, this plugin falls back to ``yangson`` validation plugin. If model
+leaves have ``must`` statements, compiled checker used for ``syntax`` validation
+scope while ``yangson`` plugin used for ``semantics`` validation scope.
+
+Models loaded using ``yangson`` models loader plugin.
+
+.. autofunction:: ttr.plugins.validate.validate_yangson_compiled.validate
+.. autofunction:: ttr.plugins.validate.validate_yangson_compiled.validate_batch
+"""
+import logging
+import weakref
+
+from . import validate_yangson
+from .validate_yangson import _has_when, _prefix_keys
+
+log = logging.getLogger(__name__)
+
+try:
+    from yangson import datatype
+    from yangson.schemanode import LeafNode
+
+    HAS_LIBS = True
+except ImportError:
+    log.debug(
+        "ttr.yangson_compiled_model_validator: failed to import Yangson library, make sure it is installed"
+    )
+    HAS_LIBS = False
+
+# cache of compiled checkers keyed by DataModel object
+_checkers = weakref.WeakKeyDictionary()
+
+
+def _compile_type_check(leaf_type):
+    """
+    Function to compile check function for leaf type.
+
+    :param leaf_type: (obj) Yangson DataType object
+    :return: function that returns error string or None, or None if type not supported
+    """
+    type_name = str(leaf_type)
+
+    if type(leaf_type) is datatype.StringType:  # pylint: disable=unidiomatic-typecheck
+        length = leaf_type.length
+        patterns = [(p.regex.match, p.invert_match) for p in leaf_type.patterns]
+
+        def check_string(value):
+            if not isinstance(value, str):
+                return "expected {} value".format(type_name)
+            if length and len(value) not in length:
+                return "invalid length: {}".format(value)
+            for match, invert_match in patterns:
+                if (match(value) is not None) == invert_match:
+                    return "pattern mismatch: {}".format(value)
+            return None
+
+        return check_string
+
+    if type(leaf_type) in (  # pylint: disable=unidiomatic-typecheck
+        datatype.Int8Type,
+        datatype.Int16Type,
+        datatype.Int32Type,
+        datatype.Uint8Type,
+        datatype.Uint16Type,
+        datatype.Uint32Type,
+    ):
+        value_range = leaf_type.range
+        low, high = leaf_type._range  # pylint: disable=protected-access
+
+        def check_integer(value):
+            if not isinstance(value, int) or isinstance(value, bool):
+                return "expected {} value".format(type_name)
+            if value_range is None:
+                if not low <= value <= high:
+                    return "not in range: {}".format(value)
+            elif value not in value_range:
+                return "not in range: {}".format(value)
+            return None
+
+        return check_integer
+
+    if type(leaf_type) is datatype.BooleanType:  # pylint: disable=unidiomatic-typecheck
+
+        def check_boolean(value):
+            if not isinstance(value, bool):
+                return "expected {} value".format(type_name)
+            return None
+
+        return check_boolean
+
+    if (
+        type(leaf_type)  # pylint: disable=unidiomatic-typecheck
+        is datatype.EnumerationType
+    ):
+        enum = frozenset(leaf_type.enum)
+
+        def check_enumeration(value):
+            if not isinstance(value, str) or value not in enum:
+                return "invalid enumeration value: {}".format(value)
+            return None
+
+        return check_enumeration
+
+    return None
+
+
+def compile_model(model_content):
+    """
+    Function to compile checker function for model.
+
+    :param model_content: (obj) Fully instantiated Yangson DataModel object
+    :return: tuple of ``(checker function, has_semantics)``, where checker function
+        takes dictionary with keys prefixed by model name and returns error string or
+        None, checker function is None if model not supported
+    """
+    schema = model_content.schema
+    if _has_when(schema):
+        return None, True
+
+    leaves_checks = {}
+    mandatory = []
+    has_semantics = False
+    for child in schema.children:
+        if type(child) is not LeafNode:  # pylint: disable=unidiomatic-typecheck
+            return None, True
+        if not child.config:
+            return None, True
+        check = _compile_type_check(child.type)
+        if check is None:
+            return None, True
+        if child.must:
+            has_semantics = True
+        leaves_checks[child.iname()] = check
+        if child.mandatory:
+            mandatory.append(child.iname())
+
+    def checker(data):
+        for key, value in data.items():
+            check = leaves_checks.get(key)
+            if check is None:
+                return "member not allowed: {}".format(key)
+            error = check(value)
+            if error:
+                return "{{/{}}} {}".format(key, error)
+        for key in mandatory:
+            if key not in data:
+                return "missing-data: expected '{}'".format(key)
+        return None
+
+    return checker, has_semantics
+
+
+def _get_checker(model_content):
+    """
+    Helper function to retrieve compiled checker from cache or compile it.
+    """
+    try:
+        return _checkers[model_content]
+    except KeyError:
+        _checkers[model_content] = compile_model(model_content)
+        return _checkers[model_content]
+
+
+def validate(
+    data,
+    model_content,
+    model_name,
+    validation_scope="all",
+    content_type="all",
+    on_fail="raise",
+):
+    """
+    Validate data for compliance with YANG modules using compiled checker function.
+
+    :param data: (dict) dictionary data to validate
+    :param model_content: (obj) Fully instantiated Yangson DataModel object
+    :param model_name: (str) name of the model
+    :param content_type: (str) optional, content type as per
+        https://yangson.labs.nic.cz/enumerations.html supported - all, config, nonconfig
+    :param validation_scope: (str) optional, validation scope as per
+        https://yangson.labs.nic.cz/enumerations.html supported - all, semantics, syntax
+    :param on_fail: (str) action to do if validation fails - ``raise`` (default) or ``log``
+
+    Returns:
+
+    * True if validation succeeded
+    * False if validation failed and ``on_fail`` is "log"
+    * Raises ``RuntimeError`` exception if validation failed and ``on_fail`` is "raise"
+    """
+    results = validate_batch(
+        [data], model_content, model_name, validation_scope, content_type, on_fail
+    )
+    return results[0][1]
+
+
+def validate_batch(
+    data,
+    model_content,
+    model_name,
+    validation_scope="all",
+    content_type="all",
+    on_fail="raise",
+):
+    """
+    Validate a list of data items for compliance with the same YANG model using
+    compiled checker function.
+
+    Takes the same arguments and returns the same results as ``yangson`` plugin
+    ``validate_batch`` function.
+    """
+    checker, has_semantics = _get_checker(model_content)
+    if (
+        checker is None
+        or content_type == "nonconfig"
+        or validation_scope == "semantics"
+    ):
+        return validate_yangson.validate_batch(
+            data, model_content, model_name, validation_scope, content_type, on_fail
+        )
+
+    ret = []
+    semantics = []  # items to validate using yangson
+    for index, item in enumerate(data):
+        error = checker(_prefix_keys(item, model_name))
+        if error is not None:
+            ret.append((index, False, error))
+            continue
+        if has_semantics and validation_scope == "all":
+            semantics.append(index)
+        ret.append((index, True, None))
+
+    # run semantics validation for items that passed syntax validation
+    if semantics:
+        results = validate_yangson.validate_batch(
+            [data[index] for index in semantics],
+            model_content,
+            model_name,
+            "semantics",
+            content_type,
+            on_fail=None,
+        )
+        for position, valid, error in results:
+            if not valid:
+                ret[semantics[position]] = (semantics[position], False, error)
+
+    failed = [
+        "item {} - '{}'".format(index, error)
+        for index, valid, error in ret
+        if not valid
+    ]
+    if failed and on_fail == "log":
+        for error in failed:
+            log.error(
+                "ttr:validate_yangson_compiled: validation failed - {}".format(error)
+            )
+    if failed and on_fail == "raise":
+        raise RuntimeError(
+            "ttr:validate_yangson_compiled: validation failed for {} of {} items - {}".format(
+                len(failed), len(data), "; ".join(failed)
+            )
+        )
+
+    return ret
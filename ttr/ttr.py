@@ -34,18 +34,29 @@ and ``result_name_key`` keys.
 Various plugins can be used to load data in a list of dictionaries with other plugins
 helping to process and validate it, render and save results.
 """
+import inspect
 import logging
 import os
-from .plugins.data import data_plugins
-from .plugins.renderers import renderers_plugins
-from .plugins.returners import returners_plugins
-from .plugins.processors import processors_plugins
+import time
+from .plugins.data import data_plugins, data_stream_plugins
+from .plugins.renderers import renderers_plugins, renderers_stream_plugins
+from .plugins.returners import returners_plugins, returners_stream_plugins
+from .plugins.processors import processors_plugins, processors_stream_plugins
 from .plugins.templates import templates_loaders_plugins
-from .plugins.validate import validate_plugins
+from .plugins.validate import validate_plugins, validate_batch_plugins
 from .plugins.models import models_loaders_plugins
+from .utils import workbook_cache
 
 log = logging.getLogger(__name__)
 
+# processors that do not change ``result_name_key`` values of data items, such that
+# ``filtering`` processor running after them can be pushed down into data plugins
+PUSHDOWN_SAFE_PROCESSORS = ("multitemplate", "templates_split")
+
+# number of streamed data items to validate at once, such that batch and parallel
+# validation applies while memory usage stays bounded
+VALIDATION_CHUNK_SIZE = 500
+
 
 class ttr:
     """
@@ -54,7 +65,9 @@ class ttr:
     :param data: (str) type depends on data plugin in use, but can be an OS
         path string referring to YAML structured text file or CSV spreadsheet
     :param data_plugin: (str) name of data plugin to use to load data
-    :param data_plugin_kwargs: (dict) arguments to pass on to data plugin
+    :param data_plugin_kwargs: (dict) arguments to pass on to data plugin, data plugins
+        that accept ``result_name_key`` argument also receive ``filtering`` processor
+        ``filters`` to skip data items while loading data
     :param renderer: (str) name of renderer plugin to use, default ``jinja2``
     :param renderer_kwargs: (dict) arguments to pass on to renderer plugin
     :param templates: (str) OS pat to directory or excel spreadsheet file with templates,
@@ -73,8 +86,30 @@ class ttr:
         to use to validate that particular datum, default ``model``
     :param models_dict: (dict) dictionary of {model_name: model_content}
     :param validator: (str) validator plugin to use to validate provided data against models,
-        default is ``yangson``
-    :param validator_kwargs: (dict) arguments to pass on to validator plugin
+        default is ``yangson``, supported ``yangson``, ``yangson_compiled`` and ``jsonschema``
+    :param validator_kwargs: (dict) arguments to pass on to validator plugin, except for
+        ``workers`` argument - number of processes to use for data validation
+    :param results_cache: (str) OS path to SQLite database file to cache rendering results
+        in, if provided, only results with changed data or templates rendered on subsequent runs
+    :param render_profile: (str) OS path to file to save ``cProfile`` statistics of rendering
+        phase in ``.pstats`` format
+    :param models_cache: (str) OS path to SQLite database file to cache compiled models in,
+        if provided, unchanged models loaded from cache on subsequent runs
+    :param validation_cache: (str) OS path to SQLite database file to cache validation results
+        in, if provided, data items that passed validation before with the same model files
+        content not validated again
+
+    TTR object ``stats`` attribute contains per-stage statistics dictionary, for example::
+
+        {"stages": {"data_plugin:xlsx": {"calls": 1, "time": 0.015, "items": 4, "bytes": 0},
+                    "processor:multitemplate": {"calls": 1, "time": 0.001, "items": 8, "bytes": 0},
+                    "load_models": {"calls": 1, "time": 0.321, "items": 2, "bytes": 0},
+                    "validate_data": {"calls": 1, "time": 0.002, "items": 0, "bytes": 0},
+                    "renderer:jinja2": {"calls": 1, "time": 0.004, "items": 2, "bytes": 335},
+                    "returner:self": {"calls": 1, "time": 0.0, "items": 2, "bytes": 335}}}
+
+    Where ``time`` is a total wall time in seconds, ``items`` - number of data items, models
+    or results produced by the stage and ``bytes`` - size of rendered results in bytes.
     """
 
     def __init__(
@@ -97,6 +132,10 @@ class ttr:
         templates_dict=None,
         models_dict=None,
         validator_kwargs=None,
+        results_cache=None,
+        render_profile=None,
+        models_cache=None,
+        validation_cache=None,
     ):
         self.data_plugin = data_plugin
         self.data_plugin_kwargs = data_plugin_kwargs or {}
@@ -117,6 +156,13 @@ class ttr:
         self.data_loaded = []
         self.validator_kwargs = validator_kwargs or {}
         self.models_dir = models_dir
+        self.results_cache = results_cache
+        self.render_profile = render_profile
+        self.models_cache = models_cache
+        self.validation_cache = validation_cache
+        self._validation_cache_db = None
+        self._models_hashes = {}
+        self.stats = {"stages": {}}
 
         # load and validate data to render
         if data:
@@ -126,15 +172,78 @@ class ttr:
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
+        if self._validation_cache_db is not None:
+            self._validation_cache_db.close()
+            self._validation_cache_db = None
+        workbook_cache.clear()
         del self.data_loaded, self.templates_dict, self.results
 
+    def _record_stats(self, stage, start, items=0, size=0):
+        """
+        Helper method to record stage statistics in ``self.stats`` dictionary.
+
+        :param stage: (str) name of the stage
+        :param start: (float) ``time.perf_counter`` value at the beginning of the stage
+        :param items: (int) number of items produced by the stage
+        :param size: (int) number of bytes produced by the stage
+        """
+        stage_stats = self.stats["stages"].setdefault(
+            stage, {"calls": 0, "time": 0.0, "items": 0, "bytes": 0}
+        )
+        stage_stats["calls"] += 1
+        stage_stats["time"] += time.perf_counter() - start
+        stage_stats["items"] += items
+        stage_stats["bytes"] += size
+
     def load_data(self, data, data_plugin=None):
         """
         Method to load data to render.
 
         :param data: (str) data to load, either OS path to data file or text
         :param data_plugin: (str) name of data plugin to load data, by default will
-            choose data loader plugin based on file extension e.g. ``xlsx, csv, yaml/yml``
+            choose data loader plugin based on file extension e.g. ``xlsx, csv, yaml/yml,
+            jsonl/json``, ``.gz`` extension of compressed files ignored
+        """
+        # workbooks opened while loading data closed once data loaded
+        with workbook_cache.scope():
+            data_loaded = self._run_data_plugin(data, data_plugin)
+
+            # process loaded data
+            data_loaded = self.process_data(data_loaded)
+
+            # validate loaded data
+            self.validate_data(data_loaded)
+
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Data loaded:\n{}".format(data_loaded))
+
+        # add loaded data to overall data
+        self.data_loaded.extend(data_loaded)
+
+    def _pushdown_filters(self):
+        """
+        Helper method to get ``filtering`` processor filters that data plugins can
+        apply while loading data.
+
+        :return: list of glob patterns or None if filtering cannot be pushed down
+        """
+        for processor_plugin in self.processors:
+            if processor_plugin == "filtering":
+                filters = self.processors_kwargs.get("filters")
+                return filters if filters and any(filters) else None
+            if processor_plugin not in PUSHDOWN_SAFE_PROCESSORS:
+                return None
+        return None
+
+    def _run_data_plugin(self, data, data_plugin=None, stream=False):
+        """
+        Helper method to decide on data loader plugin to use and to load data with it.
+
+        :param data: (str) data to load, either OS path to data file or text
+        :param data_plugin: (str) name of data plugin to load data
+        :param stream: (bool) if True, use streaming data plugin if available
+        :return: data loaded by data plugin or tuple of ``(data items iterator,
+            counter dictionary)`` if streaming data plugin used
         """
         # decide on data loader plugin to use
         if data_plugin:
@@ -142,8 +251,12 @@ class ttr:
         elif self.data_plugin:
             plugin_name = self.data_plugin
         elif os.path.isfile(data[:5000]):
-            # get data loader name based on data file extension
-            plugin_name = data.split(".")[-1].strip()
+            # get data loader name based on data file extension, e.g. "jsonl" for
+            # "data.jsonl.gz" compressed file
+            extensions = data.split(".")
+            if len(extensions) > 2 and extensions[-1].strip().lower() == "gz":
+                extensions.pop()
+            plugin_name = extensions[-1].strip()
         else:
             raise RuntimeError(
                 "ttr: failed to identify data loader plugin for '{}'".format(data[:100])
@@ -151,27 +264,84 @@ class ttr:
 
         # load data using data loader plugin
         log.debug("Loading data using '{}' plugin".format(plugin_name))
-        data_loaded = data_plugins[plugin_name](
+        start = time.perf_counter()
+        stream = stream and plugin_name in data_stream_plugins
+        if stream:
+            data_plugin = data_stream_plugins[plugin_name]
+        else:
+            data_plugin = data_plugins[plugin_name]
+        data_plugin_kwargs = dict(self.data_plugin_kwargs)
+        # push filtering down into data plugins that support it
+        if "result_name_key" in inspect.signature(data_plugin).parameters:
+            data_plugin_kwargs.setdefault("result_name_key", self.result_name_key)
+            filters = self._pushdown_filters()
+            if filters:
+                data_plugin_kwargs.setdefault("filters", filters)
+        if data_plugin_kwargs.get("snapshot_cache"):
+            data_plugin_kwargs.setdefault(
+                "stats",
+                self.stats.setdefault("snapshot_cache", {"hits": 0, "misses": 0}),
+            )
+        data_loaded = data_plugin(
             data,
             template_name_key=self.template_name_key,
             templates_dict=self.templates_dict,
-            **self.data_plugin_kwargs,
+            **data_plugin_kwargs,
         )
+        if stream:
+            counter = {"items": 0, "time": time.perf_counter() - start}
+            return (
+                self._count_data_stream(data_loaded, plugin_name, counter),
+                counter,
+            )
+        self._record_stats(
+            "data_plugin:{}".format(plugin_name),
+            start,
+            items=len(data_loaded) if isinstance(data_loaded, list) else 0,
+        )
+        return data_loaded
 
-        # process loaded data
-        data_loaded = self.process_data(data_loaded)
-
-        # load data models for validation
-        self.load_models()
+    def _count_data_stream(self, data, plugin_name, counter):
+        """
+        Generator method to count data items produced by streaming data plugin,
+        recording data plugin stage statistics once all data items produced.
 
-        # validate loaded data
-        self.validate_data(data_loaded)
+        :param data: (iterable) data items produced by data plugin
+        :param plugin_name: (str) name of data plugin
+        :param counter: (dict) dictionary with ``items`` and ``time`` keys to update
+        :return: yields data items
+        """
+        yield from self._count_stage(data, counter)
+        self._record_stats(
+            "data_plugin:{}".format(plugin_name),
+            time.perf_counter() - counter["time"],
+            items=counter["items"],
+        )
 
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug("Data loaded:\n{}".format(data_loaded))
+    def _iter_data(self, data, data_plugin=None):
+        """
+        Generator method to load data and pass it through processors one item at a
+        time, validating processed items in chunks of ``VALIDATION_CHUNK_SIZE`` items.
 
-        # add loaded data to overall data
-        self.data_loaded.extend(data_loaded)
+        :param data: (str) data to load, either OS path to data file or text
+        :param data_plugin: (str) name of data plugin to load data
+        :return: yields processed and validated data items
+        """
+        data_loaded = self._run_data_plugin(data, data_plugin, stream=True)
+        upstream_counter = None
+        if isinstance(data_loaded, tuple):
+            data_loaded, upstream_counter = data_loaded
+
+        chunk = []
+        for item in self.process_data_iter(data_loaded, upstream_counter):
+            chunk.append(item)
+            if len(chunk) >= VALIDATION_CHUNK_SIZE:
+                self.validate_data(chunk)
+                yield from chunk
+                chunk = []
+        if chunk:
+            self.validate_data(chunk)
+            yield from chunk
 
     def process_data(self, data):
         """
@@ -180,20 +350,87 @@ class ttr:
         :param data: (list) list of dictionaries data to process
         :return: processed data
         """
+        return list(self.process_data_iter(data))
+
+    def _run_list_processor(self, processor_plugin, data, **kwargs):
+        """
+        Generator method to adapt processor plugins that take and return a list of data
+        items to processors pipeline.
+
+        :param processor_plugin: (str) name of processor plugin to run
+        :param data: (iterable) data items to process
+        :param kwargs: (dict) arguments to pass on to processor plugin
+        :return: yields processed data items
+        """
+        yield from processors_plugins[processor_plugin](data=list(data), **kwargs)
+
+    def _count_stage(self, data, counter):
+        """
+        Generator method to count data items produced by processors pipeline stage
+        and time spent producing them.
+
+        :param data: (iterable) data items produced by the stage
+        :param counter: (dict) dictionary with ``items`` and ``time`` keys to update
+        :return: yields data items
+        """
+        iterator = iter(data)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                counter["time"] += time.perf_counter() - start
+                return
+            counter["time"] += time.perf_counter() - start
+            counter["items"] += 1
+            yield item
+
+    def process_data_iter(self, data, upstream_counter=None):
+        """
+        Generator function to pass data through a pipeline of processor plugins
+        chained together, such that each data item goes through all processors
+        in a single pass.
+
+        Processors that have ``process_iter`` streaming plugin run as generators,
+        other processors collect data items produced so far in a list.
+
+        :param data: (iterable) data items to process
+        :param upstream_counter: (dict) counter of the stage that produces ``data``
+            items, to not include its time in processors stages times
+        :return: yields processed data items
+        """
+        kwargs = {
+            "data_plugin": self.data_plugin,
+            "template_name_key": self.template_name_key,
+            "result_name_key": self.result_name_key,
+            **self.processors_kwargs,
+        }
+        counters = []
         for processor_plugin in self.processors:
             log.debug(
                 "ttr: running loaded data through processor: '{}'".format(
                     processor_plugin
                 )
             )
-            data = processors_plugins[processor_plugin](
-                data=data,
-                data_plugin=self.data_plugin,
-                template_name_key=self.template_name_key,
-                result_name_key=self.result_name_key,
-                **self.processors_kwargs,
+            if processor_plugin in processors_stream_plugins:
+                data = processors_stream_plugins[processor_plugin](data=data, **kwargs)
+            else:
+                data = self._run_list_processor(processor_plugin, data, **kwargs)
+            counter = {"items": 0, "time": 0.0}
+            counters.append((processor_plugin, counter))
+            data = self._count_stage(data, counter)
+
+        yield from data
+
+        # stages times include time spent in previous stages, subtract it
+        upstream_time = upstream_counter["time"] if upstream_counter else 0.0
+        for processor_plugin, counter in counters:
+            self._record_stats(
+                "processor:{}".format(processor_plugin),
+                time.perf_counter() - (counter["time"] - upstream_time),
+                items=counter["items"],
             )
-        return data
+            upstream_time = counter["time"]
 
     def validate_data(self, data):
         """
@@ -204,24 +441,185 @@ class ttr:
 
         Running validation raises or logs error on validation failure
         depending on value of ``on_fail`` argument in ``validator_kwargs``
+
+        Only models referenced by data items and not loaded yet, loaded from
+        ``models_dir``, if no data items reference models, no models loaded.
         """
-        for item in data:
+        # load data models referenced by data items
+        missing_models = {
+            item[self.model_name_key]
+            for item in data
+            if self.model_name_key in item
+            and item[self.model_name_key] not in self.models_dict
+        }
+        if missing_models:
+            self.load_models(models=sorted(missing_models))
+
+        start = time.perf_counter()
+        validator_kwargs = dict(self.validator_kwargs)
+        workers = validator_kwargs.pop("workers", None)
+
+        # group items by model
+        batches = {}
+        for index, item in enumerate(data):
             if self.model_name_key in item:
                 model_name = item.pop(self.model_name_key)
-                validate_plugins[self.validator](
-                    data=item,
-                    model_content=self.models_dict[model_name],
-                    model_name=model_name,
-                    **self.validator_kwargs,
+                batches.setdefault(model_name, []).append((index, item))
+        validated = sum(len(items) for items in batches.values())
+
+        # skip items that passed validation on previous runs
+        cache_keys = {}
+        if self.validation_cache and batches:
+            batches, cache_keys = self._check_validation_cache(
+                batches, validator_kwargs
+            )
+
+        passed = []  # indexes of items that passed validation
+        try:
+            self._validate_batches(batches, workers, passed, **validator_kwargs)
+        finally:
+            if cache_keys:
+                self._validation_cache_db.update(
+                    [cache_keys[index] for index in passed if index in cache_keys]
+                )
+        self._record_stats("validate_data", start, items=validated)
+
+    def _validate_batches(self, batches, workers, passed, **validator_kwargs):
+        """
+        Helper method to validate data items, in batches per model if validator
+        supports it.
+
+        :param batches: (dict) dictionary of ``{model_name: [(index, data item), ...]}``
+        :param workers: (int) number of worker processes to use for batch validation
+        :param passed: (list) list to add indexes of items that passed validation to
+        :param validator_kwargs: (dict) arguments to pass on to validator plugin
+        """
+        if self.validator not in validate_batch_plugins:
+            for model_name, items in batches.items():
+                for index, item in items:
+                    if validate_plugins[self.validator](
+                        data=item,
+                        model_content=self.models_dict[model_name],
+                        model_name=model_name,
+                        **validator_kwargs,
+                    ):
+                        passed.append(index)
+            return
+        to_validate = sum(len(items) for items in batches.values())
+        if workers and workers > 1 and to_validate > 1:
+            self._validate_parallel(batches, workers, passed, **validator_kwargs)
+            return
+        for model_name, items in batches.items():
+            results = validate_batch_plugins[self.validator](
+                data=[item for _, item in items],
+                model_content=self.models_dict[model_name],
+                model_name=model_name,
+                **validator_kwargs,
+            )
+            passed.extend(items[index][0] for index, valid, _ in results if valid)
+
+    def _check_validation_cache(self, batches, validator_kwargs):
+        """
+        Helper method to remove items that passed validation on previous runs from
+        batches using ``validation_cache`` database.
+
+        :param batches: (dict) dictionary of ``{model_name: [(index, data item), ...]}``
+        :param validator_kwargs: (dict) validator plugin arguments
+        :return: tuple of batches with items to validate and dictionary of
+            ``{index: cache key}`` for items to validate
+        """
+        # import here to not slow down TTR startup when validation cache not in use
+        # pylint: disable=import-outside-toplevel
+        from .utils.models_cache import hash_model_directory, hash_model_file
+        from .utils.validation_cache import ValidationCache, hash_validation_inputs
+
+        if self._validation_cache_db is None:
+            self._validation_cache_db = ValidationCache(self.validation_cache)
+        salt = "{}:{}".format(
+            self.validator,
+            sorted((k, str(v)) for k, v in validator_kwargs.items() if k != "on_fail"),
+        )
+
+        keys = {}
+        for model_name, items in batches.items():
+            model_path = os.path.join(self.models_dir, str(model_name))
+            # only cache results for models loaded from models directory, either
+            # from model subdirectory or from single model file e.g. JSON Schema
+            if model_name not in self._models_hashes:
+                if os.path.isdir(model_path):
+                    self._models_hashes[model_name] = hash_model_directory(
+                        model_path, extensions=None
+                    )
+                elif os.path.isfile(model_path + ".json"):
+                    self._models_hashes[model_name] = hash_model_file(
+                        model_path + ".json"
+                    )
+                else:
+                    continue
+            for index, item in items:
+                keys[index] = hash_validation_inputs(
+                    item, model_name, self._models_hashes[model_name], salt
                 )
 
+        cached = self._validation_cache_db.passed(keys.values())
+        ret = {}
+        for model_name, items in batches.items():
+            to_validate = [
+                (index, item)
+                for index, item in items
+                if index not in keys or keys[index] not in cached
+            ]
+            if to_validate:
+                ret[model_name] = to_validate
+
+        hits = sum(1 for key in keys.values() if key in cached)
+        cache_stats = self.stats.setdefault(
+            "validation_cache", {"hits": 0, "misses": 0}
+        )
+        cache_stats["hits"] += hits
+        cache_stats["misses"] += sum(len(items) for items in batches.values()) - hits
+
+        return ret, {index: key for index, key in keys.items() if key not in cached}
+
+    def _validate_parallel(self, batches, workers, passed, **validator_kwargs):
+        """
+        Helper method to validate data items using pool of worker processes,
+        collecting validation failures from all workers.
+
+        :param batches: (dict) dictionary of ``{model_name: [(index, data item), ...]}``
+        :param workers: (int) number of worker processes to use
+        :param passed: (list) list to add indexes of items that passed validation to
+        :param validator_kwargs: (dict) arguments to pass on to validator plugin
+        """
+        # import here to not slow down TTR startup when parallel validation not in use
+        # pylint: disable=import-outside-toplevel
+        from .utils.parallel_validation import validate_parallel
+
+        on_fail = validator_kwargs.get("on_fail", "raise")
+        results = validate_parallel(
+            batches, self.models_dict, self.validator, workers, **validator_kwargs
+        )
+        passed.extend(index for _, index, valid, _ in results if valid)
+        failed = [
+            "model '{}' item {} - '{}'".format(model_name, index, error)
+            for model_name, index, valid, error in sorted(results, key=lambda i: i[1])
+            if not valid
+        ]
+        if failed and on_fail == "raise":
+            raise RuntimeError(
+                "ttr:validate_data: validation failed for {} of {} items - {}".format(
+                    len(failed), len(results), "; ".join(failed)
+                )
+            )
+
     def load_models(self, models_dir=None, model_plugin=None, **kwargs):
         """
         Function to load models content to models dictionary.
 
         :param models_dir: (str) OS path to directory with models, defaults to ``./Models/`` directory
         :param model_plugin: (str) models loader plugin to use - ``yangson`` (default)
-        :param kwargs: any additional ``**kwargs`` to pass on to ``model_plugin`` call
+        :param kwargs: any additional ``**kwargs`` to pass on to ``model_plugin`` call,
+            e.g. ``models`` - list of models names to load instead of all models
         """
         models_dir = models_dir or self.models_dir
         model_plugin = model_plugin or self.validator
@@ -235,9 +633,18 @@ class ttr:
             )
             return
 
+        if self.models_cache:
+            kwargs.setdefault("cache", self.models_cache)
+            kwargs.setdefault(
+                "stats",
+                self.stats.setdefault("models_cache", {"hits": 0, "misses": 0}),
+            )
+
+        start = time.perf_counter()
         models_loaders_plugins[model_plugin](
             models_dict=self.models_dict, models_dir=models_dir, **kwargs
         )
+        self._record_stats("load_models", start, items=len(self.models_dict))
 
     def load_templates(
         self,
@@ -264,7 +671,7 @@ class ttr:
         """
         if template_name and template_content:
             self.templates_dict[template_name] = template_content
-        elif templates_plugin in templates_loaders_plugins:
+        elif templates_plugin and templates_plugin in templates_loaders_plugins:
             templates_loaders_plugins[templates_plugin](
                 templates_dict=self.templates_dict,
                 templates=templates,
@@ -278,6 +685,44 @@ class ttr:
                 template_name=template_name,
             )
 
+    def run_renderer(self, data=None, renderer=None, **kwargs):
+        """
+        Function to run renderer plugin to combine data with templates.
+
+        :param data: (list) list of dictionaries data to render, default is ``self.data_loaded``
+        :param renderer: (str) renderer plugin name e.g. jinja2
+        :param kwargs: (dict) additional arguments for renderer plugin
+        :return: results dictionary keyed by ``result_name_key``
+        """
+        data = self.data_loaded if data is None else data
+        renderer = renderer or self.renderer
+        kwargs = kwargs or self.renderer_kwargs
+        args = (
+            data,
+            self.template_name_key,
+            self.templates,
+            self.templates_dict,
+            self.result_name_key,
+        )
+
+        start = time.perf_counter()
+        if self.render_profile:
+            import cProfile  # pylint: disable=import-outside-toplevel
+
+            profiler = cProfile.Profile()
+            results = profiler.runcall(renderers_plugins[renderer], *args, **kwargs)
+            profiler.dump_stats(self.render_profile)
+        else:
+            results = renderers_plugins[renderer](*args, **kwargs)
+        self._record_stats(
+            "renderer:{}".format(renderer),
+            start,
+            items=len(results),
+            size=sum(len(i.encode("utf-8")) for i in results.values()),
+        )
+
+        return results
+
     def run_returner(self, results=None, returner=None, **kwargs):
         """
         Function to run returner to return results via plugin of choice.
@@ -291,7 +736,103 @@ class ttr:
         kwargs = kwargs or self.returner_kwargs
 
         log.debug("Returning results using '{}' returner".format(returner))
+        start = time.perf_counter()
         returners_plugins[returner](results, **kwargs)
+        self._record_stats(
+            "returner:{}".format(returner),
+            start,
+            items=len(results or {}),
+            size=sum(len(i.encode("utf-8")) for i in (results or {}).values()),
+        )
+
+    def _render_incremental(self):
+        """
+        Helper method to render only results which data items or templates changed
+        since previous run, taking other results from ``results_cache`` database.
+
+        :return: tuple of results dictionary and a set of unchanged results names
+        """
+        # import here to not slow down TTR startup when results cache not in use
+        from .utils.results_cache import (  # pylint: disable=import-outside-toplevel
+            ResultsCache,
+            collect_templates,
+            hash_result_inputs,
+        )
+
+        results = {}
+        unchanged = set()
+        to_render = []
+        new_keys = {}
+        salt = "{}:{}".format(
+            self.renderer,
+            sorted(
+                (k, str(v))
+                for k, v in self.renderer_kwargs.items()
+                if k not in ["workers", "cache_dir"]
+            ),
+        )
+
+        # partition data by result name preserving results order
+        partitions = {}
+        for datum in self.data_loaded:
+            partitions.setdefault(datum[self.result_name_key], []).append(datum)
+
+        def load_template(template_name):
+            if templates_loaders_plugins["base"](
+                template_name, self.templates_dict, self.templates
+            ):
+                return self.templates_dict[template_name]
+            return None
+
+        # templates and templates they include, keyed by template name
+        closures = {}
+        with ResultsCache(self.results_cache) as cache:
+            for result_name, items in partitions.items():
+                templates_content = {}
+                for datum in items:
+                    template_name = datum.get(self.template_name_key)
+                    if template_name not in closures:
+                        closures[template_name] = collect_templates(
+                            template_name, load_template
+                        )
+                    if closures[template_name] is None:
+                        templates_content = None
+                        break
+                    templates_content.update(closures[template_name])
+                key = (
+                    None
+                    if templates_content is None
+                    else hash_result_inputs(items, templates_content, salt)
+                )
+                cached_text = None if key is None else cache.get(result_name, key)
+                if cached_text is None:
+                    new_keys[result_name] = key
+                    to_render.extend(items)
+                    results[result_name] = None
+                else:
+                    unchanged.add(result_name)
+                    results[result_name] = cached_text
+
+            # render changed results only
+            if to_render:
+                rendered = self.run_renderer(data=to_render)
+                results.update(rendered)
+                cache.update(
+                    [
+                        (name, key, rendered[name])
+                        for name, key in new_keys.items()
+                        if key is not None
+                    ]
+                )
+
+        self.stats["results_cache"] = {"hits": len(unchanged), "misses": len(new_keys)}
+        log.info(
+            "TTR results cache hits: {}, misses: {}".format(
+                len(unchanged), len(new_keys)
+            )
+        )
+
+        return results, unchanged
 
     def run(self):
         """
@@ -301,14 +842,98 @@ class ttr:
         If returner set to ``self``, will return results dictionary.
         """
         log.debug("Rendering data using '{}' renderer".format(self.renderer))
-        self.results = renderers_plugins[self.renderer](
-            self.data_loaded,
-            self.template_name_key,
-            self.templates,
-            self.templates_dict,
-            self.result_name_key,
-            **self.renderer_kwargs,
-        )
-        self.run_returner()
+        with workbook_cache.scope():
+            if self.results_cache:
+                self.results, unchanged = self._render_incremental()
+                self.run_returner(unchanged=unchanged, **self.returner_kwargs)
+            else:
+                self.results = self.run_renderer()
+                self.run_returner()
         log.debug("TTR rendering run completed")
         return self.results if self.returner == "self" else None
+
+    def run_iter(self, data=None, data_plugin=None):
+        """
+        Generator method to render templates with data in streaming fashion, yielding
+        ``(result_name, text)`` tuples as soon as result rendered and passed through
+        returner.
+
+        :param data: (str) optional, data to load, either OS path to data file or text,
+            if not provided, ``self.data_loaded`` items rendered
+        :param data_plugin: (str) name of data plugin to load data, by default will
+            choose data loader plugin based on file extension
+
+        If ``data`` provided, loaded data items passed through processors one by one and
+        validated in chunks of ``VALIDATION_CHUNK_SIZE`` items, data items never accumulated
+        in ``self.data_loaded``, ``self.results`` also not populated.
+
+        To keep memory usage bounded, data items should be grouped by ``result_name_key``
+        value, otherwise several tuples produced for the same result, concatenating their
+        text gives the same result as ``run`` method produces.
+
+        Sample usage::
+
+            from ttr import ttr
+
+            gen = ttr(returner="file", returner_kwargs={"result_dir": "./Output/"})
+            for result_name, text in gen.run_iter(data="./data/devices.xlsx"):
+                print("{} saved".format(result_name))
+        """
+        data_counter = {"items": 0, "time": 0.0}
+        data_items = self._count_stage(
+            self._iter_data(data, data_plugin) if data else iter(self.data_loaded),
+            data_counter,
+        )
+        log.debug("Rendering data using '{}' streaming renderer".format(self.renderer))
+        renderer_counter = {"items": 0, "time": 0.0, "bytes": 0}
+        results = self._count_results(
+            renderers_stream_plugins[self.renderer](
+                data_items,
+                self.template_name_key,
+                self.templates,
+                self.templates_dict,
+                self.result_name_key,
+                **self.renderer_kwargs,
+            ),
+            renderer_counter,
+        )
+        log.debug(
+            "Returning results using '{}' streaming returner".format(self.returner)
+        )
+        returner_counter = {"items": 0, "time": 0.0, "bytes": 0}
+        # workbooks closed once rendering completed or generator closed
+        with workbook_cache.scope():
+            yield from self._count_results(
+                returners_stream_plugins[self.returner](
+                    results, **self.returner_kwargs
+                ),
+                returner_counter,
+            )
+        # stages times include time spent in previous stages, subtract it
+        upstream_time = data_counter["time"]
+        for stage, counter in [
+            ("renderer:{}".format(self.renderer), renderer_counter),
+            ("returner:{}".format(self.returner), returner_counter),
+        ]:
+            self._record_stats(
+                stage,
+                time.perf_counter() - (counter["time"] - upstream_time),
+                items=counter["items"],
+                size=counter["bytes"],
+            )
+            upstream_time = counter["time"]
+        log.debug("TTR streaming rendering run completed")
+
+    def _count_results(self, results, counter):
+        """
+        Generator method to count ``(result_name, text)`` tuples produced by
+        streaming renderer or returner, their text size and time spent producing them.
+
+        :param results: (iterable) ``(result_name, text)`` tuples
+        :param counter: (dict) dictionary with ``items``, ``time`` and ``bytes`` keys
+            to update
+        :return: yields ``(result_name, text)`` tuples
+        """
+        for result_name, text in self._count_stage(results, counter):
+            counter["bytes"] += len(text.encode("utf-8"))
+            yield result_name, text
@@ -15,6 +15,10 @@ Supported arguments::
     -p,  --print         Print results to terminal instead of saving to folder
     -l,  --logging       Set logging level - "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"; default ERROR
     -f,  --filters       Comma separated list of glob patterns to use for filtering data to render
+    -j,  --jobs          Number of processes to use for data validation and rendering, default 1
+    -c,  --cache-dir     OS path to directory to cache compiled templates, models and validation results in, default is no caching
+    -i,  --incremental   Only re-render results with changed data or templates, requires persistent --output folder
+    --profile [FILE]     Print per-stage statistics table, if FILE given, save rendering cProfile stats in it
 
 .. note:: ``--templates`` argument should be a path to folder with templates
     files within that folder/subfolders or path to ``.xlsx`` spreadsheet file with
@@ -68,12 +72,67 @@ Template Text Renderer CLI utility
 -p,  --print         Print results to terminal instead of saving to folder
 -l,  --logging       Set logging level - "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"; default ERROR
 -f,  --filters       Comma separated list of glob patterns to use for filtering data to render
+-j,  --jobs          Number of processes to use for data validation and rendering, default 1
+-c,  --cache-dir     OS path to directory to cache compiled templates, models and validation results in, default is no caching
+-i,  --incremental   Only re-render results with changed data or templates, requires persistent --output folder
+--profile [FILE]     Print per-stage statistics table, if FILE given, save rendering cProfile stats in it
 """
 
 
-def cli_tool():
+def format_stats(stats):
     """
-    CLI utility tool function, accepts no argument.
+    Function to format TTR statistics dictionary as a text table.
+
+    :param stats: (dict) TTR object ``stats`` dictionary
+    :return: table string
+    """
+    row = "{:<32} {:>6} {:>10} {:>12} {:>10}"
+    lines = [
+        row.format("Stage", "Calls", "Items", "Bytes", "Time, s"),
+        row.format("-" * 32, "-" * 6, "-" * 10, "-" * 12, "-" * 10),
+    ]
+    for stage, stage_stats in stats["stages"].items():
+        lines.append(
+            row.format(
+                stage,
+                stage_stats["calls"],
+                stage_stats["items"],
+                stage_stats["bytes"],
+                "{:.4f}".format(stage_stats["time"]),
+            )
+        )
+    if "results_cache" in stats:
+        lines.append(
+            "\nResults cache hits: {hits}, misses: {misses}".format(
+                **stats["results_cache"]
+            )
+        )
+    if "validation_cache" in stats:
+        lines.append(
+            "\nValidation cache hits: {hits}, misses: {misses}".format(
+                **stats["validation_cache"]
+            )
+        )
+    if "models_cache" in stats:
+        lines.append(
+            "\nModels cache hits: {hits}, misses: {misses}".format(
+                **stats["models_cache"]
+            )
+        )
+    if "snapshot_cache" in stats:
+        lines.append(
+            "\nSnapshot cache hits: {hits}, misses: {misses}".format(
+                **stats["snapshot_cache"]
+            )
+        )
+    return "\n".join(lines)
+
+
+def _make_argparser():
+    """
+    Function to form CLI tool arguments parser.
+
+    :return: ``argparse.ArgumentParser`` object
     """
     # form argparser menu:
     description_text = """{}""".format(cli_help)
@@ -139,6 +198,91 @@ def cli_tool():
         type=str,
         help=argparse.SUPPRESS,
     )
+    run_options.add_argument(
+        "-j",
+        "--jobs",
+        action="store",
+        dest="JOBS",
+        default=1,
+        type=int,
+        help=argparse.SUPPRESS,
+    )
+    run_options.add_argument(
+        "-c",
+        "--cache-dir",
+        action="store",
+        dest="CACHE_DIR",
+        default="",
+        type=str,
+        help=argparse.SUPPRESS,
+    )
+    run_options.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        dest="INCREMENTAL",
+        default=False,
+        help=argparse.SUPPRESS,
+    )
+    run_options.add_argument(
+        "--profile",
+        action="store",
+        dest="PROFILE",
+        default=None,
+        nargs="?",
+        const="",
+        type=str,
+        help=argparse.SUPPRESS,
+    )
+    return argparser
+
+
+def _get_data_file_path(data):
+    """
+    Function to get data file OS path, prompting user to select file if ``data``
+    is a directory with several files.
+
+    :param data: (str) OS path to data file or folder with files to process
+    :return: data file OS path or None
+    """
+    if os.path.isdir(data):
+        # get the list of files in 'Data' folder
+        data_files = os.listdir(data)
+        if len(data_files) == 1:
+            file_number = 0
+        elif len(data_files) == 0:
+            log.error("No files found in 'Data' directory; Exiting...")
+            raise SystemExit()
+        # if more than one file found, ask user which file to use
+        else:
+            print("{}\nFiles found in '{}' directory".format(20 * "=", data))
+            for position, item in enumerate(data_files):
+                print("{}: {}".format(position, item))
+            # get file number to work with
+            file_number = -1
+            while not 0 <= file_number <= len(data_files) - 1:
+                try:
+                    file_number = int(input("Choose data file to work with (number): "))
+                except KeyboardInterrupt:
+                    raise SystemExit()
+                except Exception as e:
+                    log.error("Wrong choice, error: {}".format(e))
+                    continue
+        # form path to data file
+        data_file_path = os.path.join(data, data_files[file_number])
+    elif os.path.isfile(data):
+        data_file_path = data
+    else:
+        log.error("Failed to form data_file_path, data: '{}'".format(data))
+        return None
+    return data_file_path
+
+
+def cli_tool():
+    """
+    CLI utility tool function, accepts no argument.
+    """
+    argparser = _make_argparser()
     # -----------------------------------------------------------------------------
     # Parse arguments
     # -----------------------------------------------------------------------------
@@ -153,6 +297,10 @@ def cli_tool():
     PRINT_TO_TERMINAL = args.PRINT_TO_TERMINAL
     LOGGING_LEVEL = args.LOGGING_LEVEL
     FILTERS = args.FILTERS
+    JOBS = args.JOBS
+    CACHE_DIR = args.CACHE_DIR
+    INCREMENTAL = args.INCREMENTAL
+    PROFILE = args.PROFILE
 
     # set logging level
     try:
@@ -169,51 +317,56 @@ def cli_tool():
         )
 
     # get data file OS path
-    if os.path.isdir(DATA):
-        # get the list of files in 'Data' folder
-        data_files = os.listdir(DATA)
-        if len(data_files) == 1:
-            file_number = 0
-        elif len(data_files) == 0:
-            log.error("No files found in 'Data' directory; Exiting...")
-            raise SystemExit()
-        # if more than one file found, ask user which file to use
-        else:
-            print("{}\nFiles found in '{}' directory".format(20 * "=", DATA))
-            for position, item in enumerate(data_files):
-                print("{}: {}".format(position, item))
-            # get file number to work with
-            file_number = -1
-            while not 0 <= file_number <= len(data_files) - 1:
-                try:
-                    file_number = int(input("Choose data file to work with (number): "))
-                except KeyboardInterrupt:
-                    raise SystemExit()
-                except Exception as e:
-                    log.error("Wrong choice, error: {}".format(e))
-                    continue
-        # form path to data file
-        data_file_path = os.path.join(DATA, data_files[file_number])
-    elif os.path.isfile(DATA):
-        data_file_path = DATA
-    else:
-        log.error("Failed to form data_file_path, data: '{}'".format(DATA))
+    data_file_path = _get_data_file_path(DATA)
+    if data_file_path is None:
         return
 
     if not PRINT_TO_TERMINAL and not os.path.exists(OUTPUT_FOLDER):
         OUTPUT_FOLDER = OUTPUT_FOLDER.format(os.path.split(data_file_path)[-1])
         os.makedirs(OUTPUT_FOLDER)
 
+    # store results cache database in output folder
+    RESULTS_CACHE = (
+        os.path.join(OUTPUT_FOLDER, ".ttr_results_cache.sqlite")
+        if INCREMENTAL and not PRINT_TO_TERMINAL
+        else None
+    )
+
+    # store compiled models and validation results cache databases in cache directory
+    MODELS_CACHE = (
+        os.path.join(CACHE_DIR, "ttr_models_cache.sqlite") if CACHE_DIR else None
+    )
+    VALIDATION_CACHE = (
+        os.path.join(CACHE_DIR, "ttr_validation_cache.sqlite") if CACHE_DIR else None
+    )
+    # parse spreadsheet sheets in parallel and store their snapshots in cache directory
+    DATA_PLUGIN_KWARGS = {}
+    if data_file_path.endswith(".xlsx"):
+        DATA_PLUGIN_KWARGS["workers"] = JOBS
+        if CACHE_DIR:
+            DATA_PLUGIN_KWARGS["snapshot_cache"] = os.path.join(
+                CACHE_DIR, "ttr_xlsx_snapshots.sqlite"
+            )
+
     # generate results and save them in output folder or print to screen
     with ttr(
         data=data_file_path,
+        data_plugin_kwargs=DATA_PLUGIN_KWARGS,
         templates=TEMPLATES_LOCATION,
         returner="terminal" if PRINT_TO_TERMINAL else "file",
         returner_kwargs={"result_dir": OUTPUT_FOLDER},
         processors=["multitemplate", "filtering", "templates_split"],
         processors_kwargs={"filters": [i.strip() for i in FILTERS.split(",")]},
+        renderer_kwargs={"workers": JOBS, "cache_dir": CACHE_DIR},
+        validator_kwargs={"workers": JOBS},
+        results_cache=RESULTS_CACHE,
+        render_profile=PROFILE or None,
+        models_cache=MODELS_CACHE,
+        validation_cache=VALIDATION_CACHE,
     ) as g:
         g.run()
+        if PROFILE is not None:
+            print(format_stats(g.stats))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,127 @@
+"""
+Compact Rows
+############
+
+Tabular data loaders, such as ``xlsx`` or ``csv``, produce a lot of data items that
+share the same set of keys. Instead of creating a dictionary for each row, where each
+dictionary holds its own copy of keys hash table, rows stored as tuples of values
+referencing shared ``RowsSchema`` object that maps headers to values positions.
+
+``Row`` objects behave like dictionaries - support keys lookup, iteration, ``get``,
+``items``, equality comparison with dictionaries, ``copy``, ``pop`` etc. On first
+modification, ``Row`` converts itself into dictionary based storage, as a result
+processors and validators can modify rows the same way as they modify dictionaries.
+
+Sample usage::
+
+    from ttr.utils.compact_rows import RowsSchema
+
+    schema = RowsSchema(["device", "interface", "template"])
+    row = schema.make_row(("r1", "Gi1", "interface"))
+    row["device"] # returns "r1"
+    row == {"device": "r1", "interface": "Gi1", "template": "interface"} # True
+"""
+from collections.abc import MutableMapping
+
+
+class RowsSchema:  # pylint: disable=too-few-public-methods
+    """
+    Class to store headers shared by a collection of rows.
+
+    :param headers: (list) list of headers, for duplicate headers, last header's
+        value used, same as for ``dict(zip(headers, values))``
+    """
+
+    __slots__ = ("headers", "index", "keys")
+
+    def __init__(self, headers):
+        self.headers = tuple(headers)
+        self.index = {h: i for i, h in enumerate(self.headers)}
+        self.keys = tuple(dict.fromkeys(self.headers))
+
+    def make_row(self, values):
+        """
+        Method to create row object for given values.
+
+        :param values: (tuple) row values
+        :return: ``Row`` object or dictionary if there are less values than headers
+        """
+        if len(values) < len(self.headers):
+            return dict(zip(self.headers, values))
+        return Row(self, tuple(values[: len(self.headers)]))
+
+
+class Row(MutableMapping):
+    """
+    Dictionary-like view of a tuple of values using shared ``RowsSchema``.
+
+    :param schema: (obj) ``RowsSchema`` object
+    :param values: (tuple) row values
+    """
+
+    __slots__ = ("_schema", "_values", "_data")
+
+    def __init__(self, schema, values):
+        self._schema = schema
+        self._values = values
+        self._data = None
+
+    def _materialize(self):
+        """
+        Method to convert row to dictionary based storage to support modifications.
+        """
+        if self._data is None:
+            self._data = {
+                k: self._values[self._schema.index[k]] for k in self._schema.keys
+            }
+            self._schema = None
+            self._values = None
+        return self._data
+
+    def __getitem__(self, key):
+        if self._data is not None:
+            return self._data[key]
+        return self._values[self._schema.index[key]]
+
+    def __setitem__(self, key, value):
+        self._materialize()[key] = value
+
+    def __delitem__(self, key):
+        del self._materialize()[key]
+
+    def __iter__(self):
+        if self._data is not None:
+            return iter(self._data)
+        return iter(self._schema.keys)
+
+    def __len__(self):
+        if self._data is not None:
+            return len(self._data)
+        return len(self._schema.keys)
+
+    def __contains__(self, key):
+        if self._data is not None:
+            return key in self._data
+        return key in self._schema.index
+
+    def get(self, key, default=None):
+        if self._data is not None:
+            return self._data.get(key, default)
+        index = self._schema.index.get(key)
+        return default if index is None else self._values[index]
+
+    def copy(self):
+        """
+        Method to return shallow copy of the row, new row shares schema with this one.
+        """
+        if self._data is not None:
+            return self._data.copy()
+        return Row(self._schema, self._values)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __reduce__(self):
+        if self._data is not None:
+            return dict, (self._data,)
+        return Row, (self._schema, self._values)
@@ -0,0 +1,131 @@
+"""
+Models Cache
+############
+
+Module to cache compiled models in SQLite database, such that unchanged models
+do not need to be parsed and compiled on every run.
+
+Cached models keyed by model name together with a hash of model directory files
+content, changing, adding or removing any of the model files invalidates cached
+model. Cache stores models library text and, if model object can be pickled,
+serialized model object.
+
+.. warning:: cached models deserialized using ``pickle`` module, as a result cache
+    database file is a trust boundary - anyone who can modify it can run arbitrary
+    code as the user running TTR. Cache database files must only be writable by
+    that user, e.g. kept in user's own cache directory, never shared between users
+    or obtained from elsewhere.
+"""
+import hashlib
+import logging
+import os
+# cached models unpickled, see trust boundary warning in module docstring
+import pickle  # nosec B403
+
+from .sqlite_cache import SQLiteCache
+
+log = logging.getLogger(__name__)
+
+
+def hash_model_directory(path, extensions=(".yang",), salt=""):
+    """
+    Function to compute hash of model directory files content.
+
+    :param path: (str) OS path to model directory
+    :param extensions: (tuple) files extensions to include in hash, includes all files
+        if ``None``
+    :param salt: (str) additional string to include in hash e.g. library version
+    :return: (str) hex digest string
+    """
+    digest = hashlib.sha256(salt.encode("utf-8"))
+    for filename in sorted(os.listdir(path)):
+        if extensions and not filename.endswith(extensions):
+            continue
+        if not os.path.isfile(os.path.join(path, filename)):
+            continue
+        digest.update(filename.encode("utf-8"))
+        with open(os.path.join(path, filename), "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def hash_model_file(path, salt=""):
+    """
+    Function to compute hash of single file model content.
+
+    :param path: (str) OS path to model file
+    :param salt: (str) additional string to include in hash
+    :return: (str) hex digest string
+    """
+    digest = hashlib.sha256(salt.encode("utf-8"))
+    digest.update(os.path.basename(path).encode("utf-8"))
+    with open(path, "rb") as f:
+        digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+class ModelsCache(SQLiteCache):
+    """
+    Class to store and retrieve compiled models in SQLite database.
+
+    :param path: (str) OS path to SQLite database file
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS models "
+        "(name TEXT PRIMARY KEY, key TEXT NOT NULL, library TEXT NOT NULL, model BLOB)",
+    )
+
+    def get(self, name, key):
+        """
+        Method to retrieve cached model.
+
+        :param name: (str) model name
+        :param key: (str) model directory hash
+        :return: tuple of ``(library text, model object)``, where model object is
+            ``None`` if it was not serialized or failed to deserialize, or ``None``
+            if no cached model with matching key
+        """
+        row = self.connection.execute(
+            "SELECT library, model FROM models WHERE name = ? AND key = ?", (name, key)
+        ).fetchone()
+        if row is None:
+            return None
+        library, model = row
+        if model is not None:
+            try:
+                # cache database written by TTR itself, refer to module docstring
+                model = pickle.loads(model)  # nosec B301
+            except Exception as e:
+                log.warning(
+                    "ttr:models_cache failed to deserialize '{}' model, error: {}".format(
+                        name, e
+                    )
+                )
+                model = None
+        return library, model
+
+    def update(self, name, key, library, model=None):
+        """
+        Method to save model in cache.
+
+        :param name: (str) model name
+        :param key: (str) model directory hash
+        :param library: (str) model library text
+        :param model: (obj) model object to serialize
+        """
+        serialized = None
+        if model is not None:
+            try:
+                serialized = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                log.debug(
+                    "ttr:models_cache failed to serialize '{}' model, error: {}".format(
+                        name, e
+                    )
+                )
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO models (name, key, library, model) VALUES (?, ?, ?, ?)",
+                (name, key, library, serialized),
+            )
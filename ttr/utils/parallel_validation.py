@@ -0,0 +1,88 @@
+"""
+Parallel Validation
+###################
+
+Module to validate data items using pool of worker processes. Each worker
+receives models it needs once at startup and validates chunks of data items
+using validator batch plugin.
+"""
+import logging
+import multiprocessing
+
+from ..plugins.validate import validate_batch_plugins
+
+log = logging.getLogger(__name__)
+
+_worker_context = {}
+
+
+def _init_worker(validator, models, validator_kwargs):
+    """
+    Function to initialize validation context within worker process.
+    """
+    _worker_context.update(
+        validator=validator, models=models, validator_kwargs=validator_kwargs
+    )
+
+
+def _validate_chunk(task):
+    """
+    Function to validate chunk of data items within worker process.
+
+    :param task: (tuple) ``(model_name, [data items indexes], [data items])`` tuple
+    :return: list of ``(model_name, index, valid, error)`` tuples
+    """
+    model_name, indexes, items = task
+    results = validate_batch_plugins[_worker_context["validator"]](
+        data=items,
+        model_content=_worker_context["models"][model_name],
+        model_name=model_name,
+        **_worker_context["validator_kwargs"],
+    )
+    return [
+        (model_name, indexes[index], valid, error) for index, valid, error in results
+    ]
+
+
+def validate_parallel(batches, models_dict, validator, workers, **validator_kwargs):
+    """
+    Function to validate data items using pool of worker processes.
+
+    :param batches: (dict) dictionary of ``{model_name: [(index, data item), ...]}``
+    :param models_dict: (dict) dictionary of ``{model_name: model_content}``
+    :param validator: (str) name of validator batch plugin to use
+    :param workers: (int) number of worker processes to use
+    :param validator_kwargs: (dict) arguments to pass on to validator plugin, ``on_fail``
+        argument ignored, failures logged if ``on_fail`` is ``log``
+    :return: list of ``(model_name, index, valid, error)`` tuples
+    """
+    on_fail = validator_kwargs.pop("on_fail", "raise")
+    validator_kwargs["on_fail"] = "log" if on_fail == "log" else None
+    models = {model_name: models_dict[model_name] for model_name in batches}
+
+    # split batches into chunks, so that each worker gets several chunks
+    total = sum(len(items) for items in batches.values())
+    chunk_size = max(1, total // (workers * 4))
+    tasks = []
+    for model_name, items in batches.items():
+        for i in range(0, len(items), chunk_size):
+            chunk = items[i : i + chunk_size]
+            tasks.append(
+                (model_name, [index for index, _ in chunk], [item for _, item in chunk])
+            )
+
+    log.debug(
+        "ttr:validate_parallel validating {} items in {} chunks using {} processes".format(
+            total, len(tasks), workers
+        )
+    )
+
+    ret = []
+    with multiprocessing.Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(validator, models, validator_kwargs),
+    ) as pool:
+        for results in pool.imap(_validate_chunk, tasks):
+            ret.extend(results)
+    return ret
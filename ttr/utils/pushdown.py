@@ -0,0 +1,117 @@
+"""
+Pushdown
+########
+
+Module with helper functions for data loaders to drop rows and columns while
+reading data, before data items created:
+
+- predicate pushdown - rows that ``filtering`` processor would drop skipped using
+  ``filters`` glob patterns matched against ``result_name_key`` values
+- projection pushdown - only columns listed in ``columns`` argument loaded
+
+Row filter is conservative - rows dropped only if all columns with headers starting
+with ``result_name_key``, e.g. ``device`` or ``device:a`` for ``multitemplate``
+processor, contain strings that do not match any of filter patterns. Rows kept by
+row filter still filtered by ``filtering`` processor, as a result filtering results
+stay the same.
+
+Projection keeps columns with headers starting with any of ``columns`` names, as
+well as ``template_name_key`` and ``result_name_key`` columns.
+"""
+import re
+from fnmatch import translate
+
+
+def make_row_filter(headers, result_name_key, filters):
+    """
+    Function to create row filter function for given headers.
+
+    :param headers: (list) list of headers
+    :param result_name_key: (str) name of ``result_name_key`` column
+    :param filters: (list) list of glob patterns
+    :return: function that takes row values and returns True if row should be
+        kept or None if no rows can be dropped
+    """
+    if not result_name_key or not filters or not any(filters):
+        return None
+    indexes = [
+        index
+        for index, header in enumerate(headers)
+        if isinstance(header, str) and header.startswith(result_name_key)
+    ]
+    if not indexes:
+        return None
+    match = re.compile(
+        "|".join("(?:{})".format(translate(str(pattern))) for pattern in filters)
+    ).match
+
+    def row_filter(values):
+        for index in indexes:
+            value = values[index] if index < len(values) else None
+            # keep rows with invalid values for filtering processor to report them
+            if not isinstance(value, str) or match(value):
+                return True
+        return False
+
+    return row_filter
+
+
+def make_projection(headers, columns, template_name_key=None, result_name_key=None):
+    """
+    Function to decide on columns to load.
+
+    :param headers: (list) list of headers
+    :param columns: (list) list of columns names to load
+    :param template_name_key: (str) name of templates column
+    :param result_name_key: (str) name of ``result_name_key`` column
+    :return: list of indexes of columns to load or None if all columns needed
+    """
+    if not columns:
+        return None
+    names = tuple(
+        str(name) for name in [*columns, template_name_key, result_name_key] if name
+    )
+    indexes = [
+        index
+        for index, header in enumerate(headers)
+        if isinstance(header, str) and header.startswith(names)
+    ]
+    return None if len(indexes) == len(headers) else indexes
+
+
+def pushdown(
+    headers,
+    rows,
+    template_name_key=None,
+    result_name_key=None,
+    filters=None,
+    columns=None,
+):
+    """
+    Function to apply row filter and projection to rows of values.
+
+    :param headers: (list) list of headers
+    :param rows: (iterable) rows values tuples
+    :param template_name_key: (str) name of templates column
+    :param result_name_key: (str) name of ``result_name_key`` column
+    :param filters: (list) list of glob patterns to filter rows
+    :param columns: (list) list of columns names to load
+    :return: tuple of ``(headers, rows iterable)``
+    """
+    row_filter = make_row_filter(headers, result_name_key, filters)
+    if row_filter is not None:
+        rows = filter(row_filter, rows)
+    indexes = make_projection(headers, columns, template_name_key, result_name_key)
+    if indexes is not None:
+        headers = [headers[index] for index in indexes]
+        rows = _project(rows, indexes)
+    return headers, rows
+
+
+def _project(rows, indexes):
+    """
+    Generator function to select values of given columns, rows shorter than
+    headers produce rows with values for available columns only.
+    """
+    for values in rows:
+        yield tuple(values[index] for index in indexes if index < len(values))
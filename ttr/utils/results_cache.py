@@ -0,0 +1,135 @@
+"""
+Results Cache
+#############
+
+Module to support incremental rendering - rendering results stored in SQLite
+database keyed by result name together with a hash of data items and templates
+content used to produce them. On subsequent runs only results with changed hash
+need to be rendered again.
+
+Templates content hashed together with content of templates they reference using
+``{% include %}``, ``{% import %}``, ``{% from %}`` or ``{% extends %}`` statements,
+recursively. Results rendered using templates that reference other templates by
+non-constant names, e.g. ``{% include template_var %}``, never taken from cache.
+"""
+import hashlib
+import json
+import logging
+
+import jinja2
+from jinja2 import meta
+
+from .sqlite_cache import SQLiteCache
+
+log = logging.getLogger(__name__)
+
+# environment used to parse templates only, never renders them
+_environment = jinja2.Environment()  # nosec B701
+
+
+def find_references(content):
+    """
+    Function to find names of templates referenced by template.
+
+    :param content: (str) template content
+    :return: set of referenced templates names or None if some of the templates
+        referenced using non-constant names
+    """
+    try:
+        references = set(
+            meta.find_referenced_templates(_environment.parse(str(content)))
+        )
+    except jinja2.TemplateSyntaxError:
+        # template fails to render anyway, its own content hashed
+        return set()
+    return None if None in references else references
+
+
+def collect_templates(template_name, load_template):
+    """
+    Function to collect content of template and all templates it references.
+
+    :param template_name: (str) name of the template
+    :param load_template: (callable) function that takes template name and returns
+        template content or None if template not found
+    :return: dictionary of ``{template name: template content}`` or None if
+        template references cannot be resolved
+    """
+    templates_content = {}
+    pending = [template_name]
+    while pending:
+        name = pending.pop()
+        if str(name) in templates_content:
+            continue
+        content = load_template(name)
+        templates_content[str(name)] = content
+        if content is None:
+            continue
+        references = find_references(content)
+        if references is None:
+            log.debug(
+                "ttr:results_cache template '{}' references templates dynamically, "
+                "not caching results rendered with it".format(name)
+            )
+            return None
+        pending.extend(references)
+    return templates_content
+
+
+def hash_result_inputs(items, templates_content, salt=""):
+    """
+    Function to compute hash of data items and templates used to render single result.
+
+    :param items: (list) list of data items dictionaries for single result
+    :param templates_content: (dict) dictionary of ``{template name: template content}``
+        for templates referenced by items and templates they reference, content is
+        ``None`` if template not found
+    :param salt: (str) additional string to include in hash e.g. renderer settings
+    :return: (str) hex digest string
+    """
+    canonical_items = [
+        sorted(((str(k), v) for k, v in item.items()), key=lambda kv: kv[0])
+        for item in items
+    ]
+    payload = json.dumps(
+        [salt, canonical_items, sorted(templates_content.items())], default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultsCache(SQLiteCache):
+    """
+    Class to store and retrieve rendering results in SQLite database.
+
+    :param path: (str) OS path to SQLite database file
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS results "
+        "(name TEXT PRIMARY KEY, key TEXT NOT NULL, text TEXT NOT NULL)",
+    )
+
+    def get(self, name, key):
+        """
+        Method to retrieve cached result text.
+
+        :param name: (str) result name
+        :param key: (str) result inputs hash
+        :return: result text string or ``None`` if no cached result with matching key
+        """
+        row = self.connection.execute(
+            "SELECT text FROM results WHERE name = ? AND key = ?", (str(name), key)
+        ).fetchone()
+        return row[0] if row else None
+
+    def update(self, rows):
+        """
+        Method to save results in cache.
+
+        :param rows: (list) list of ``(name, key, text)`` tuples
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO results (name, key, text) VALUES (?, ?, ?)",
+                [(str(name), key, text) for name, key, text in rows],
+            )
@@ -0,0 +1,49 @@
+"""
+SQLite Cache
+############
+
+Module with base class for caches stored in SQLite database file - results cache,
+models cache, validation cache and xlsx snapshot cache.
+
+Database file and its directory created on first use, tables created using
+subclass ``SCHEMA`` statements. Cache objects can be used as context managers to
+close database connection on exit::
+
+    from ttr.utils.results_cache import ResultsCache
+
+    with ResultsCache("./cache/results.sqlite") as cache:
+        cache.get("rt1", key)
+"""
+import os
+import sqlite3
+
+
+class SQLiteCache:
+    """
+    Base class to store cache content in SQLite database.
+
+    :param path: (str) OS path to SQLite database file
+    """
+
+    # statements to create cache tables
+    SCHEMA = ()
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        for statement in self.SCHEMA:
+            self.connection.execute(statement)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def close(self):
+        """
+        Method to close database connection.
+        """
+        self.connection.close()
@@ -0,0 +1,83 @@
+"""
+Validation Cache
+################
+
+Module to cache data validation results in SQLite database, such that data items
+that passed validation on previous runs are not validated again.
+
+Only data items that passed validation are cached, keyed by a hash of model name,
+model files content hash and data item content, as a result changing any of the
+model files or data item content invalidates cached result.
+"""
+import hashlib
+import json
+import logging
+
+from .sqlite_cache import SQLiteCache
+
+log = logging.getLogger(__name__)
+
+
+def hash_validation_inputs(item, model_name, model_hash, salt=""):
+    """
+    Function to compute hash of data item and model used to validate it.
+
+    :param item: (dict) data item dictionary
+    :param model_name: (str) name of the model
+    :param model_hash: (str) hash of model files content
+    :param salt: (str) additional string to include in hash e.g. validator settings
+    :return: (str) hex digest string
+    """
+    canonical_item = sorted(
+        ((str(k), v) for k, v in item.items()), key=lambda kv: kv[0]
+    )
+    payload = json.dumps(
+        [salt, str(model_name), model_hash, canonical_item], default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ValidationCache(SQLiteCache):
+    """
+    Class to store and check keys of data items that passed validation in SQLite database.
+
+    :param path: (str) OS path to SQLite database file
+    """
+
+    SCHEMA = ("CREATE TABLE IF NOT EXISTS validated (key TEXT PRIMARY KEY)",)
+
+    def passed(self, keys):
+        """
+        Method to check which of the keys passed validation before.
+
+        :param keys: (list) list of data items keys
+        :return: set of keys found in cache
+        """
+        ret = set()
+        keys = list(keys)
+        # query keys in chunks to stay within SQLite variables limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i : i + 500]
+            ret.update(
+                row[0]
+                for row in self.connection.execute(
+                    # only "?" placeholders formatted in, keys passed as parameters
+                    "SELECT key FROM validated WHERE key IN ({})".format(  # nosec B608
+                        ", ".join("?" * len(chunk))
+                    ),
+                    chunk,
+                )
+            )
+        return ret
+
+    def update(self, keys):
+        """
+        Method to save keys of data items that passed validation.
+
+        :param keys: (list) list of data items keys
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO validated (key) VALUES (?)",
+                [(key,) for key in keys],
+            )
@@ -0,0 +1,252 @@
+"""
+Workbook Cache
+##############
+
+Module to share opened ``.xlsx`` workbooks between ``xlsx`` data loader and ``xlsx``
+templates loader, such that each workbook file opened and its templates tabs parsed
+at most once, even if the same spreadsheet used for both data and templates.
+
+Cached workbooks keyed by file path, modification time and size, as a result
+modifying spreadsheet file invalidates cached workbook. Templates loaded from
+workbook's templates tabs cached together with workbook, so that looking up a
+template that is missing in spreadsheet does not trigger spreadsheet reload.
+
+Workbooks kept open only while inside of ``scope`` context manager, on exiting
+outermost scope all workbooks closed, releasing their files, while templates loaded
+from them stay cached. TTR object wraps loading data, running and streaming
+rendering in a scope, xlsx data and templates loaders open their own scopes as well,
+so that workbooks also closed when loaders called directly.
+
+Cache holds up to ``MAX_WORKBOOKS`` workbooks, least recently used workbook closed
+when limit reached. TTR object clears the cache on exiting its context manager.
+Forked child processes start with empty cache.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+log = logging.getLogger(__name__)
+
+MAX_WORKBOOKS = 8
+
+_workbooks = OrderedDict()  # file key -> _CachedWorkbook
+_lock = threading.RLock()
+_scopes = 0  # number of active scopes
+stats = {"hits": 0, "misses": 0}
+
+
+class _CachedWorkbook:  # pylint: disable=too-few-public-methods
+    __slots__ = ("workbook", "backend", "options", "templates")
+
+    def __init__(self, workbook, backend, options):
+        self.workbook = workbook
+        self.backend = backend
+        self.options = options
+        self.templates = None
+
+
+def _file_key(path):
+    """
+    Function to compute cache key for workbook file.
+
+    :param path: (str) OS path to ``.xlsx`` file
+    :return: tuple of ``(absolute path, modification time, size)`` or None if
+        ``path`` is not a file path
+    """
+    if not isinstance(path, (str, os.PathLike)):
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _open(path, backend, options):
+    """
+    Function to open workbook using given backend.
+    """
+    # import here to not slow down TTR startup when xlsx data not in use
+    # pylint: disable=import-outside-toplevel
+    if backend == "stdlib":
+        from .xlsx_reader import load_workbook
+
+        return load_workbook(path)
+    if backend == "openpyxl":
+        from openpyxl import load_workbook
+
+        return load_workbook(path, **options)
+    raise RuntimeError(
+        "ttr:workbook_cache unsupported backend '{}', supported 'openpyxl' and 'stdlib'".format(
+            backend
+        )
+    )
+
+
+def _close(entry):
+    if entry.workbook is None:
+        return
+    try:
+        entry.workbook.close()
+    except Exception as e:
+        log.debug("ttr:workbook_cache failed to close workbook, error: {}".format(e))
+
+
+def _get_entry(path, backend=None, **kwargs):
+    """
+    Function to retrieve cached workbook entry, opening workbook if required.
+
+    :param path: (str) OS path to ``.xlsx`` file
+    :param backend: (str) ``openpyxl`` or ``stdlib``, if None any cached workbook
+        returned or workbook opened using ``openpyxl``
+    :param kwargs: (dict) arguments for ``openpyxl`` ``load_workbook`` function
+    :return: ``_CachedWorkbook`` object or None if path is not a file
+    """
+    key = _file_key(path)
+    if key is None:
+        return None
+    kwargs.setdefault("data_only", True)
+    kwargs.setdefault("read_only", True)
+    options = tuple(sorted(kwargs.items())) if backend != "stdlib" else ()
+    with _lock:
+        entry = _workbooks.get(key)
+        if (
+            entry is not None
+            and entry.workbook is not None
+            and (
+                backend is None or (entry.backend, entry.options) == (backend, options)
+            )
+        ):
+            stats["hits"] += 1
+            _workbooks.move_to_end(key)
+            return entry
+        stats["misses"] += 1
+        new_entry = _CachedWorkbook(
+            _open(path, backend or "openpyxl", dict(options)),
+            backend or "openpyxl",
+            options,
+        )
+        if entry is not None:
+            # templates do not depend on backend, keep them
+            new_entry.templates = entry.templates
+            _close(entry)
+        _workbooks[key] = new_entry
+        _workbooks.move_to_end(key)
+        # remove cached workbooks for previous versions of the same file
+        for stale in [k for k in _workbooks if k[0] == key[0] and k != key]:
+            _close(_workbooks.pop(stale))
+        while len(_workbooks) > MAX_WORKBOOKS:
+            _close(_workbooks.popitem(last=False)[1])
+        return new_entry
+
+
+def open_workbook(path, backend=None, **kwargs):
+    """
+    Function to get workbook object for ``.xlsx`` file, opening it on first call and
+    returning cached workbook on subsequent calls.
+
+    Workbooks that are not file paths, e.g. file-like objects, opened without caching.
+
+    :param path: (str) OS path to ``.xlsx`` file
+    :param backend: (str) ``openpyxl`` or ``stdlib`` to open workbook with, if None
+        workbook opened by any backend returned or workbook opened using ``openpyxl``
+    :param kwargs: (dict) arguments for ``openpyxl`` ``load_workbook`` function,
+        ``data_only`` and ``read_only`` default to True
+    :return: workbook object
+    """
+    entry = _get_entry(path, backend, **kwargs)
+    if entry is None:
+        kwargs.setdefault("data_only", True)
+        kwargs.setdefault("read_only", True)
+        return _open(path, backend or "openpyxl", kwargs)
+    return entry.workbook
+
+
+def get_templates(path):
+    """
+    Function to get templates loaded from workbook templates tabs.
+
+    :param path: (str) OS path to ``.xlsx`` file
+    :return: dictionary of ``{template name: template content}`` or None if
+        templates for this file version not cached
+    """
+    key = _file_key(path)
+    with _lock:
+        entry = _workbooks.get(key)
+        return None if entry is None else entry.templates
+
+
+def set_templates(path, templates):
+    """
+    Function to cache templates loaded from workbook templates tabs.
+
+    :param path: (str) OS path to ``.xlsx`` file
+    :param templates: (dict) dictionary of ``{template name: template content}``
+    """
+    key = _file_key(path)
+    if key is None:
+        return
+    with _lock:
+        entry = _workbooks.get(key)
+        if entry is None:
+            # workbook not opened, e.g. all sheets loaded from snapshots
+            entry = _workbooks[key] = _CachedWorkbook(None, None, None)
+        entry.templates = templates
+
+
+@contextmanager
+def scope():
+    """
+    Context manager to keep opened workbooks open until outermost scope exited,
+    workbooks closed on exit while templates loaded from them kept in cache.
+    """
+    global _scopes  # pylint: disable=global-statement
+    with _lock:
+        _scopes += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _scopes -= 1
+            if _scopes == 0:
+                release()
+
+
+def release():
+    """
+    Function to close all cached workbooks keeping cached templates.
+    """
+    with _lock:
+        for key, entry in list(_workbooks.items()):
+            _close(entry)
+            if entry.templates is None:
+                _workbooks.pop(key)
+            else:
+                entry.workbook = entry.backend = entry.options = None
+
+
+def _reset_after_fork():
+    """
+    Function to drop workbooks inherited by forked child process, as they share
+    open file handles, and file offsets, with parent process.
+    """
+    global _lock, _scopes  # pylint: disable=global-statement
+    _lock = threading.RLock()
+    _scopes = 0
+    _workbooks.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def clear():
+    """
+    Function to close all cached workbooks and empty the cache.
+    """
+    with _lock:
+        while _workbooks:
+            _close(_workbooks.popitem()[1])
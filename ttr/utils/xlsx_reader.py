@@ -0,0 +1,522 @@
+"""
+XLSX Reader
+###########
+
+Module to read values from ``.xlsx`` spreadsheets using Python standard library
+only - workbook zip archive opened directly, shared strings table parsed once and
+each sheet XML streamed using ``xml.etree.ElementTree.iterparse`` yielding rows of
+values.
+
+Workbook XML parts that contain document type declaration rejected before parsing,
+as a result no entities can be declared and expanded by the parser.
+
+Reader mimics the subset of ``openpyxl`` read-only API used by TTR xlsx loaders and
+produces identical values - numbers loaded as ``int`` or ``float``, cells with date
+or time number formats converted to ``datetime`` objects, formula cells loaded
+with their cached values same as for ``data_only=True``.
+
+Sample usage::
+
+    from ttr.utils.xlsx_reader import load_workbook
+
+    with load_workbook("./data/table.xlsx") as wb:
+        for sheet_name in wb.sheetnames:
+            for row in wb[sheet_name].iter_rows(values_only=True):
+                print(row)
+"""
+import datetime
+import io
+import logging
+import posixpath
+import re
+import zipfile
+
+# parts with DTD rejected by _iter_part before parsing, see _check_prolog
+from xml.etree.ElementTree import iterparse  # nosec B405
+
+log = logging.getLogger(__name__)
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+ROW_TAG = MAIN_NS + "row"
+VALUE_TAG = MAIN_NS + "v"
+TEXT_TAG = MAIN_NS + "t"
+RICH_TEXT_TAG = MAIN_NS + "r"
+INLINE_STRING_TAG = MAIN_NS + "is"
+SHARED_STRING_TAG = MAIN_NS + "si"
+SHEET_DATA_TAG = MAIN_NS + "sheetData"
+DIMENSION_TAG = MAIN_NS + "dimension"
+
+WINDOWS_EPOCH = datetime.datetime(1899, 12, 30)
+MAC_EPOCH = datetime.datetime(1904, 1, 1)
+# ISO 8601 formats of date cells values and type to convert them to, same as openpyxl
+ISO_FORMATS = (
+    ("%Y-%m-%dT%H:%M:%S.%f", datetime.datetime),
+    ("%Y-%m-%dT%H:%M:%S", datetime.datetime),
+    ("%Y-%m-%d", datetime.date),
+    ("%H:%M:%S.%f", datetime.time),
+    ("%H:%M:%S", datetime.time),
+)
+
+# builtin number formats that represent dates, times or durations
+BUILTIN_DATE_FORMATS = {
+    14: "mm-dd-yy",
+    15: "d-mmm-yy",
+    16: "d-mmm",
+    17: "mmm-yy",
+    18: "h:mm AM/PM",
+    19: "h:mm:ss AM/PM",
+    20: "h:mm",
+    21: "h:mm:ss",
+    22: "m/d/yy h:mm",
+    45: "mm:ss",
+    46: "[h]:mm:ss",
+    47: "mmss.0",
+}
+STRIP_RE = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+DATE_RE = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+TIMEDELTA_RE = re.compile(
+    r"\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?", re.I
+)
+DIMENSION_RE = re.compile(
+    r"^\$?([A-Za-z]{1,3})\$?(\d+)(?::\$?([A-Za-z]{1,3})\$?(\d+))?$"
+)
+ROOT_START_RE = re.compile(r"<[A-Za-z_]")
+PROLOG_SIZE = 4096  # bytes
+
+
+def _check_prolog(prolog, path):
+    """
+    Function to make sure XML part does not declare document type, that way
+    no entities can be declared in it.
+
+    :param prolog: (bytes) beginning of XML part content
+    :param path: (str) part path for error message
+    """
+    if prolog[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        text = prolog.decode("utf-16", errors="ignore")
+    else:
+        text = prolog.decode("utf-8", errors="ignore")
+    root = ROOT_START_RE.search(text)
+    if "<!DOCTYPE" in text[: root.start() if root else len(text)] or (
+        root is None and len(prolog) == PROLOG_SIZE
+    ):
+        raise ValueError(
+            "ttr:xlsx_reader '{}' part declares document type, not supported".format(
+                path
+            )
+        )
+
+
+def _iter_part(archive, path, events=None):
+    """
+    Generator function to parse workbook XML part.
+
+    :param archive: (obj) ``zipfile.ZipFile`` object
+    :param path: (str) part path within archive
+    :param events: (tuple) ``iterparse`` events to report, default is ``("end",)``
+    :return: yields ``(event, element)`` tuples
+    """
+    with io.BufferedReader(archive.open(path), PROLOG_SIZE) as source:
+        _check_prolog(source.peek(PROLOG_SIZE)[:PROLOG_SIZE], path)
+        # document type declarations rejected above, no entities to expand
+        yield from iterparse(source, events=events)  # nosec B314
+
+
+def _column_index(letters):
+    """
+    Function to convert column letters to column index e.g. ``AB`` to ``28``.
+    """
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + ord(letter) - 64
+    return index
+
+
+def _text_content(element):
+    """
+    Function to extract text from shared or inline string element, concatenating
+    rich text runs and ignoring phonetic runs.
+    """
+    parts = []
+    for child in element:
+        if child.tag == TEXT_TAG:
+            parts.append(child.text or "")
+        elif child.tag == RICH_TEXT_TAG:
+            text = child.find(TEXT_TAG)
+            if text is not None and text.text is not None:
+                parts.append(text.text)
+    return "".join(parts)
+
+
+def _cast_number(value):
+    """
+    Function to convert cell value string to ``int`` or ``float``.
+    """
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+    return int(value)
+
+
+def _from_excel(value, epoch, timedelta=False):
+    """
+    Function to convert Excel serial number to ``datetime``, ``time`` or ``timedelta``.
+    """
+    if timedelta:
+        td = datetime.timedelta(days=value)
+        if td.microseconds:
+            # round to millisecond precision
+            td = datetime.timedelta(
+                seconds=td.total_seconds() // 1,
+                microseconds=round(td.microseconds, -3),
+            )
+        return td
+    day, fraction = divmod(value, 1)
+    diff = datetime.timedelta(milliseconds=round(fraction * 86400 * 1000))
+    if 0 <= value < 1 and diff.days == 0:
+        minutes, seconds = divmod(diff.seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return datetime.time(hours, minutes, seconds, diff.microseconds)
+    if 0 < value < 60 and epoch == WINDOWS_EPOCH:
+        day += 1
+    return epoch + datetime.timedelta(days=day) + diff
+
+
+def _from_iso(value):
+    """
+    Function to convert ISO 8601 date cell value to ``datetime``, ``date`` or ``time``.
+    """
+    value = value.rstrip("Z")
+    for date_format, value_type in ISO_FORMATS:
+        try:
+            parsed = datetime.datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+        if value_type is datetime.date:
+            return parsed.date()
+        if value_type is datetime.time:
+            return parsed.time()
+        return parsed
+    raise ValueError("unsupported ISO 8601 date '{}'".format(value))
+
+
+def _cell_value(cell, context):
+    """
+    Function to extract cell element value.
+
+    :param cell: (obj) cell element
+    :param context: (tuple) ``(shared strings, date styles, timedelta styles, epoch)``
+    :return: cell value
+    """
+    data_type = cell.get("t", "n")
+    if data_type == "inlineStr":
+        child = cell.find(INLINE_STRING_TAG)
+        return None if child is None else _text_content(child)
+    value = cell.findtext(VALUE_TAG) or None
+    if value is None:
+        return None
+    if data_type == "n":
+        _, date_styles, timedelta_styles, epoch = context
+        value = _cast_number(value)
+        style = int(cell.get("s", 0))
+        if style in date_styles:
+            try:
+                value = _from_excel(value, epoch, style in timedelta_styles)
+            except (OverflowError, ValueError):
+                value = "#VALUE!"
+    elif data_type == "s":
+        value = context[0][int(value)]
+    elif data_type == "b":
+        value = bool(int(value))
+    elif data_type == "d":
+        try:
+            value = _from_iso(value)
+        except ValueError:
+            value = "#VALUE!"
+    return value
+
+
+def _parse_row(element, columns, context):
+    """
+    Function to extract values of row element cells.
+
+    :param element: (obj) row element
+    :param columns: (dict) cache of column letters to column index
+    :param context: (tuple) ``(shared strings, date styles, timedelta styles, epoch)``
+    :return: list of ``(column, value)`` tuples
+    """
+    cells = []
+    column = 0
+    for cell in element:
+        reference = cell.get("r")
+        if reference:
+            letters = reference.rstrip("0123456789")
+            try:
+                column = columns[letters]
+            except KeyError:
+                column = columns[letters] = _column_index(letters)
+        else:
+            column += 1
+        cells.append((column, _cell_value(cell, context)))
+    return cells
+
+
+class XlsxWorksheet:
+    """
+    Class to stream values from a single workbook sheet.
+
+    :param workbook: (obj) ``XlsxWorkbook`` object
+    :param title: (str) sheet name
+    :param path: (str) sheet XML part path within workbook archive
+    """
+
+    def __init__(self, workbook, title, path):
+        self.parent = workbook
+        self.title = title
+        self.path = path
+        self._dimensions = False
+
+    @property
+    def dimensions(self):
+        """
+        Sheet ``(min_col, min_row, max_col, max_row)`` boundaries as recorded in
+        sheet XML, or None if sheet XML does not record them.
+        """
+        if self._dimensions is False:
+            self._dimensions = None
+            parser = _iter_part(self.parent.archive, self.path, events=("start",))
+            for _, element in parser:
+                if element.tag == DIMENSION_TAG:
+                    match = DIMENSION_RE.match(element.get("ref", ""))
+                    if match:
+                        min_col, min_row, max_col, max_row = match.groups()
+                        self._dimensions = (
+                            _column_index(min_col),
+                            int(min_row),
+                            _column_index(max_col or min_col),
+                            int(max_row or min_row),
+                        )
+                    break
+                if element.tag == SHEET_DATA_TAG:
+                    break
+            parser.close()
+        return self._dimensions
+
+    @property
+    def max_column(self):
+        """
+        Sheet max column number or None if sheet dimensions unknown.
+        """
+        return self.dimensions[2] if self.dimensions else None
+
+    @property
+    def max_row(self):
+        """
+        Sheet max row number or None if sheet dimensions unknown.
+        """
+        return self.dimensions[3] if self.dimensions else None
+
+    def _parse_rows(self):
+        """
+        Generator to parse sheet XML yielding ``(row number, [(column, value), ...])``
+        tuples for each row element.
+        """
+        workbook = self.parent
+        context = (
+            workbook.shared_strings,
+            workbook.date_styles,
+            workbook.timedelta_styles,
+            workbook.epoch,
+        )
+        columns = {}  # cache of column letters to column index
+        row_counter = 0
+        sheet_data = None
+        parser = _iter_part(workbook.archive, self.path, events=("start", "end"))
+        for event, element in parser:
+            if event == "start":
+                if element.tag == SHEET_DATA_TAG:
+                    sheet_data = element
+                continue
+            if element.tag == SHEET_DATA_TAG:
+                break
+            if element.tag != ROW_TAG:
+                continue
+            row_number = element.get("r")
+            row_counter = int(float(row_number)) if row_number else row_counter + 1
+            cells = _parse_row(element, columns, context)
+            # release parsed rows to keep memory usage flat
+            if sheet_data is not None:
+                sheet_data.clear()
+            else:
+                element.clear()
+            yield row_counter, cells
+        parser.close()
+
+    def iter_rows(
+        self, min_row=1, max_row=None, max_col=None, values_only=True
+    ):  # pylint: disable=unused-argument
+        """
+        Generator to iterate over sheet rows, rows padded with ``None`` up to
+        ``max_col`` or sheet max column and missing rows filled with rows of ``None``
+        same as ``openpyxl`` read-only worksheet does.
+
+        :param min_row: (int) number of the first row to return
+        :param max_row: (int) number of the last row to return, defaults to sheet
+            max row
+        :param max_col: (int) number of columns to return, defaults to sheet max column
+        :param values_only: (bool) ignored, only values supported
+        :return: yields tuples of rows values
+        """
+        max_col = max_col or self.max_column
+        max_row = max_row or self.max_row
+        empty_row = (None,) * max_col if max_col else ()
+        counter = min_row
+        index = 1
+        for index, cells in self._parse_rows():
+            if max_row is not None and index > max_row:
+                break
+            # some rows are missing
+            while counter < index:
+                counter += 1
+                yield empty_row
+            if counter <= index:
+                counter += 1
+                if not cells and not max_col:
+                    yield ()
+                    continue
+                width = max_col or cells[-1][0]
+                row = [None] * width
+                for column, value in cells:
+                    if column <= width:
+                        row[column - 1] = value
+                yield tuple(row)
+        if max_row is not None and max_row < index:
+            for _ in range(counter, max_row + 1):
+                yield empty_row
+
+
+class XlsxWorkbook:
+    """
+    Class to read workbook structure - sheets, shared strings and date styles.
+
+    :param filename: (str) OS path to ``.xlsx`` file or file-like object
+    """
+
+    def __init__(self, filename):
+        # archive kept open while reading sheets, closed by close method
+        self.archive = zipfile.ZipFile(filename)  # pylint: disable=consider-using-with
+        self._shared_strings = None
+        self._styles = None
+        self.epoch = WINDOWS_EPOCH
+        self._parts = {}  # relationship type -> part path
+
+        # resolve workbook relationships
+        relationships = {}
+        for _, element in _iter_part(self.archive, "xl/_rels/workbook.xml.rels"):
+            if element.tag == PKG_REL_NS + "Relationship":
+                target = element.get("Target", "")
+                if target.startswith("/"):
+                    target = target[1:]
+                else:
+                    target = posixpath.normpath(posixpath.join("xl", target))
+                relationships[element.get("Id")] = target
+                self._parts.setdefault(
+                    element.get("Type", "").rsplit("/", 1)[-1], target
+                )
+
+        # load sheets names
+        self._sheets = {}
+        for _, element in _iter_part(self.archive, "xl/workbook.xml"):
+            if element.tag == MAIN_NS + "workbookPr":
+                if element.get("date1904") in ("1", "true"):
+                    self.epoch = MAC_EPOCH
+            elif element.tag == MAIN_NS + "sheet":
+                path = relationships.get(element.get(REL_NS + "id"))
+                if path and path in self.archive.NameToInfo:
+                    self._sheets[element.get("name")] = path
+        self.sheetnames = list(self._sheets)
+
+    def __getitem__(self, name):
+        return XlsxWorksheet(self, name, self._sheets[name])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def close(self):
+        """
+        Method to close workbook archive.
+        """
+        self.archive.close()
+
+    @property
+    def shared_strings(self):
+        """
+        List of shared strings, parsed once on first access.
+        """
+        if self._shared_strings is None:
+            self._shared_strings = []
+            path = self._parts.get("sharedStrings")
+            if path in self.archive.NameToInfo:
+                for _, element in _iter_part(self.archive, path):
+                    if element.tag == SHARED_STRING_TAG:
+                        self._shared_strings.append(
+                            _text_content(element).replace("x005F_", "")
+                        )
+                        element.clear()
+        return self._shared_strings
+
+    def _load_styles(self):
+        """
+        Method to find indexes of cell styles that use date or duration number formats.
+        """
+        date_styles, timedelta_styles = set(), set()
+        path = self._parts.get("styles")
+        if path in self.archive.NameToInfo:
+            formats = dict(BUILTIN_DATE_FORMATS)
+            for _, element in _iter_part(self.archive, path):
+                if element.tag == MAIN_NS + "numFmt":
+                    formats[int(element.get("numFmtId"))] = element.get("formatCode")
+                elif element.tag == MAIN_NS + "cellXfs":
+                    for index, xf in enumerate(element):
+                        fmt = formats.get(int(xf.get("numFmtId", 0)))
+                        if fmt is None:
+                            continue
+                        fmt = fmt.split(";")[0]
+                        if DATE_RE.search(STRIP_RE.sub("", fmt)):
+                            date_styles.add(index)
+                        if TIMEDELTA_RE.search(fmt):
+                            timedelta_styles.add(index)
+        self._styles = (date_styles, timedelta_styles)
+
+    @property
+    def date_styles(self):
+        """
+        Set of indexes of cell styles that use date or time number formats.
+        """
+        if self._styles is None:
+            self._load_styles()
+        return self._styles[0]
+
+    @property
+    def timedelta_styles(self):
+        """
+        Set of indexes of cell styles that use duration number formats.
+        """
+        if self._styles is None:
+            self._load_styles()
+        return self._styles[1]
+
+
+def load_workbook(filename):
+    """
+    Function to open ``.xlsx`` workbook for reading.
+
+    :param filename: (str) OS path to ``.xlsx`` file or file-like object
+    :return: ``XlsxWorkbook`` object
+    """
+    return XlsxWorkbook(filename)
@@ -0,0 +1,135 @@
+"""
+XLSX Snapshot Cache
+###################
+
+Module to cache parsed ``.xlsx`` sheets in SQLite database, such that on subsequent
+runs only sheets that changed parsed again, while the rest of the sheets loaded from
+their snapshots.
+
+Each sheet snapshot keyed by a hash of the sheet's XML part inside ``.xlsx`` zip
+archive together with the workbook level content the sheet depends on - values of
+shared strings the sheet references and date number formats, as a result editing
+one sheet only invalidates that sheet's snapshot. Key also includes loader settings
+snapshot content depends on - templates column prefix, parsing backend and its
+arguments.
+
+Snapshots are serialized using ``pickle`` module.
+
+.. warning:: snapshots deserialized using ``pickle`` module, as a result snapshot
+    cache database file is a trust boundary - anyone who can modify it can run
+    arbitrary code as the user running TTR. Cache database files must only be
+    writable by that user, e.g. kept in user's own cache directory, never shared
+    between users or obtained from elsewhere.
+"""
+import hashlib
+import logging
+import os
+# snapshots unpickled, see trust boundary warning in module docstring
+import pickle  # nosec B403
+import re
+
+from .sqlite_cache import SQLiteCache
+from .xlsx_reader import XlsxWorkbook
+
+log = logging.getLogger(__name__)
+
+# increment to invalidate snapshots produced by previous versions of loaders
+SNAPSHOT_VERSION = "1"
+
+SHARED_STRING_CELL_RE = re.compile(
+    rb'<(?:\w+:)?c\b[^>]*?\bt="s"[^>]*>\s*<(?:\w+:)?v>(\d+)</(?:\w+:)?v>'
+)
+
+
+def hash_sheets(path, salt=""):
+    """
+    Function to compute snapshot keys for each sheet of ``.xlsx`` workbook.
+
+    :param path: (str) OS path to ``.xlsx`` file
+    :param salt: (str) additional string to include in hash e.g. loader settings
+    :return: dictionary of ``{sheet name: key}`` in workbook sheets order
+    """
+    ret = {}
+    with XlsxWorkbook(path) as workbook:
+        context = "{}:{}:{}:{}:{}".format(
+            SNAPSHOT_VERSION,
+            salt,
+            workbook.epoch.isoformat(),
+            sorted(workbook.date_styles),
+            sorted(workbook.timedelta_styles),
+        )
+        shared_strings = None
+        for sheet_name in workbook.sheetnames:
+            part = workbook.archive.read(workbook[sheet_name].path)
+            digest = hashlib.sha256(context.encode("utf-8"))
+            digest.update(hashlib.sha256(part).digest())
+            # include values of shared strings referenced by this sheet
+            indexes = sorted({int(i) for i in SHARED_STRING_CELL_RE.findall(part)})
+            if indexes:
+                if shared_strings is None:
+                    shared_strings = workbook.shared_strings
+                for index in indexes:
+                    value = shared_strings[index] if index < len(shared_strings) else ""
+                    digest.update(b"\x00" + value.encode("utf-8"))
+            ret[sheet_name] = digest.hexdigest()
+    return ret
+
+
+class SnapshotCache(SQLiteCache):
+    """
+    Class to store and retrieve sheets snapshots in SQLite database.
+
+    :param path: (str) OS path to SQLite database file
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS sheets "
+        "(workbook TEXT NOT NULL, sheet TEXT NOT NULL, key TEXT NOT NULL, "
+        "snapshot BLOB NOT NULL, PRIMARY KEY (workbook, sheet))",
+    )
+
+    def get(self, workbook, sheet, key):
+        """
+        Method to retrieve sheet snapshot.
+
+        :param workbook: (str) OS path to workbook file
+        :param sheet: (str) sheet name
+        :param key: (str) sheet hash
+        :return: snapshot object or None if no snapshot with matching key
+        """
+        row = self.connection.execute(
+            "SELECT snapshot FROM sheets WHERE workbook = ? AND sheet = ? AND key = ?",
+            (os.path.abspath(workbook), sheet, key),
+        ).fetchone()
+        if row is None:
+            return None
+        try:
+            # cache database written by TTR itself, refer to module docstring
+            return pickle.loads(row[0])  # nosec B301
+        except Exception as e:
+            log.warning(
+                "ttr:xlsx_snapshot_cache failed to deserialize '{}' sheet snapshot, error: {}".format(
+                    sheet, e
+                )
+            )
+            return None
+
+    def update(self, workbook, sheet, key, snapshot):
+        """
+        Method to save sheet snapshot.
+
+        :param workbook: (str) OS path to workbook file
+        :param sheet: (str) sheet name
+        :param key: (str) sheet hash
+        :param snapshot: (obj) snapshot object to serialize
+        """
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sheets (workbook, sheet, key, snapshot) VALUES (?, ?, ?, ?)",
+                (
+                    os.path.abspath(workbook),
+                    sheet,
+                    key,
+                    pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL),
+                ),
+            )